@@ -1,13 +1,14 @@
 import logging
 from http.client import NOT_FOUND
-from typing import Annotated
+from typing import Annotated, Optional
 
 from fastapi import APIRouter, Depends, Header, HTTPException, Request
 
-from app.clients.db.session import get_db
+from app.clients.db.session import get_read_db
 from app.models.document import CollectionOverviewResponse
-from app.repository.collection import get_collection, get_id_from_slug
+from app.repository.collection import get_collection
 from app.service.custom_app import AppTokenFactory
+from app.service.slug_index import SlugIndex, get_slug_index, resolve_collection_slug
 
 _LOGGER = logging.getLogger(__file__)
 
@@ -21,7 +22,8 @@ def collection_detail(
     slug: str,
     request: Request,
     app_token: Annotated[str, Header()],
-    db=Depends(get_db),
+    db=Depends(get_read_db),
+    slug_index: Optional[SlugIndex] = Depends(get_slug_index),
 ):
     """Get details of the collection associated with the import id."""
     _LOGGER.info(
@@ -35,7 +37,9 @@ def collection_detail(
     token = AppTokenFactory()
     token.decode_and_validate(db, request, app_token)
 
-    collection_import_id = get_id_from_slug(db, slug, token.allowed_corpora_ids)
+    collection_import_id = resolve_collection_slug(
+        db, slug, token.allowed_corpora_ids, slug_index
+    )
     if collection_import_id is None:
         raise HTTPException(status_code=NOT_FOUND, detail=f"Nothing found for {slug}")
 
@@ -1,11 +1,13 @@
 import logging
 from http.client import NOT_FOUND
-from typing import Annotated, Union
+from typing import Annotated, Optional, Union
 
 from cpr_sdk.search_adaptors import VespaSearchAdapter
-from fastapi import APIRouter, Depends, Header, HTTPException, Request
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
 
-from app.clients.db.session import get_db
+from app.clients.db.session import get_async_read_db, get_read_db
 from app.models.document import (
     FamilyAndDocumentsResponse,
     FamilyDocumentWithContextResponse,
@@ -14,10 +16,16 @@ from app.models.search import FamilySearchResponse
 from app.repository.document import (
     get_family_and_documents,
     get_family_document_and_context,
-    get_slugged_objects,
 )
+from app.service.conditional_get import check_data_not_modified
 from app.service.custom_app import AppTokenFactory
+from app.service.data_version import DataVersionTracker, get_data_version_tracker
 from app.service.search import get_document_from_vespa, get_family_from_vespa
+from app.service.slug_index import (
+    SlugIndex,
+    get_slug_index,
+    resolve_family_or_document_slug,
+)
 from app.service.vespa import get_vespa_search_adapter
 from app.telemetry_exceptions import ExceptionHandlingTelemetryRoute
 
@@ -33,8 +41,16 @@ documents_router = APIRouter(route_class=ExceptionHandlingTelemetryRoute)
         FamilyDocumentWithContextResponse,
     ],
 )
-def family_or_document_detail(
-    slug: str, request: Request, app_token: Annotated[str, Header()], db=Depends(get_db)
+async def family_or_document_detail(  # noqa: PLR0913
+    slug: str,
+    request: Request,
+    response: Response,
+    app_token: Annotated[str, Header()],
+    db: AsyncSession = Depends(get_async_read_db),
+    data_version_tracker: Optional[DataVersionTracker] = Depends(
+        get_data_version_tracker
+    ),
+    slug_index: Optional[SlugIndex] = Depends(get_slug_index),
 ):
     """Get details of the family or document associated with the slug."""
     _LOGGER.info(
@@ -46,10 +62,23 @@ def family_or_document_detail(
 
     # Decode the app token and validate it.
     token = AppTokenFactory()
-    token.decode_and_validate(db, request, app_token)
+    await db.run_sync(token.decode_and_validate, request, app_token)
+
+    # The data version is loaded with a sync session the first time, so it is
+    # checked off the event loop
+    not_modified = await run_in_threadpool(
+        check_data_not_modified,
+        request,
+        response,
+        data_version_tracker,
+        token.allowed_corpora_ids,
+        db,
+    )
+    if not_modified is not None:
+        return not_modified
 
-    family_document_import_id, family_import_id = get_slugged_objects(
-        db, slug, token.allowed_corpora_ids
+    family_document_import_id, family_import_id = await db.run_sync(
+        resolve_family_or_document_slug, slug, token.allowed_corpora_ids, slug_index
     )
     if family_document_import_id is None and family_import_id is None:
         raise HTTPException(status_code=NOT_FOUND, detail=f"Nothing found for {slug}")
@@ -57,9 +86,11 @@ def family_or_document_detail(
     try:
         # Family import id takes precedence, at at least one is not None
         if family_import_id:
-            return get_family_and_documents(db, family_import_id)
+            return await db.run_sync(get_family_and_documents, family_import_id)
         elif family_document_import_id:
-            return get_family_document_and_context(db, family_document_import_id)
+            return await db.run_sync(
+                get_family_document_and_context, family_document_import_id
+            )
     except ValueError as err:
         raise HTTPException(status_code=NOT_FOUND, detail=str(err))
 
@@ -71,7 +102,7 @@ def family_detail_from_vespa(  # noqa: PLR0913
     app_token: Annotated[str, Header()],
     limit: int | None = None,
     max_hits_per_family: int | None = None,
-    db=Depends(get_db),
+    db=Depends(get_read_db),
     vespa_search_adapter: VespaSearchAdapter = Depends(get_vespa_search_adapter),
 ):
     """Get details of the family associated with a slug from vespa.
@@ -86,7 +117,7 @@ def family_detail_from_vespa(  # noqa: PLR0913
     :param Request request: Request object.
     :param Annotated[str, Header()] app_token: App token containing
         allowed corpora.
-    :param Depends[get_db] db: Database session to query against.
+    :param Depends[get_read_db] db: Database session to query against.
     :return FamilySearchResponse: An object representing the family in
         Vespa - including concepts.
     """
@@ -126,7 +157,7 @@ def doc_detail_from_vespa(
     import_id: str,
     request: Request,
     app_token: Annotated[str, Header()],
-    db=Depends(get_db),
+    db=Depends(get_read_db),
     vespa_search_adapter: VespaSearchAdapter = Depends(get_vespa_search_adapter),
 ):
     """Get details of the document associated with a slug from vespa.
@@ -141,7 +172,7 @@ def doc_detail_from_vespa(
     :param Request request: Request object.
     :param Annotated[str, Header()] app_token: App token containing
         allowed corpora.
-    :param Depends[get_db] db: Database session to query against.
+    :param Depends[get_read_db] db: Database session to query against.
     :return FamilySearchResponse: An object representing the document in
         Vespa - including concepts.
     """
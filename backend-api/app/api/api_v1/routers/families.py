@@ -1,18 +1,21 @@
 import logging
-from typing import Annotated
+from typing import Annotated, Optional
 
 from db_client.models.dfce.family import Corpus, Family, FamilyCorpus
-from fastapi import APIRouter, Depends, Header, HTTPException, Request
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, Response
 from sqlalchemy.orm import lazyload
 
-from app.clients.db.session import get_db
+from app.clients.db.session import get_read_db
 from app.models.search import LatestFamilyResponse
 from app.repository.family import (
     _convert_to_dto,
     count_families_per_category_per_corpus,
     count_families_per_category_per_corpus_latest_ingest_cycle,
 )
+from app.service.conditional_get import check_data_not_modified
 from app.service.custom_app import AppTokenFactory
+from app.service.data_version import DataVersionTracker, get_data_version_tracker
+from app.service.s3_metadata import S3MetadataCache, get_s3_metadata_cache
 from app.telemetry_exceptions import ExceptionHandlingTelemetryRoute
 
 _LOGGER = logging.getLogger(__file__)
@@ -22,12 +25,24 @@ families_router = APIRouter(route_class=ExceptionHandlingTelemetryRoute)
 
 @families_router.get("/homepage-counts", response_model=dict[str, int])
 def get_homepage_counts(
-    request: Request, app_token: Annotated[str, Header()], db=Depends(get_db)
+    request: Request,
+    response: Response,
+    app_token: Annotated[str, Header()],
+    db=Depends(get_read_db),
+    data_version_tracker: Optional[DataVersionTracker] = Depends(
+        get_data_version_tracker
+    ),
 ):
     """Get the count of families by category per corpus for the homepage."""
     token = AppTokenFactory()
     token.decode_and_validate(db, request, app_token)
 
+    not_modified = check_data_not_modified(
+        request, response, data_version_tracker, token.allowed_corpora_ids, db
+    )
+    if not_modified is not None:
+        return not_modified
+
     return _convert_to_dto(
         count_families_per_category_per_corpus(db, token.allowed_corpora_ids)
     )
@@ -37,7 +52,10 @@ def get_homepage_counts(
     "/homepage-counts-latest-ingest-cycle", response_model=dict[str, int]
 )
 def get_homepage_counts_latest_ingest_cycle(
-    request: Request, app_token: Annotated[str, Header()], db=Depends(get_db)
+    request: Request,
+    app_token: Annotated[str, Header()],
+    db=Depends(get_read_db),
+    s3_metadata_cache: Optional[S3MetadataCache] = Depends(get_s3_metadata_cache),
 ):
     """Get the count of families by category per corpus for the homepage."""
     token = AppTokenFactory()
@@ -45,7 +63,13 @@ def get_homepage_counts_latest_ingest_cycle(
 
     return _convert_to_dto(
         count_families_per_category_per_corpus_latest_ingest_cycle(
-            db, token.allowed_corpora_ids
+            db,
+            token.allowed_corpora_ids,
+            (
+                s3_metadata_cache.latest_ingest_start()
+                if s3_metadata_cache is not None
+                else None
+            ),
         )
     )
 
@@ -58,7 +82,7 @@ def latest(
     request: Request,
     app_token: Annotated[str, Header()],
     limit: int = 5,
-    db=Depends(get_db),
+    db=Depends(get_read_db),
 ) -> list[LatestFamilyResponse]:
     """Retrieve the five most recently added families.
 
@@ -68,7 +92,7 @@ def latest(
     :param Request request: The incoming request object.
     :param Annotated[str, Header()] app_token: App token containing
         the allowed corpora access.
-    :param Depends[get_db] db: Database session dependency.
+    :param Depends[get_read_db] db: Database session dependency.
     :return list[LatestFamilyResponse]: A list of the five most recently added
         families.
     """
@@ -1,20 +1,43 @@
-from typing import Annotated
+from typing import Annotated, Optional
 
-from fastapi import Depends, Header, Request
+from fastapi import Depends, Header, Request, Response, status
 
 from app.api.api_v1.routers.lookups.router import lookups_router
-from app.clients.db.session import get_db
+from app.clients.db.session import get_read_db
 from app.models.config import ApplicationConfig
-from app.repository.lookups import get_config
+from app.service.conditional_get import check_not_modified
+from app.service.config_cache import (
+    ConfigCache,
+    get_config_cache,
+    get_config_snapshot,
+)
 from app.service.custom_app import AppTokenFactory
+from app.service.json_response import serialised_json_response
 
 
-@lookups_router.get("/config", response_model=ApplicationConfig)
+@lookups_router.get(
+    "/config",
+    response_model=ApplicationConfig,
+    responses={status.HTTP_304_NOT_MODIFIED: {"description": "Not Modified"}},
+)
 def lookup_config(
-    request: Request, app_token: Annotated[str, Header()], db=Depends(get_db)
+    request: Request,
+    response: Response,
+    app_token: Annotated[str, Header()],
+    db=Depends(get_read_db),
+    config_cache: Optional[ConfigCache] = Depends(get_config_cache),
 ):
-    """Get the config for the metadata."""
+    """Get the config for the metadata.
+
+    Responds with 304 Not Modified if the client's copy of the config is
+    current. The config is served as serialised when it was loaded.
+    """
     token = AppTokenFactory()
     token.decode_and_validate(db, request, app_token)
 
-    return get_config(db, token.allowed_corpora_ids)
+    snapshot = get_config_snapshot(db, token.allowed_corpora_ids, config_cache)
+    not_modified = check_not_modified(request, response, snapshot.etag)
+    if not_modified is not None:
+        return not_modified
+
+    return serialised_json_response(snapshot.content, response)
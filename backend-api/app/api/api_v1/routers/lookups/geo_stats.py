@@ -8,7 +8,7 @@ from pydantic import BaseModel
 from sqlalchemy import exc, or_
 
 from app.api.api_v1.routers.lookups.router import lookups_router
-from app.clients.db.session import get_db
+from app.clients.db.session import get_read_db
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -41,7 +41,7 @@ lookup_geo_stats_responses: Dict[Union[int, str], Dict[str, Any]] = {
 )
 def lookup_geo_stats(
     geography_key: str,
-    db=Depends(get_db),
+    db=Depends(get_read_db),
 ):
     """
     Get climate statistics for a geography by id.
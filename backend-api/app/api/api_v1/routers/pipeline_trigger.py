@@ -1,4 +1,6 @@
 import logging
+from datetime import datetime
+from typing import Optional
 
 from fastapi import APIRouter, BackgroundTasks, Depends, Request, status
 from sqlalchemy.orm import Session
@@ -7,11 +9,7 @@ from app.clients.aws.client import S3Client, get_s3_client
 from app.clients.db.session import get_db
 from app.models.document import BulkIngestResult
 from app.service.auth import get_superuser_details
-from app.service.pipeline import (
-    get_db_state_content,
-    get_new_s3_prefix,
-    write_documents_to_s3,
-)
+from app.service.pipeline import get_new_s3_prefix, stream_db_state_to_s3
 from app.telemetry_exceptions import ExceptionHandlingTelemetryRoute
 
 _LOGGER = logging.getLogger(__name__)
@@ -23,14 +21,15 @@ def _start_ingest(
     db: Session,
     s3_client: S3Client,
     s3_prefix: str,
+    changed_since: Optional[datetime] = None,
 ):
     """Writes a db state file to s3 which will trigger an ingest."""
     try:
-        pipeline_ingest_input_content = get_db_state_content(db)
-        write_documents_to_s3(
+        stream_db_state_to_s3(
+            db=db,
             s3_client=s3_client,
             s3_prefix=s3_prefix,
-            content=pipeline_ingest_input_content,
+            changed_since=changed_since,
         )
     except Exception as e:
         _LOGGER.exception(
@@ -44,12 +43,13 @@ def _start_ingest(
     response_model=BulkIngestResult,
     status_code=status.HTTP_202_ACCEPTED,
 )
-def ingest_law_policy(
+def ingest_law_policy(  # noqa: PLR0913
     request: Request,
     background_tasks: BackgroundTasks,
     db=Depends(get_db),
     current_user=Depends(get_superuser_details),
     s3_client=Depends(get_s3_client),
+    changed_since: Optional[datetime] = None,
 ):
     """
     Ingest the provided CSV into the document / family / collection schema.
@@ -62,6 +62,11 @@ def ingest_law_policy(
         Defaults to Depends(get_current_active_superuser).
     :param [S3Client] s3_client: S3 connection.
         Defaults to Depends(get_s3_client).
+    :param [Optional[datetime]] changed_since: Ingest watermark. If given, only
+        the documents changed since then, and the IDs of those no longer
+        exported since the last export, are written for an incremental
+        ingest. A full export is written instead if data without edit times
+        has changed since the last export.
     :return [str]: A path to an s3 object containing document updates to be processed
         by the ingest pipeline.
     :raises HTTPException: The following HTTPExceptions are
@@ -79,6 +84,7 @@ def ingest_law_policy(
         db,
         s3_client,
         s3_prefix,
+        changed_since,
     )
 
     _LOGGER.info(
@@ -86,6 +92,7 @@ def ingest_law_policy(
         extra={
             "props": {
                 "superuser_email": current_user.email,
+                "changed_since": str(changed_since),
             }
         },
     )
@@ -21,18 +21,30 @@ https://fastapi.tiangolo.com/async/
 """
 
 import logging
-from typing import Annotated, Sequence, cast
+from typing import Annotated, Optional, Sequence, cast
 
 from cpr_sdk.search_adaptors import VespaSearchAdapter
-from fastapi import APIRouter, Body, Depends, Header, HTTPException, Request, status
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    status,
+)
 from fastapi.responses import StreamingResponse
-from starlette.responses import RedirectResponse
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import RedirectResponse, Response
 
 from app.clients.aws.client import get_s3_client
 from app.clients.aws.s3_document import S3Document
-from app.clients.db.session import get_db
+from app.clients.db.session import get_read_db
 from app.config import (
     AWS_REGION,
+    DATA_DUMP_RETRY_AFTER_SECONDS,
+    DATA_DUMP_WAIT_SECONDS,
     DOCUMENT_CACHE_BUCKET,
     INGEST_TRIGGER_ROOT,
     PIPELINE_BUCKET,
@@ -41,11 +53,29 @@ from app.config import (
 from app.errors import ValidationError
 from app.models.search import SearchRequestBody, SearchResponse
 from app.service.custom_app import AppTokenFactory
-from app.service.download import (
-    create_data_download_zip_archive,
-    stream_result_into_csv,
+from app.service.data_dump import (
+    DataDumpBuilder,
+    DataDumpFormat,
+    DataDumpSpec,
+    build_data_dump,
+    get_data_dump_builder,
+)
+from app.service.download import stream_result_into_csv
+from app.service.geography_index import GeographyIndex, get_geography_index
+from app.service.s3_metadata import S3MetadataCache, get_s3_metadata_cache
+from app.service.search import (
+    get_s3_doc_url_from_cdn,
+    make_search_request,
+    make_search_request_async,
+)
+from app.service.search_cache import SearchResponseCache, get_search_response_cache
+from app.service.search_metrics import (
+    SearchMetrics,
+    SearchStage,
+    SearchStageTimings,
+    get_search_metrics,
+    search_stage,
 )
-from app.service.search import get_s3_doc_url_from_cdn, make_search_request
 from app.service.vespa import get_vespa_search_adapter
 from app.telemetry import convert_to_loggable_string
 from app.telemetry_exceptions import ExceptionHandlingTelemetryRoute
@@ -56,8 +86,8 @@ _LOGGER = logging.getLogger(__name__)
 search_router = APIRouter(route_class=ExceptionHandlingTelemetryRoute)
 
 
-@search_router.post("/searches")
-def search_documents(
+@search_router.post("/searches", response_model=SearchResponse)
+async def search_documents(  # noqa: PLR0913
     request: Request,
     search_body: Annotated[
         SearchRequestBody,
@@ -96,9 +126,14 @@ def search_documents(
         ),
     ],
     app_token: Annotated[str, Header()],
-    db=Depends(get_db),
+    db=Depends(get_read_db),
     vespa_search_adapter: VespaSearchAdapter = Depends(get_vespa_search_adapter),
-) -> SearchResponse:
+    search_response_cache: Optional[SearchResponseCache] = Depends(
+        get_search_response_cache
+    ),
+    geography_index: Optional[GeographyIndex] = Depends(get_geography_index),
+    search_metrics: Optional[SearchMetrics] = Depends(get_search_metrics),
+) -> Response:
     """
     Search for documents matching the search criteria and filters.
 
@@ -115,9 +150,12 @@ def search_documents(
     The request and response object is otherwise identical for both.
 
     The results can be paginated via a combination of limit, offset and continuation
-    tokens. The limit/offset slices the results after they have been retrieved from
-    the search database. The continuation token can be used to get the next set of
-    results from the search database. See the request schema for more details.
+    tokens. Without continuation tokens, only the families up to the end of the
+    requested page (offset + page_size, capped at limit) are retrieved from the
+    search database, and the offset is then sliced from those. The continuation
+    token can be used to get the next set of results from the search database,
+    continuing from the end of the requested page. See the request schema for more
+    details.
     """
     _LOGGER.info(
         "Search request",
@@ -133,8 +171,9 @@ def search_documents(
     #
     # First corpora validation is app token against DB. At least one of the app token
     # corpora IDs must be present in the DB to continue the search request.
+    # This hits the DB, so it runs on the threadpool to keep the event loop free.
     token = AppTokenFactory()
-    token.decode_and_validate(db, request, app_token)
+    await run_in_threadpool(token.decode_and_validate, db, request, app_token)
 
     # If the search request IDs are null, we want to search using the app token corpora.
     if search_body.corpus_import_ids == [] or search_body.corpus_import_ids is None:
@@ -155,11 +194,24 @@ def search_documents(
             }
         },
     )
-    return make_search_request(
-        db=db,
-        search_body=search_body,
-        vespa_search_adapter=vespa_search_adapter,
-    )
+    # The response is serialised here rather than by FastAPI so that the time
+    # spent on it is recorded with the other search stages.
+    timings = SearchStageTimings()
+    with timings.activate():
+        search_response = await make_search_request_async(
+            db=db,
+            search_body=search_body,
+            vespa_search_adapter=vespa_search_adapter,
+            cache=search_response_cache,
+            allowed_corpora_ids=token.allowed_corpora_ids,
+            geography_index=geography_index,
+        )
+        with search_stage(SearchStage.serialisation):
+            content = search_response.model_dump_json()
+
+    if search_metrics is not None:
+        search_metrics.record(timings, search_body, search_response)
+    return Response(content=content, media_type="application/json")
 
 
 @search_router.post("/searches/download-csv", include_in_schema=False)
@@ -167,8 +219,12 @@ def download_search_documents(
     request: Request,
     search_body: SearchRequestBody,
     app_token: Annotated[str, Header()],
-    db=Depends(get_db),
+    db=Depends(get_read_db),
     vespa_search_adapter: VespaSearchAdapter = Depends(get_vespa_search_adapter),
+    search_response_cache: Optional[SearchResponseCache] = Depends(
+        get_search_response_cache
+    ),
+    geography_index: Optional[GeographyIndex] = Depends(get_geography_index),
 ) -> StreamingResponse:
     """Download a CSV containing details of documents matching the search criteria."""
     token = AppTokenFactory()
@@ -216,6 +272,9 @@ def download_search_documents(
             db=db,
             search_body=search_body,
             vespa_search_adapter=vespa_search_adapter,
+            cache=search_response_cache,
+            allowed_corpora_ids=token.allowed_corpora_ids,
+            geography_index=geography_index,
         )
     except ValidationError as e:
         raise HTTPException(
@@ -236,10 +295,24 @@ def download_search_documents(
 
 
 @search_router.get("/searches/download-all-data", include_in_schema=False)
-def download_all_search_documents(
-    request: Request, app_token: Annotated[str, Header()], db=Depends(get_db)
-) -> RedirectResponse:
-    """Download a CSV containing details of all the documents in the corpus."""
+def download_all_search_documents(  # noqa: PLR0913
+    request: Request,
+    app_token: Annotated[str, Header()],
+    db=Depends(get_read_db),
+    data_dump_builder: Optional[DataDumpBuilder] = Depends(get_data_dump_builder),
+    s3_metadata_cache: Optional[S3MetadataCache] = Depends(get_s3_metadata_cache),
+    file_format: Annotated[DataDumpFormat, Query(alias="format")] = "zip",
+) -> Response:
+    """Download a CSV containing details of all the documents in the corpus.
+
+    The default zip archive contains the CSV (XLSX for CCC) and a README. Pass
+    `format=parquet` for the same data as a single Parquet file.
+
+    If the dump takes longer than DATA_DUMP_WAIT_SECONDS to build, this
+    answers 202 Accepted with an empty body and a Retry-After header instead
+    of the redirect, and the caller should retry the request after that many
+    seconds.
+    """
     _LOGGER.info(
         "Whole data download request",
         extra={
@@ -270,82 +343,64 @@ def download_all_search_documents(
         )
 
     s3_client = get_s3_client()
-    latest_ingest_start = s3_client.get_latest_ingest_start(
-        PIPELINE_BUCKET, INGEST_TRIGGER_ROOT
-    )
-
-    s3_prefix = "navigator/dumps"
-    data_dump_s3_key = (
-        f"{s3_prefix}/{token.sub}-whole_data_dump-{latest_ingest_start}.zip"
-    )
-
-    valid_credentials = s3_client.is_connected()
+    if s3_metadata_cache is not None:
+        latest_ingest_start = s3_metadata_cache.latest_ingest_start()
+        valid_credentials = s3_metadata_cache.is_connected()
+    else:
+        latest_ingest_start = s3_client.get_latest_ingest_start(
+            PIPELINE_BUCKET, INGEST_TRIGGER_ROOT
+        )
+        valid_credentials = s3_client.is_connected()
     if not valid_credentials:
         _LOGGER.info("Error connecting to S3 AWS")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Error connecting to AWS"
         )
 
-    s3_document = S3Document(DOCUMENT_CACHE_BUCKET, AWS_REGION, data_dump_s3_key)
-    if valid_credentials is True and (not s3_client.document_exists(s3_document)):
-        aws_env = (
-            "production"
-            if all(x not in PUBLIC_APP_URL.lower() for x in ["staging", "localhost"])
-            else "staging"
-        )
-        _LOGGER.info(
-            f"Generating {token.sub} {aws_env} dump for ingest cycle w/c {latest_ingest_start}..."
-        )
-
-        # After writing to a file buffer the position stays at the end whereas when you
-        # upload a buffer, it starts from the position it is currently in. We need to
-        # add the seek(0) to reset the buffer position to the beginning before writing
-        # to S3 to avoid creating an empty file.
-        # Handle case where PUBLIC_APP_URL and token audience might already include
-        # protocol
-        is_localhost = "localhost" in PUBLIC_APP_URL.lower()
-        scheme = "http" if is_localhost else "https"
-        if is_localhost or token.aud is None:
-            if PUBLIC_APP_URL.lower().startswith(("http://", "https://")):
-                url_base = PUBLIC_APP_URL.lower()
-            else:
-                url_base = f"{scheme}://{PUBLIC_APP_URL.lower()}"
-
+    # Handle case where PUBLIC_APP_URL and token audience might already include
+    # protocol
+    is_localhost = "localhost" in PUBLIC_APP_URL.lower()
+    scheme = "http" if is_localhost else "https"
+    if is_localhost or token.aud is None:
+        if PUBLIC_APP_URL.lower().startswith(("http://", "https://")):
+            url_base = PUBLIC_APP_URL.lower()
         else:
-            url_base = (
-                f"{scheme}://{token.aud.lower()}"
-                if not token.aud.lower().startswith(("http://", "https://"))
-                else token.aud.lower()
-            )
+            url_base = f"{scheme}://{PUBLIC_APP_URL.lower()}"
 
-        zip_buffer = create_data_download_zip_archive(
-            latest_ingest_start,
-            token.allowed_corpora_ids,
-            db,
-            token.sub.lower() if token.sub else None,
-            url_base,
+    else:
+        url_base = (
+            f"{scheme}://{token.aud.lower()}"
+            if not token.aud.lower().startswith(("http://", "https://"))
+            else token.aud.lower()
         )
-        zip_buffer.seek(0)
-
-        try:
-            response = s3_client.upload_fileobj(
-                bucket=DOCUMENT_CACHE_BUCKET,
-                key=data_dump_s3_key,
-                content_type="application/zip",
-                fileobj=zip_buffer,
-            )
-            if response is False:
-                _LOGGER.error("Failed to upload archive to s3: %s", response)
-            else:
-                _LOGGER.info(
-                    f"Finished uploading data archive to {DOCUMENT_CACHE_BUCKET}"
-                )
 
-        except Exception as e:
-            _LOGGER.error(e)
+    dump_spec = DataDumpSpec(
+        app_name=token.sub,
+        ingest_cycle_start=latest_ingest_start,
+        allowed_corpora_ids=tuple(token.allowed_corpora_ids),
+        url_base=url_base,
+        bucket_name=DOCUMENT_CACHE_BUCKET,
+        file_format=file_format,
+    )
+    data_dump_s3_key = dump_spec.s3_key
 
     s3_document = S3Document(DOCUMENT_CACHE_BUCKET, AWS_REGION, data_dump_s3_key)
-    redirect_url = get_s3_doc_url_from_cdn(s3_client, s3_document, data_dump_s3_key)
+    s3_documents = s3_metadata_cache or s3_client
+    if not s3_documents.document_exists(s3_document):
+        if data_dump_builder is None:
+            try:
+                build_data_dump(dump_spec, db)
+            except Exception:
+                _LOGGER.exception("Failed to upload data dump to s3")
+        elif not data_dump_builder.request(dump_spec, timeout=DATA_DUMP_WAIT_SECONDS):
+            # The dump is still being built, so ask the caller to come back
+            # rather than tying up a worker until it is done.
+            return Response(
+                status_code=status.HTTP_202_ACCEPTED,
+                headers={"Retry-After": str(DATA_DUMP_RETRY_AFTER_SECONDS)},
+            )
+
+    redirect_url = get_s3_doc_url_from_cdn(s3_documents, s3_document, data_dump_s3_key)
     if redirect_url is not None:
         return RedirectResponse(redirect_url, status_code=status.HTTP_303_SEE_OTHER)
 
@@ -5,16 +5,33 @@ Like searches but with pre-defined results based on the summary context.
 """
 
 import logging
-from typing import Annotated
-
-from db_client.models.dfce import FamilyCategory, Geography
-from fastapi import APIRouter, Depends, Header, HTTPException, Request, status
+from typing import Annotated, Optional
+
+from db_client.models.dfce import Geography
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Request,
+    Response,
+    status,
+)
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
-from app.clients.db.session import get_db
-from app.models.search import BrowseArgs, GeographySummaryFamilyResponse
+from app.clients.db.session import get_async_read_db
+from app.models.search import GeographySummaryFamilyResponse
 from app.repository.lookups import get_country_slug_from_country_code, is_country_code
-from app.repository.search import browse_rds_families
+from app.repository.search import browse_rds_families_by_category
+from app.service.conditional_get import check_data_not_modified
 from app.service.custom_app import AppTokenFactory
+from app.service.data_version import DataVersionTracker, get_data_version_tracker
+from app.service.family_browse_dates import (
+    FamilyBrowseDates,
+    get_family_browse_dates,
+)
 from app.telemetry_exceptions import ExceptionHandlingTelemetryRoute
 
 _LOGGER = logging.getLogger(__name__)
@@ -27,18 +44,57 @@ summary_router = APIRouter(route_class=ExceptionHandlingTelemetryRoute)
     summary="Gets a summary of the documents associated with a geography.",
     response_model=GeographySummaryFamilyResponse,
 )
-def search_by_geography(
+async def search_by_geography(  # noqa: PLR0913
     request: Request,
+    response: Response,
     geography_string: str,
     app_token: Annotated[str, Header()],
-    db=Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
+    data_version_tracker: Optional[DataVersionTracker] = Depends(
+        get_data_version_tracker
+    ),
+    family_browse_dates: Optional[FamilyBrowseDates] = Depends(get_family_browse_dates),
 ):
     """Searches the documents filtering by geography and grouping by category."""
 
     # Decode the app token and validate it.
     token = AppTokenFactory()
-    token.decode_and_validate(db, request, app_token)
+    await db.run_sync(token.decode_and_validate, request, app_token)
 
+    # The browse dates are written with the family data, so they are covered
+    # by the data version. Whether they are used is part of the ETag, as the
+    # order of families with the same date could differ without them.
+    use_browse_dates = (
+        family_browse_dates is not None and family_browse_dates.is_available()
+    )
+    # The data version is loaded with a sync session the first time, so it is
+    # checked off the event loop
+    not_modified = await run_in_threadpool(
+        check_data_not_modified,
+        request,
+        response,
+        data_version_tracker,
+        token.allowed_corpora_ids,
+        db,
+        "browse-dates" if use_browse_dates else "",
+    )
+    if not_modified is not None:
+        return not_modified
+
+    return await db.run_sync(
+        _get_geography_summary,
+        geography_string,
+        token.allowed_corpora_ids,
+        use_browse_dates,
+    )
+
+
+def _get_geography_summary(
+    db: Session,
+    geography_string: str,
+    allowed_corpora_ids: list[str],
+    use_browse_dates: bool,
+) -> GeographySummaryFamilyResponse:
     geography_slug = None
     if is_country_code(db, geography_string):
         geography_slug = get_country_slug_from_country_code(db, geography_string)
@@ -50,7 +106,7 @@ def search_by_geography(
         f"Getting geography summary for {geography_slug}",
         extra={
             "props": {"geography_slug": geography_slug},
-            "allowed_corpora_ids": token.allowed_corpora_ids,
+            "allowed_corpora_ids": allowed_corpora_ids,
         },
     )
 
@@ -64,22 +120,19 @@ def search_by_geography(
         _LOGGER.info(msg)
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=msg)
 
-    top_families = {}
-    family_counts = {}
-
-    for cat in FamilyCategory:
-        (families_count, results) = browse_rds_families(
-            db,
-            BrowseArgs(
-                geography_slugs=[geography_slug],
-                categories=[cat],
-                offset=0,
-                limit=None,
-                corpora_ids=token.allowed_corpora_ids,
-            ),
-        )
-        family_counts[cat] = families_count
-        top_families[cat] = list(results.families)
+    category_summaries = browse_rds_families_by_category(
+        db,
+        geography_slugs=[geography_slug],
+        corpora_ids=allowed_corpora_ids,
+        use_browse_dates=use_browse_dates,
+    )
+    family_counts = {
+        category: families_count
+        for category, (families_count, _) in category_summaries.items()
+    }
+    top_families = {
+        category: families for category, (_, families) in category_summaries.items()
+    }
 
     # TODO: Add targets
     targets = []
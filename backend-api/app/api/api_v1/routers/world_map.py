@@ -1,23 +1,47 @@
 import logging
-from typing import Annotated
+from typing import Annotated, Optional
 
-from fastapi import APIRouter, Depends, Header, HTTPException, Request, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Request,
+    Response,
+    status,
+)
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
 
-from app.clients.db.session import get_db
+from app.clients.db.session import get_async_read_db
 from app.errors import RepositoryError, ValidationError
 from app.models.geography import GeographyStatsDTO
+from app.service.conditional_get import check_not_modified, content_etag
 from app.service.custom_app import AppTokenFactory
-from app.service.world_map import get_world_map_stats
+from app.service.world_map import (
+    WorldMapStatsCache,
+    get_world_map_stats,
+    get_world_map_stats_cache,
+)
 from app.telemetry_exceptions import ExceptionHandlingTelemetryRoute
 
 _LOGGER = logging.getLogger(__file__)
 
 world_map_router = APIRouter(route_class=ExceptionHandlingTelemetryRoute)
 
+_world_map_stats_adapter = TypeAdapter(list[GeographyStatsDTO])
+
 
 @world_map_router.get("/geographies", response_model=list[GeographyStatsDTO])
-def world_map_stats(
-    request: Request, app_token: Annotated[str, Header()], db=Depends(get_db)
+async def world_map_stats(
+    request: Request,
+    response: Response,
+    app_token: Annotated[str, Header()],
+    db: AsyncSession = Depends(get_async_read_db),
+    world_map_stats_cache: Optional[WorldMapStatsCache] = Depends(
+        get_world_map_stats_cache
+    ),
 ):
     """Get a summary of family counts for all geographies for world map."""
     _LOGGER.info(
@@ -29,10 +53,22 @@ def world_map_stats(
 
     # Decode the app token and validate it.
     token = AppTokenFactory()
-    token.decode_and_validate(db, request, app_token)
+    await db.run_sync(token.decode_and_validate, request, app_token)
 
     try:
-        world_map_stats = get_world_map_stats(db, token.allowed_corpora_ids)
+        if world_map_stats_cache is not None:
+            # The cache loads new entries with its own sync session, so it is
+            # read off the event loop
+            world_map_stats = await run_in_threadpool(
+                get_world_map_stats,
+                None,
+                token.allowed_corpora_ids,
+                world_map_stats_cache,
+            )
+        else:
+            world_map_stats = await db.run_sync(
+                get_world_map_stats, token.allowed_corpora_ids
+            )
 
         if world_map_stats == []:
             _LOGGER.error("No stats for world map found")
@@ -41,6 +77,16 @@ def world_map_stats(
                 detail="No stats for world map found",
             )
 
+        # The stats may be served from a cache that lags the database, so the
+        # ETag is taken from the stats rather than the data version.
+        not_modified = check_not_modified(
+            request,
+            response,
+            content_etag(_world_map_stats_adapter.dump_json(world_map_stats)),
+        )
+        if not_modified is not None:
+            return not_modified
+
         return world_map_stats
     except RepositoryError as e:
         _LOGGER.error(e)
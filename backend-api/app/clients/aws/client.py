@@ -4,14 +4,16 @@ import logging
 import os
 import typing as t
 from datetime import datetime
+from functools import lru_cache
 
 import boto3
 import botocore.client
 from botocore.exceptions import ClientError, UnauthorizedSSOTokenError
 from botocore.response import StreamingBody
 
+from app.clients.aws.multipart_upload import S3MultipartUploadWriter
 from app.clients.aws.s3_document import S3Document
-from app.config import AWS_REGION, DEVELOPMENT_MODE
+from app.config import AWS_REGION, DEVELOPMENT_MODE, S3_MAX_POOL_CONNECTIONS
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +32,7 @@ class S3Client:
                     signature_version="s3v4",
                     region_name=AWS_REGION,
                     connect_timeout=10,
+                    max_pool_connections=S3_MAX_POOL_CONNECTIONS,
                 ),
             )
         else:
@@ -43,8 +46,10 @@ class S3Client:
                     signature_version="s3v4",
                     region_name=AWS_REGION,
                     connect_timeout=10,
+                    max_pool_connections=S3_MAX_POOL_CONNECTIONS,
                 ),
             )
+        self._sts_client: t.Optional[botocore.client.BaseClient] = None
 
     def is_connected(self) -> bool:
         """
@@ -52,10 +57,11 @@ class S3Client:
 
         :return [bool]: Connection status
         """
-        sts = boto3.client("sts")
+        if self._sts_client is None:
+            self._sts_client = boto3.client("sts")
 
         try:
-            sts.get_caller_identity()
+            self._sts_client.get_caller_identity()
             return True
         except UnauthorizedSSOTokenError:
             return False
@@ -97,6 +103,28 @@ class S3Client:
         logger.info("Returning S3Document {} {} {}".format(bucket, AWS_REGION, key))
         return S3Document(bucket, AWS_REGION, key)
 
+    def open_multipart_upload(
+        self,
+        bucket: str,
+        key: str,
+        content_type: t.Optional[str] = None,
+    ) -> S3MultipartUploadWriter:
+        """
+        Open a writable stream to an S3 object, uploaded in parts as it is written.
+
+        Use it as a context manager: the upload is completed on exit, or aborted
+        if an exception is raised.
+
+        :param [str] bucket: name of the bucket to upload the file to.
+        :param [str] key: filename of the resulting file on s3. Should include the file
+            extension.
+        :param [str | None] content_type: optional content-type of the file
+        :return [S3MultipartUploadWriter]: the stream to write the object to.
+        """
+        return S3MultipartUploadWriter(
+            self.client, bucket=bucket, key=key, content_type=content_type
+        )
+
     def upload_file(
         self,
         file_name: str,
@@ -310,6 +338,11 @@ class S3Client:
         return latest_ingest_start
 
 
-def get_s3_client():
-    """Get s3 client for API."""
+@lru_cache(maxsize=1)
+def get_s3_client() -> S3Client:
+    """Get the s3 client for API.
+
+    boto3 clients are thread safe, so a single client and its connection pool
+    are shared by all requests in a worker rather than created per request.
+    """
     return S3Client(DEVELOPMENT_MODE)
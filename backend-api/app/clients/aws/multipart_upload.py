@@ -0,0 +1,128 @@
+"""A writable stream that uploads to S3 in parts as it is written to."""
+
+import io
+import logging
+import typing as t
+
+logger = logging.getLogger(__name__)
+
+# S3 requires every part except the last to be at least 5MiB
+MIN_PART_SIZE = 5 * 1024 * 1024
+DEFAULT_PART_SIZE = 8 * 1024 * 1024
+
+
+class S3MultipartUploadWriter(io.RawIOBase):
+    """Write to an S3 object using a multipart upload.
+
+    At most one part is held in memory at a time, so objects of any size can
+    be written with constant memory. The upload is completed when the writer
+    is closed, and aborted if the `with` block it is used in raises.
+
+    The stream is not seekable. Libraries that need to seek (e.g. to patch
+    headers) must support writing to unseekable streams, as `zipfile` does.
+
+    :param client: A boto3 S3 client.
+    :param str bucket: The bucket to upload to.
+    :param str key: The key of the object to create.
+    :param Optional[str] content_type: The content type of the object.
+    :param int part_size: The size of each uploaded part in bytes.
+    """
+
+    def __init__(
+        self,
+        client,
+        bucket: str,
+        key: str,
+        content_type: t.Optional[str] = None,
+        part_size: int = DEFAULT_PART_SIZE,
+    ) -> None:
+        if part_size < MIN_PART_SIZE:
+            raise ValueError(f"part_size must be at least {MIN_PART_SIZE} bytes")
+        super().__init__()
+        self._client = client
+        self.bucket = bucket
+        self.key = key
+        self._part_size = part_size
+        self._buffer = bytearray()
+        self._parts: list[dict] = []
+        self._aborted = False
+
+        extra_args = {"ContentType": content_type} if content_type else {}
+        response = self._client.create_multipart_upload(
+            Bucket=bucket, Key=key, **extra_args
+        )
+        self._upload_id = response["UploadId"]
+        logger.info(f"Started multipart upload to {bucket}/{key}")
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:  # type: ignore[override]
+        if self.closed:
+            raise ValueError("write to closed upload")
+        self._buffer.extend(data)
+        while len(self._buffer) >= self._part_size:
+            self._upload_part(bytes(self._buffer[: self._part_size]))
+            del self._buffer[: self._part_size]
+        return len(data)
+
+    def _upload_part(self, body: bytes) -> None:
+        part_number = len(self._parts) + 1
+        response = self._client.upload_part(
+            Bucket=self.bucket,
+            Key=self.key,
+            UploadId=self._upload_id,
+            PartNumber=part_number,
+            Body=body,
+        )
+        self._parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+
+    def abort(self) -> None:
+        """Abort the upload, discarding any parts uploaded so far."""
+        if self._aborted or self.closed:
+            return
+        self._aborted = True
+        self._buffer.clear()
+        try:
+            self._client.abort_multipart_upload(
+                Bucket=self.bucket, Key=self.key, UploadId=self._upload_id
+            )
+        finally:
+            logger.info(f"Aborted multipart upload to {self.bucket}/{self.key}")
+            super().close()
+
+    def close(self) -> None:
+        """Upload any remaining data and complete the upload."""
+        if self.closed:
+            return
+        try:
+            # The last part may be smaller than the minimum, and a part is
+            # always needed, even for an empty object
+            if self._buffer or not self._parts:
+                self._upload_part(bytes(self._buffer))
+                self._buffer.clear()
+            self._client.complete_multipart_upload(
+                Bucket=self.bucket,
+                Key=self.key,
+                UploadId=self._upload_id,
+                MultipartUpload={"Parts": self._parts},
+            )
+            logger.info(f"Completed multipart upload to {self.bucket}/{self.key}")
+        except Exception:
+            self.abort()
+            raise
+        super().close()
+
+    def __del__(self) -> None:
+        # Never complete an upload that was abandoned part way through
+        if not self.closed and getattr(self, "_upload_id", None) is not None:
+            try:
+                self.abort()
+            except Exception:
+                logger.exception(f"Failed to abort upload to {self.bucket}/{self.key}")
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is not None:
+            self.abort()
+        else:
+            self.close()
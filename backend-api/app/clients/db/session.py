@@ -14,15 +14,34 @@ Stray connection leaks are being caused by services calling get_db()
 without closing sessions, particularly via the defensive programming
 pattern we were using in the admin service where cleanup
 wasn't implemented properly.
+
+Read only requests can use a read replica through `get_read_db`, which
+falls back to the primary while the replica is lagging or unreachable.
+
+Hot read endpoints use an `AsyncSession` from `get_async_read_db`, so they
+don't hold a threadpool worker while waiting on the database. The repository
+functions are still written against `Session`, and are called with
+`AsyncSession.run_sync`, which runs them with the async connection
+underneath, so each query is awaited rather than blocking.
 """
 
 import logging
+from typing import Optional, Union
 
+from fastapi import Request
 from opentelemetry.instrumentation.sqlalchemy import SQLAlchemyInstrumentor
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
 
-from app.config import SQLALCHEMY_DATABASE_URI, STATEMENT_TIMEOUT
+from app.config import (
+    ASYNC_DB_MAX_OVERFLOW,
+    ASYNC_DB_POOL_SIZE,
+    READ_REPLICA_DATABASE_URL,
+    SQLALCHEMY_DATABASE_URI,
+    STATEMENT_TIMEOUT,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -39,12 +58,97 @@ _engine = create_engine(
 )
 
 
-# OpenTelemetry instrumentation
-SQLAlchemyInstrumentor().instrument(engine=_engine)
+# Read replica engine, if one is configured. Its connections are read only so
+# that a write routed to it by mistake fails rather than being lost.
+_read_engine = (
+    create_engine(
+        READ_REPLICA_DATABASE_URL,
+        pool_pre_ping=True,
+        pool_size=10,
+        max_overflow=100,
+        pool_recycle=1800,
+        pool_timeout=30,
+        connect_args={
+            "options": (
+                f"-c statement_timeout={STATEMENT_TIMEOUT} "
+                "-c default_transaction_read_only=on"
+            )
+        },
+    )
+    if READ_REPLICA_DATABASE_URL
+    else None
+)
+
+
+def _create_async_engine(database_url: str, read_only: bool = False) -> AsyncEngine:
+    """Create an asyncpg engine for a database URL.
+
+    :param str database_url: The database URL, as used by the sync engines.
+    :param bool read_only: Whether to make the connections read only.
+    :return AsyncEngine: The engine, with a smaller pool than the sync ones.
+    """
+    url = make_url(database_url).set(drivername="postgresql+asyncpg")
+    server_settings = {"statement_timeout": str(STATEMENT_TIMEOUT)}
+    if read_only:
+        server_settings["default_transaction_read_only"] = "on"
+    connect_args: dict = {"server_settings": server_settings}
+
+    # asyncpg takes the SSL mode as an argument rather than in the URL
+    if "sslmode" in url.query:
+        connect_args["ssl"] = url.query["sslmode"]
+        url = url.difference_update_query(["sslmode"])
+
+    return create_async_engine(
+        url,
+        pool_pre_ping=True,
+        pool_size=ASYNC_DB_POOL_SIZE,
+        max_overflow=ASYNC_DB_MAX_OVERFLOW,
+        pool_recycle=1800,
+        pool_timeout=30,
+        connect_args=connect_args,
+    )
+
+
+# Async engines for the same databases, used by the async read endpoints
+_async_engine = _create_async_engine(SQLALCHEMY_DATABASE_URI)
+_async_read_engine = (
+    _create_async_engine(READ_REPLICA_DATABASE_URL, read_only=True)
+    if READ_REPLICA_DATABASE_URL
+    else None
+)
+
+# OpenTelemetry instrumentation, async engines are instrumented through the
+# sync engine they wrap
+SQLAlchemyInstrumentor().instrument(
+    engines=[e for e in (_engine, _read_engine) if e is not None]
+    + [e.sync_engine for e in (_async_engine, _async_read_engine) if e is not None]
+)
 
 # Session factory, exported callable for tests
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=_engine)
 
+# Read replica session factory, None if there is no replica
+ReadSessionLocal: Optional[sessionmaker] = (
+    sessionmaker(autocommit=False, autoflush=False, bind=_read_engine)
+    if _read_engine is not None
+    else None
+)
+
+# Async session factories, on the primary and the read replica if there is one
+AsyncSessionLocal = sessionmaker(
+    bind=_async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
+AsyncReadSessionLocal: Optional[sessionmaker] = (
+    sessionmaker(
+        bind=_async_read_engine,
+        class_=AsyncSession,
+        autoflush=False,
+        expire_on_commit=False,
+    )
+    if _async_read_engine is not None
+    else None
+)
+
 
 def get_db():
     """Get the database session.
@@ -57,3 +161,57 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def get_read_db(request: Request):
+    """Get a database session for a read only request.
+
+    Uses the read replica when there is one and it is not lagging behind the
+    primary, otherwise the primary.
+    """
+    read_replica = getattr(request.app.state, "read_replica", None)
+    db = read_replica.session() if read_replica is not None else SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_db():
+    """Get an async database session on the primary."""
+    db = AsyncSessionLocal()
+    try:
+        yield db
+    finally:
+        await db.close()
+
+
+async def get_async_read_db(request: Request):
+    """Get an async database session for a read only request.
+
+    Like `get_read_db`, uses the read replica when there is one and it is not
+    lagging behind the primary, otherwise the primary.
+    """
+    read_replica = getattr(request.app.state, "read_replica", None)
+    use_replica = (
+        AsyncReadSessionLocal is not None
+        and read_replica is not None
+        and read_replica.is_usable()
+    )
+    db = AsyncReadSessionLocal() if use_replica else AsyncSessionLocal()  # type: ignore
+    try:
+        yield db
+    finally:
+        await db.close()
+
+
+def is_read_replica_session(db: Union[Session, AsyncSession]) -> bool:
+    """Whether a session is connected to the read replica.
+
+    :param Union[Session, AsyncSession] db: The session.
+    :return bool: True if the session is on the read replica, False if it
+        is on the primary.
+    """
+    return db.bind is not None and any(
+        db.bind is engine for engine in (_read_engine, _async_read_engine)
+    )
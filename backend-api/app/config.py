@@ -8,6 +8,22 @@ SQLALCHEMY_DATABASE_URI = os.getenv("DATABASE_URL", "")
 if not SQLALCHEMY_DATABASE_URI:
     raise RuntimeError("'{DATABASE_URL}' environment variable must be set")
 
+# Optional read replica for read only requests, used while it is not lagging
+# more than READ_REPLICA_MAX_LAG_SECONDS behind the primary
+READ_REPLICA_DATABASE_URL: Optional[str] = os.getenv("READ_REPLICA_DATABASE_URL")
+READ_REPLICA_MAX_LAG_SECONDS: float = float(
+    os.getenv("READ_REPLICA_MAX_LAG_SECONDS", "30")
+)
+READ_REPLICA_LAG_CHECK_SECONDS: int = int(
+    os.getenv("READ_REPLICA_LAG_CHECK_SECONDS", "10")
+)
+
+# Connection pool of each async engine, per worker. The async endpoints only
+# hold a connection while their queries run, rather than for a whole threadpool
+# request, so they need far fewer than the sync engines' 10 + 100.
+ASYNC_DB_POOL_SIZE: int = int(os.getenv("ASYNC_DB_POOL_SIZE", "5"))
+ASYNC_DB_MAX_OVERFLOW: int = int(os.getenv("ASYNC_DB_MAX_OVERFLOW", "10"))
+
 PUBLIC_APP_URL = os.environ["PUBLIC_APP_URL"].rstrip("/")
 API_V1_STR = "/api/v1"
 
@@ -26,3 +42,106 @@ CDN_DOMAIN = os.getenv("CDN_DOMAIN")
 ENV = os.getenv("ENV", "development")
 VESPA_INSTANCE_URL = os.getenv("VESPA_INSTANCE_URL", "NOTSET")
 VESPA_CLOUD_SECRET_TOKEN = os.getenv("VESPA_CLOUD_SECRET_TOKEN", "NOTSET")
+
+# Search response cache
+SEARCH_CACHE_ENABLED: bool = os.getenv("SEARCH_CACHE_ENABLED", "True").lower() == "true"
+SEARCH_CACHE_MAX_ENTRIES: int = int(os.getenv("SEARCH_CACHE_MAX_ENTRIES", "1000"))
+SEARCH_CACHE_TTL_SECONDS: int = int(os.getenv("SEARCH_CACHE_TTL_SECONDS", "3600"))
+# How often to re-check the latest ingest cycle, only used when the data
+# version is disabled
+SEARCH_CACHE_VERSION_CHECK_SECONDS: int = int(
+    os.getenv("SEARCH_CACHE_VERSION_CHECK_SECONDS", "300")
+)
+
+# Per-stage latency histograms for search requests
+SEARCH_METRICS_ENABLED: bool = (
+    os.getenv("SEARCH_METRICS_ENABLED", "True").lower() == "true"
+)
+
+# Geography index used to convert search filters
+GEOGRAPHY_INDEX_ENABLED: bool = (
+    os.getenv("GEOGRAPHY_INDEX_ENABLED", "True").lower() == "true"
+)
+GEOGRAPHY_INDEX_REFRESH_SECONDS: int = int(
+    os.getenv("GEOGRAPHY_INDEX_REFRESH_SECONDS", "3600")
+)
+
+# App token cache
+APP_TOKEN_CACHE_ENABLED: bool = (
+    os.getenv("APP_TOKEN_CACHE_ENABLED", "True").lower() == "true"
+)
+APP_TOKEN_CACHE_MAX_ENTRIES: int = int(os.getenv("APP_TOKEN_CACHE_MAX_ENTRIES", "1000"))
+APP_TOKEN_CACHE_TTL_SECONDS: int = int(os.getenv("APP_TOKEN_CACHE_TTL_SECONDS", "3600"))
+CORPUS_IDS_REFRESH_SECONDS: int = int(os.getenv("CORPUS_IDS_REFRESH_SECONDS", "300"))
+
+# Whole database dump builder
+DATA_DUMP_BUILDER_ENABLED: bool = (
+    os.getenv("DATA_DUMP_BUILDER_ENABLED", "True").lower() == "true"
+)
+DATA_DUMP_BUILDER_MAX_WORKERS: int = int(
+    os.getenv("DATA_DUMP_BUILDER_MAX_WORKERS", "1")
+)
+# Answer 202 Accepted with a Retry-After header when a dump takes longer than
+# DATA_DUMP_WAIT_SECONDS to build, rather than tying up a worker until the
+# build finishes.
+DATA_DUMP_WAIT_SECONDS: float = float(os.getenv("DATA_DUMP_WAIT_SECONDS", "20"))
+DATA_DUMP_RETRY_AFTER_SECONDS: int = int(
+    os.getenv("DATA_DUMP_RETRY_AFTER_SECONDS", "60")
+)
+
+# Browse sort dates
+FAMILY_BROWSE_DATES_ENABLED: bool = (
+    os.getenv("FAMILY_BROWSE_DATES_ENABLED", "True").lower() == "true"
+)
+# How often each worker checks that the table and the triggers that keep it
+# up to date are in place. They are created by scripts/family_browse_dates.py.
+FAMILY_BROWSE_DATES_CHECK_SECONDS: int = int(
+    os.getenv("FAMILY_BROWSE_DATES_CHECK_SECONDS", "60")
+)
+
+# World map stats cache
+WORLD_MAP_CACHE_ENABLED: bool = (
+    os.getenv("WORLD_MAP_CACHE_ENABLED", "True").lower() == "true"
+)
+WORLD_MAP_CACHE_MAX_ENTRIES: int = int(os.getenv("WORLD_MAP_CACHE_MAX_ENTRIES", "100"))
+WORLD_MAP_CACHE_REFRESH_SECONDS: int = int(
+    os.getenv("WORLD_MAP_CACHE_REFRESH_SECONDS", "3600")
+)
+# How often to re-check the latest ingest cycle, only used when the data
+# version is disabled
+WORLD_MAP_CACHE_VERSION_CHECK_SECONDS: int = int(
+    os.getenv("WORLD_MAP_CACHE_VERSION_CHECK_SECONDS", "300")
+)
+
+# Config endpoint cache
+CONFIG_CACHE_ENABLED: bool = os.getenv("CONFIG_CACHE_ENABLED", "True").lower() == "true"
+CONFIG_CACHE_MAX_ENTRIES: int = int(os.getenv("CONFIG_CACHE_MAX_ENTRIES", "100"))
+CONFIG_CACHE_REFRESH_SECONDS: int = int(
+    os.getenv("CONFIG_CACHE_REFRESH_SECONDS", "900")
+)
+# How often to re-check the latest ingest cycle, only used when the data
+# version is disabled
+CONFIG_CACHE_VERSION_CHECK_SECONDS: int = int(
+    os.getenv("CONFIG_CACHE_VERSION_CHECK_SECONDS", "300")
+)
+
+# Data version used for conditional GET
+DATA_VERSION_ENABLED: bool = os.getenv("DATA_VERSION_ENABLED", "True").lower() == "true"
+DATA_VERSION_REFRESH_SECONDS: int = int(os.getenv("DATA_VERSION_REFRESH_SECONDS", "10"))
+
+# Slug index used to resolve page slugs, reloaded when the data version changes
+SLUG_INDEX_ENABLED: bool = os.getenv("SLUG_INDEX_ENABLED", "True").lower() == "true"
+SLUG_INDEX_REFRESH_SECONDS: int = int(os.getenv("SLUG_INDEX_REFRESH_SECONDS", "10"))
+
+# S3 client connection pool and cached S3/STS metadata lookups
+S3_MAX_POOL_CONNECTIONS: int = int(os.getenv("S3_MAX_POOL_CONNECTIONS", "50"))
+S3_METADATA_CACHE_ENABLED: bool = (
+    os.getenv("S3_METADATA_CACHE_ENABLED", "True").lower() == "true"
+)
+S3_METADATA_REFRESH_SECONDS: int = int(os.getenv("S3_METADATA_REFRESH_SECONDS", "300"))
+S3_DOCUMENT_EXISTS_CACHE_MAX_ENTRIES: int = int(
+    os.getenv("S3_DOCUMENT_EXISTS_CACHE_MAX_ENTRIES", "1000")
+)
+S3_DOCUMENT_EXISTS_CACHE_TTL_SECONDS: int = int(
+    os.getenv("S3_DOCUMENT_EXISTS_CACHE_TTL_SECONDS", "3600")
+)
@@ -23,8 +23,20 @@ from app.api.api_v1.routers.search import search_router
 from app.api.api_v1.routers.summaries import summary_router
 from app.api.api_v1.routers.world_map import world_map_router
 from app.service.auth import get_superuser_details
+from app.service.config_cache import make_config_cache
+from app.service.custom_app import make_app_token_cache
+from app.service.data_dump import make_data_dump_builder
+from app.service.data_version import make_data_version_tracker
+from app.service.family_browse_dates import make_family_browse_dates
+from app.service.geography_index import make_geography_index
 from app.service.health import is_database_online
+from app.service.read_replica import get_read_session_factory, make_read_replica
+from app.service.s3_metadata import make_s3_metadata_cache
+from app.service.search_cache import make_search_response_cache
+from app.service.search_metrics import make_search_metrics
+from app.service.slug_index import make_slug_index
 from app.service.vespa import make_vespa_search_adapter
+from app.service.world_map import make_world_map_stats_cache
 from app.telemetry import Telemetry
 from app.telemetry_config import ServiceManifest, TelemetryConfig
 from app.telemetry_exceptions import ExceptionHandlingTelemetryRoute
@@ -90,9 +102,29 @@ async def lifespan(app: FastAPI):
         f"Starting FastAPI application | PID: {os.getpid()} | Main Thread: {threading.current_thread().name}"
     )
     _LOGGER.info(f"Thread count at startup: {threading.active_count()}")
+    app.state.read_replica = make_read_replica()
+    read_session_factory = get_read_session_factory(app.state.read_replica)
     app.state.vespa_search_adapter = make_vespa_search_adapter()
+    app.state.data_version_tracker = make_data_version_tracker()
+    app.state.search_response_cache = make_search_response_cache(
+        app.state.data_version_tracker
+    )
+    app.state.geography_index = make_geography_index()
+    app.state.app_token_cache = make_app_token_cache()
+    app.state.data_dump_builder = make_data_dump_builder(read_session_factory)
+    app.state.family_browse_dates = make_family_browse_dates()
+    # Versioned by the primary's data version, so loaded from the primary
+    app.state.world_map_stats_cache = make_world_map_stats_cache(
+        data_version_tracker=app.state.data_version_tracker
+    )
+    app.state.config_cache = make_config_cache(app.state.data_version_tracker)
+    app.state.slug_index = make_slug_index(app.state.data_version_tracker)
+    app.state.s3_metadata_cache = make_s3_metadata_cache()
+    app.state.search_metrics = make_search_metrics(telemetry)
     yield
     # Shutdown
+    if app.state.data_dump_builder is not None:
+        app.state.data_dump_builder.shutdown()
 
 
 app = FastAPI(
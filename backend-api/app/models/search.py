@@ -339,7 +339,9 @@ class SearchResponse(BaseModel):
     continuation_token: Optional[str] = None
     """
     A token that can be sent in a followup request to the search endpoint in order to
-    get the next page from the search database for this specific query.
+    get the next page from the search database for this specific query. It continues
+    after the last family retrieved, which is the end of the requested page unless the
+    request itself used continuation tokens.
     """
 
     this_continuation_token: Optional[str] = None
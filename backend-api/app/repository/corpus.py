@@ -2,6 +2,7 @@ from db_client.models.dfce.family import (
     Corpus,
     DocumentStatus,
     Family,
+    FamilyCategory,
     FamilyCorpus,
     FamilyDocument,
 )
@@ -66,6 +67,44 @@ def get_family_count_by_category_per_corpus(db: Session, corpus_import_id: str):
     )
 
 
+def get_family_count_by_category_per_corpora(
+    db: Session, corpus_import_ids: list[str]
+) -> dict[str, dict[FamilyCategory, int]]:
+    """
+    Get the count of published families by category for several corpora at once.
+
+    :param db: Database session
+    :param corpus_import_ids: The import IDs of the corpora
+    :return: A mapping of corpus import ID to the count of families for each
+        family category found in that corpus
+    """
+    if not corpus_import_ids:
+        return {}
+
+    published_families = (
+        db.query(FamilyDocument.family_import_id)
+        .filter(FamilyDocument.document_status == DocumentStatus.PUBLISHED)
+        .distinct()
+        .subquery()
+    )
+    rows = (
+        db.query(FamilyCorpus.corpus_import_id, Family.family_category, func.count())
+        .join(Family, FamilyCorpus.family_import_id == Family.import_id)
+        .join(
+            published_families,
+            published_families.c.family_import_id == Family.import_id,
+        )
+        .filter(FamilyCorpus.corpus_import_id.in_(corpus_import_ids))
+        .group_by(FamilyCorpus.corpus_import_id, Family.family_category)
+        .all()
+    )
+
+    counts: dict[str, dict[FamilyCategory, int]] = {}
+    for corpus_import_id, family_category, count in rows:
+        counts.setdefault(corpus_import_id, {})[family_category] = count
+    return counts
+
+
 def get_allowed_corpora(db: Session, allowed_corpora: list[str]) -> list[Corpus]:
     """
     Get the allowed corpora.
@@ -11,3 +11,21 @@ def get(db: Session, corpus_type_name: str) -> CorpusType:
     :return: A CorpusType object
     """
     return db.query(CorpusType).filter(CorpusType.name == corpus_type_name).one()
+
+
+def get_by_names(db: Session, corpus_type_names: list[str]) -> dict[str, CorpusType]:
+    """
+    Get several CorpusType objects by their names.
+
+    :param db: Database session
+    :param corpus_type_names: The names of the corpus types
+    :return: A mapping of corpus type name to CorpusType object
+    """
+    if not corpus_type_names:
+        return {}
+    return {
+        str(corpus_type.name): corpus_type
+        for corpus_type in db.query(CorpusType)
+        .filter(CorpusType.name.in_(corpus_type_names))
+        .all()
+    }
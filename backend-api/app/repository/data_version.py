@@ -0,0 +1,48 @@
+"""A cheap summary of when the family data was last changed."""
+
+import os
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.repository.helpers import get_query_template
+
+
+def get_data_version(db: Session) -> tuple[Optional[datetime], str]:
+    """Get the latest edit time and a version string for the family data.
+
+    The version changes whenever a family, document, event or collection is
+    created, edited or deleted, a slug is added or removed, or a family moves
+    between corpora or collections.
+
+    :param Session db: The database session.
+    :return tuple[Optional[datetime], str]: The time of the latest edit, or
+        None if there is no data, and the version string.
+    """
+    row = (
+        db.execute(
+            text(
+                get_query_template(
+                    os.path.join("app", "repository", "sql", "data_version.sql")
+                )
+            )
+        )
+        .mappings()
+        .one()
+    )
+    last_modified = row["last_modified"]
+    version = ":".join(
+        [
+            last_modified.isoformat() if last_modified is not None else "",
+            str(row["family_count"]),
+            str(row["family_document_count"]),
+            str(row["family_event_count"]),
+            str(row["collection_count"]),
+            str(row["slug_count"]),
+            str(row["family_corpus_checksum"]),
+            str(row["collection_family_checksum"]),
+        ]
+    )
+    return last_modified, version
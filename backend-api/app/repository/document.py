@@ -2,6 +2,7 @@
 
 import logging
 import os
+from collections import defaultdict
 from datetime import datetime
 from typing import Optional, Sequence, cast
 
@@ -12,14 +13,19 @@ from db_client.models.dfce.family import (
     Family,
     FamilyCorpus,
     FamilyDocument,
+    FamilyGeography,
     FamilyStatus,
     Slug,
 )
+from db_client.models.dfce.geography import Geography
 from db_client.models.dfce.metadata import FamilyMetadata
-from db_client.models.document.physical_document import PhysicalDocument
+from db_client.models.document.physical_document import (
+    PhysicalDocument,
+    PhysicalDocumentLanguage,
+)
 from db_client.models.organisation.organisation import Organisation
-from sqlalchemy import bindparam, func, text
-from sqlalchemy.orm import Session
+from sqlalchemy import ScalarSelect, and_, bindparam, func, select, text
+from sqlalchemy.orm import Session, aliased, joinedload, selectinload
 from sqlalchemy.types import ARRAY, String
 
 from app.models.document import (
@@ -31,8 +37,6 @@ from app.models.document import (
     FamilyEventsResponse,
     LinkableFamily,
 )
-from app.repository.collection import get_collection_slug_from_import_id
-from app.repository.geography import get_geo_subquery
 from app.repository.helpers import get_query_template
 from app.repository.lookups import doc_type_from_family_document_metadata
 from app.service.util import to_cdn_url
@@ -92,32 +96,45 @@ def get_slugged_objects(
     return doc_id, fam_id
 
 
+def _family_geographies(family_import_id) -> ScalarSelect:
+    """A correlated subquery aggregating the values of a family's geographies."""
+    return (
+        select(func.array_agg(Geography.value))
+        .join(FamilyGeography, FamilyGeography.geography_id == Geography.id)
+        .where(FamilyGeography.family_import_id == family_import_id)
+        .scalar_subquery()
+    )
+
+
 @observe(name="get_family_document_and_context")
 def get_family_document_and_context(
     db: Session, family_document_import_id: str
 ) -> FamilyDocumentWithContextResponse:
-    geo_subquery = get_geo_subquery(
-        db, family_document_import_id=family_document_import_id
-    )
     db_objects = (
         db.query(
             Family,
             FamilyDocument,
             PhysicalDocument,
-            func.array_agg(geo_subquery.c.value).label(  # type: ignore
-                "geographies"
-            ),  # Aggregate geographies
+            _family_geographies(Family.import_id).label("geographies"),
             FamilyCorpus,
         )
         .filter(FamilyDocument.import_id == family_document_import_id)
         .filter(Family.import_id == FamilyDocument.family_import_id)
         .filter(FamilyDocument.physical_document_id == PhysicalDocument.id)
         .filter(FamilyCorpus.family_import_id == Family.import_id)
-        .filter(geo_subquery.c.family_import_id == Family.import_id)  # type: ignore
-        .group_by(Family, FamilyDocument, PhysicalDocument, FamilyCorpus)
+        .options(
+            selectinload(Family.slugs),
+            selectinload(Family.events),
+            selectinload(Family.family_documents),
+            selectinload(FamilyDocument.slugs),
+            selectinload(PhysicalDocument.language_wrappers).joinedload(
+                PhysicalDocumentLanguage.language
+            ),
+        )
     ).first()
 
-    if not db_objects:
+    # Families without geographies are not served
+    if not db_objects or db_objects.geographies is None:
         _LOGGER.warning(
             "No family document found for import_id",
             extra={"slug": family_document_import_id},
@@ -182,18 +199,17 @@ def get_family_and_documents(db: Session, import_id: str) -> FamilyAndDocumentsR
     """
     Get a document along with the family information.
 
+    The family, its documents and its collections are loaded in a fixed
+    number of statements, however many documents and collections it has.
+
     :param Session db: connection to db
     :param str import_id: id of document
     :return DocumentWithFamilyResponse: response object
     """
-
-    geo_subquery = get_geo_subquery(db)
     db_objects = (
         db.query(
             Family,
-            func.array_agg(geo_subquery.c.value).label(  # type: ignore
-                "geographies"
-            ),  # Aggregate geographies
+            _family_geographies(Family.import_id).label("geographies"),
             FamilyMetadata,
             Organisation,
             FamilyCorpus,
@@ -203,11 +219,20 @@ def get_family_and_documents(db: Session, import_id: str) -> FamilyAndDocumentsR
         .join(Corpus, Corpus.import_id == FamilyCorpus.corpus_import_id)
         .join(Organisation, Corpus.organisation_id == Organisation.id)
         .filter(Family.import_id == import_id)
-        .filter(geo_subquery.c.family_import_id == Family.import_id)  # type: ignore
-        .group_by(Family, FamilyMetadata, Organisation, FamilyCorpus)
+        .options(
+            selectinload(Family.slugs),
+            selectinload(Family.events),
+            selectinload(Family.family_documents).options(
+                selectinload(FamilyDocument.slugs),
+                joinedload(FamilyDocument.physical_document)
+                .selectinload(PhysicalDocument.language_wrappers)
+                .joinedload(PhysicalDocumentLanguage.language),
+            ),
+        )
     ).first()
 
-    if not db_objects:
+    # Families without geographies are not served
+    if not db_objects or db_objects.geographies is None:
         _LOGGER.warning("No family found for import_id", extra={"slug": import_id})
         raise ValueError(f"No family found for import_id: {import_id}")
 
@@ -216,7 +241,11 @@ def get_family_and_documents(db: Session, import_id: str) -> FamilyAndDocumentsR
     if family.family_status != FamilyStatus.PUBLISHED:
         raise ValueError(f"Family {import_id} is not published")
 
-    documents = _get_documents_for_family_import_id(db, import_id)
+    documents = [
+        _to_family_document_response(d)
+        for d in family.family_documents
+        if d.document_status == DocumentStatus.PUBLISHED
+    ]
     collections = _get_collections_for_family_import_id(db, import_id)
 
     return FamilyAndDocumentsResponse(
@@ -242,31 +271,56 @@ def get_family_and_documents(db: Session, import_id: str) -> FamilyAndDocumentsR
 def _get_collections_for_family_import_id(
     db: Session, import_id: str
 ) -> list[CollectionOverviewResponse]:
+    collection_slug = aliased(Slug)
     db_collections = (
-        db.query(Collection)
+        db.query(Collection, collection_slug.name)
         .join(
             CollectionFamily,
             Collection.import_id == CollectionFamily.collection_import_id,
         )
+        .outerjoin(
+            collection_slug,
+            and_(
+                collection_slug.collection_import_id == Collection.import_id,
+                collection_slug.family_import_id.is_(None),
+                collection_slug.family_document_import_id.is_(None),
+            ),
+        )
         .filter(CollectionFamily.family_import_id == import_id)
     ).all()
+    if not db_collections:
+        return []
+
+    families_by_collection: dict[str, list[LinkableFamily]] = defaultdict(list)
+    for collection_import_id, slug, title, description in (
+        db.query(
+            CollectionFamily.collection_import_id,
+            Slug.name,
+            Family.title,
+            Family.description,
+        )
+        .join(Family, CollectionFamily.family_import_id == Family.import_id)
+        .join(Slug, Slug.family_import_id == Family.import_id)
+        .filter(
+            CollectionFamily.collection_import_id.in_(
+                [c.import_id for c, _ in db_collections]
+            )
+        )
+        .all()
+    ):
+        families_by_collection[collection_import_id].append(
+            LinkableFamily(slug=slug, title=title, description=description)
+        )
 
     return [
         CollectionOverviewResponse(
             title=c.title,
             description=c.description,
             import_id=c.import_id,
-            slug=get_collection_slug_from_import_id(db, c.import_id),
-            families=[
-                LinkableFamily(slug=data[0], title=data[1], description=data[2])
-                for data in db.query(Slug.name, Family.title, Family.description)
-                .filter(CollectionFamily.collection_import_id == c.import_id)
-                .filter(CollectionFamily.family_import_id == Family.import_id)
-                .join(Slug, Slug.family_import_id == Family.import_id)
-                .all()
-            ],
+            slug=slug,
+            families=families_by_collection[c.import_id],
         )
-        for c in db_collections
+        for c, slug in db_collections
     ]
 
 
@@ -285,35 +339,24 @@ def _get_events_for_family(family: Family) -> list[FamilyEventsResponse]:
     return events
 
 
-def _get_documents_for_family_import_id(
-    db: Session, import_id: str
-) -> list[FamilyDocumentResponse]:
-    db_documents = (
-        db.query(FamilyDocument)
-        .filter(FamilyDocument.family_import_id == import_id)
-        .filter(FamilyDocument.document_status == DocumentStatus.PUBLISHED)
+def _to_family_document_response(d: FamilyDocument) -> FamilyDocumentResponse:
+    visible_languages = _get_visible_languages_for_phys_doc(d.physical_document)
+    return FamilyDocumentResponse(
+        import_id=cast(str, d.import_id),
+        variant=cast(str, d.variant_name),
+        slug=cast(str, d.slugs[0].name),
+        # What follows is off PhysicalDocument
+        title=cast(str, d.physical_document.title),
+        md5_sum=cast(str, d.physical_document.md5_sum),
+        cdn_object=to_cdn_url(cast(str, d.physical_document.cdn_object)),
+        source_url=cast(str, d.physical_document.source_url),
+        content_type=cast(str, d.physical_document.content_type),
+        language=(visible_languages[0] if visible_languages else ""),
+        languages=visible_languages,
+        document_type=doc_type_from_family_document_metadata(d),
+        document_role=(
+            cast(str, d.valid_metadata["role"][0])  # type:ignore
+            if "role" in d.valid_metadata.keys()
+            else ""
+        ),
     )
-
-    def make_response(d: FamilyDocument) -> FamilyDocumentResponse:
-        visible_languages = _get_visible_languages_for_phys_doc(d.physical_document)
-        return FamilyDocumentResponse(
-            import_id=cast(str, d.import_id),
-            variant=cast(str, d.variant_name),
-            slug=cast(str, d.slugs[0].name),
-            # What follows is off PhysicalDocument
-            title=cast(str, d.physical_document.title),
-            md5_sum=cast(str, d.physical_document.md5_sum),
-            cdn_object=to_cdn_url(cast(str, d.physical_document.cdn_object)),
-            source_url=cast(str, d.physical_document.source_url),
-            content_type=cast(str, d.physical_document.content_type),
-            language=(visible_languages[0] if visible_languages else ""),
-            languages=visible_languages,
-            document_type=doc_type_from_family_document_metadata(d),
-            document_role=(
-                cast(str, d.valid_metadata["role"][0])  # type:ignore
-                if "role" in d.valid_metadata.keys()
-                else ""
-            ),
-        )
-
-    return [make_response(d) for d in db_documents]
@@ -1,12 +1,14 @@
 """Functions to support browsing the RDS document structure"""
 
 import os
+from contextlib import contextmanager
 from logging import getLogger
-from typing import Optional
+from typing import Any, Iterator, Optional, Sequence
 
 import pandas as pd
 from fastapi import Depends
 from sqlalchemy import bindparam, text
+from sqlalchemy.orm import Session
 from sqlalchemy.types import ARRAY, DATETIME, String
 
 from app.clients.db.session import get_db
@@ -14,22 +16,11 @@ from app.repository.helpers import get_query_template
 
 _LOGGER = getLogger(__name__)
 
+# Rows fetched from the server-side cursor per round trip
+DUMP_BATCH_SIZE = 1000
 
-def get_whole_database_dump(
-    ingest_cycle_start: str,
-    allowed_corpora_ids: list[str],
-    db=Depends(get_db),
-    theme: Optional[str] = None,
-    url_base: Optional[str] = None,
-):
-    """Get whole database dump and bind variables.
 
-    :param str ingest_cycle_start: The current ingest cycle date.
-    :param list[str] allowed_corpora_ids: The corpora from which we
-        should allow the data to be dumped.
-    :return pd.DataFrame: A DataFrame containing the results of the SQL
-        query that gets the whole database dump in our desired format.
-    """
+def _get_whole_database_dump_query(theme: Optional[str]):
     if theme and theme.upper() == "CCC":
         filename = "ccc-download.sql"
     elif theme and theme.upper() == "MCF":
@@ -37,25 +28,77 @@ def get_whole_database_dump(
     else:
         filename = "download.sql"
 
-    query = text(
+    return text(
         get_query_template(os.path.join("app", "repository", "sql", filename))
     ).bindparams(
         bindparam("ingest_cycle_start", type_=DATETIME),
-        bindparam(
-            "allowed_corpora_ids", value=allowed_corpora_ids, type_=ARRAY(String)
-        ),
+        bindparam("allowed_corpora_ids", type_=ARRAY(String)),
         bindparam("url_base", type_=String),
     )
 
-    with db.connection() as conn:
-        result = conn.execute(
-            query,
-            {
-                "ingest_cycle_start": ingest_cycle_start,
-                "allowed_corpora_ids": allowed_corpora_ids,
-                "url_base": url_base or "https://app.climatepolicyradar.org",
-            },
+
+@contextmanager
+def stream_whole_database_dump(
+    ingest_cycle_start: str,
+    allowed_corpora_ids: list[str],
+    db: Session,
+    theme: Optional[str] = None,
+    url_base: Optional[str] = None,
+    batch_size: int = DUMP_BATCH_SIZE,
+) -> Iterator[tuple[Sequence[str], Sequence[int], Iterator[Sequence[Any]]]]:
+    """Stream the whole database dump from a server-side cursor.
+
+    Rows are fetched from the DB in batches as they are iterated over, so
+    memory use does not grow with the size of the dump. The rows must be
+    consumed before the context manager exits.
+
+    :param str ingest_cycle_start: The current ingest cycle date.
+    :param list[str] allowed_corpora_ids: The corpora from which we
+        should allow the data to be dumped.
+    :param Session db: The session to query against.
+    :param int batch_size: The number of rows to fetch per round trip.
+    :return Iterator[tuple[Sequence[str], Sequence[int], Iterator[Sequence[Any]]]]:
+        The column names, the PostgreSQL type OIDs of the columns, and an
+        iterator over the rows of the dump.
+    """
+    result = db.execute(
+        _get_whole_database_dump_query(theme),
+        {
+            "ingest_cycle_start": ingest_cycle_start,
+            "allowed_corpora_ids": allowed_corpora_ids,
+            "url_base": url_base or "https://app.climatepolicyradar.org",
+        },
+        execution_options={"stream_results": True, "yield_per": batch_size},
+    )
+    try:
+        yield (
+            list(result.keys()),
+            [column.type_code for column in result.cursor.description],
+            (tuple(row) for row in result),
         )
-        columns = result.keys()
-        df = pd.DataFrame(result.fetchall(), columns=columns)
-        return df
+    finally:
+        result.close()
+
+
+def get_whole_database_dump(
+    ingest_cycle_start: str,
+    allowed_corpora_ids: list[str],
+    db=Depends(get_db),
+    theme: Optional[str] = None,
+    url_base: Optional[str] = None,
+):
+    """Get whole database dump and bind variables.
+
+    This loads the whole dump into memory, use `stream_whole_database_dump`
+    for large dumps.
+
+    :param str ingest_cycle_start: The current ingest cycle date.
+    :param list[str] allowed_corpora_ids: The corpora from which we
+        should allow the data to be dumped.
+    :return pd.DataFrame: A DataFrame containing the results of the SQL
+        query that gets the whole database dump in our desired format.
+    """
+    with stream_whole_database_dump(
+        ingest_cycle_start, allowed_corpora_ids, db, theme, url_base
+    ) as (columns, _, rows):
+        return pd.DataFrame(list(rows), columns=columns)
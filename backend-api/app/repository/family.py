@@ -46,13 +46,17 @@ def count_families_per_category_per_corpus(
 
 
 def count_families_per_category_per_corpus_latest_ingest_cycle(
-    db: Session, allowed_corpora_ids: list[str]
+    db: Session,
+    allowed_corpora_ids: list[str],
+    latest_ingest_start: Optional[str] = None,
 ) -> list[tuple[FamilyCategory, int]]:
     """
     Get the count of families by category per corpus.
 
     :param db: Database session
     :param allowed_corpora_ids: The import IDs of the corpora
+    :param latest_ingest_start: The date the latest ingest cycle started,
+        looked up in S3 if not given
     :return: A list of tuples where each tuple contains a family category and its count
     """
     # Subquery to find families with at least one published document
@@ -78,7 +82,8 @@ def count_families_per_category_per_corpus_latest_ingest_cycle(
             FamilyCorpus, FamilyCorpus.family_import_id == Family.import_id
         ).filter(FamilyCorpus.corpus_import_id.in_(allowed_corpora_ids))
 
-    latest_ingest_start = get_latest_ingest_start()
+    if latest_ingest_start is None:
+        latest_ingest_start = get_latest_ingest_start()
     if latest_ingest_start is not None:
         query = query.filter(FamilyDocument.last_modified < latest_ingest_start)
 
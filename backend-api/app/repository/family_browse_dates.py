@@ -0,0 +1,66 @@
+"""Browse sort dates for families.
+
+The family and event tables are owned by navigator-db-client, so the dates
+used to sort browse results are kept in a separate table rather than as
+columns on `family`. Triggers on the family and event tables keep it up to
+date. Neither is created by the API: `family_browse_dates.sql` is applied by
+`scripts/family_browse_dates.py`, until it is added to the navigator-db-client
+migrations.
+"""
+
+import os
+
+from sqlalchemy import column, table, text
+from sqlalchemy.orm import Session
+
+from app.repository.helpers import get_query_template
+
+FAMILY_BROWSE_DATES_TABLE = "family_browse_dates"
+FAMILY_BROWSE_DATES_TRIGGERS = (
+    "family_browse_dates_family",
+    "family_browse_dates_family_event",
+)
+
+family_browse_dates = table(
+    FAMILY_BROWSE_DATES_TABLE,
+    column("family_import_id"),
+    column("published_date"),
+    column("last_updated_date"),
+)
+
+
+def create_family_browse_dates(db: Session) -> None:
+    """Create the browse dates table and the triggers that keep it up to date.
+
+    This is the migration for the table, see `family_browse_dates.sql`. It
+    can be re-run, and recomputes the dates of every family when it is.
+
+    :param Session db: The session to create the table with.
+    """
+    db.execute(
+        text(
+            get_query_template(
+                os.path.join("app", "repository", "sql", "family_browse_dates.sql")
+            )
+        )
+    )
+    db.commit()
+
+
+def is_family_browse_dates_maintained(db: Session) -> bool:
+    """Whether the browse dates table exists and is kept up to date.
+
+    The table is created together with the triggers that keep it up to date,
+    so it can be used while both triggers are enabled.
+
+    :param Session db: The session to query against.
+    :return bool: True if browse can sort using the table.
+    """
+    enabled_triggers = db.execute(
+        text(
+            "SELECT COUNT(*) FROM pg_trigger "
+            "WHERE tgname = ANY(:names) AND tgenabled <> 'D'"
+        ),
+        {"names": list(FAMILY_BROWSE_DATES_TRIGGERS)},
+    ).scalar()
+    return enabled_triggers == len(FAMILY_BROWSE_DATES_TRIGGERS)
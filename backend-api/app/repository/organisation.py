@@ -4,3 +4,19 @@ from sqlalchemy.orm import Session
 
 def get(db: Session, org_id: int) -> Organisation:
     return db.query(Organisation).filter(Organisation.id == org_id).one()
+
+
+def get_by_ids(db: Session, org_ids: list[int]) -> dict[int, Organisation]:
+    """
+    Get several Organisation objects by their IDs.
+
+    :param db: Database session
+    :param org_ids: The IDs of the organisations
+    :return: A mapping of organisation ID to Organisation object
+    """
+    if not org_ids:
+        return {}
+    return {
+        int(str(org.id)): org
+        for org in db.query(Organisation).filter(Organisation.id.in_(org_ids)).all()
+    }
@@ -1,12 +1,14 @@
 import logging
 import os
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from typing import Sequence, cast
+from typing import Any, Iterator, Mapping, Optional, Sequence, cast
 
-import pandas as pd
 from db_client.models.dfce import DocumentStatus
 from db_client.models.dfce.family import FamilyDocument
 from fastapi import Depends
+from sqlalchemy import DateTime, bindparam, text
+from sqlalchemy.orm import Session
 
 from app.clients.db.session import get_db
 from app.models.document import DocumentParserInput
@@ -16,70 +18,54 @@ _LOGGER = logging.getLogger(__name__)
 
 MetadataType = dict[str, list[str]]
 
+# Rows fetched from the server-side cursor per round trip
+PIPELINE_BATCH_SIZE = 1000
 
-def get_pipeline_data(db=Depends(get_db)) -> pd.DataFrame:
-    """Get non-deleted docs and their associated data from the db.
 
-    Use the pipeline query to query the current database to get a list
-    of non deleted documents and their associated data, family info,
-    metadata, languages, and geographies.
+def _get_pipeline_query():
+    return text(
+        get_query_template(os.path.join("app", "repository", "sql", "pipeline.sql"))
+    ).bindparams(bindparam("changed_since", type_=DateTime(timezone=True)))
 
-    The final result is a DataFrame containing the required information
-    to construct a DocumentParserInput object.
 
-    :param Session db: The db session to query against.
-    :return pd.DataFrame: DataFrame containing current view of documents
-        in database.
-    """
-    _LOGGER.info("Running pipeline query")
-    query = get_query_template(os.path.join("app", "repository", "sql", "pipeline.sql"))
-    df = pd.read_sql(query, db.connection().connection)
-    return df
+def parse_document_object(row: Mapping[str, Any]) -> DocumentParserInput:
+    """Parse a pipeline query row into a DocumentParserInput object.
 
-
-def parse_document_object(row: pd.Series) -> DocumentParserInput:
-    """Parse DataFrame row into DocumentParserInput object.
-
-    :param pd.Series row: A pandas series containing a row that
+    :param Mapping[str, Any] row: A row of the pipeline query that
         represents a family document and its related context.
     :return DocumentParserInput: A DocumentParserInput object
         representing the family document record & its context.
     """
-    published_date = row.family_published_date
     fallback_date = datetime(1900, 1, 1, tzinfo=timezone.utc)
-    published_date = (
-        pd.to_datetime(row.family_published_date, format="ISO8601", errors="ignore")
-        if published_date is not None
-        else fallback_date
-    )
+    published_date = cast(Optional[datetime], row["family_published_date"])
 
     return DocumentParserInput(
         # All documents in a family indexed by title
-        name=cast(str, row.family_title),
-        document_title=cast(str, row.physical_document_title),
-        description=cast(str, row.family_description),
-        category=str(row.family_category),
+        name=cast(str, row["family_title"]),
+        document_title=cast(str, row["physical_document_title"]),
+        description=cast(str, row["family_description"]),
+        category=str(row["family_category"]),
         publication_ts=published_date or fallback_date,
-        import_id=cast(str, row.family_document_import_id),
+        import_id=cast(str, row["family_document_import_id"]),
         # This gets the most recently added document slug.
-        slug=cast(str, row.family_document_slug),
-        family_import_id=cast(str, row.family_import_id),
+        slug=cast(str, row["family_document_slug"]),
+        family_import_id=cast(str, row["family_import_id"]),
         # This gets the most recently added family slug.
-        family_slug=cast(str, row.family_slug),
+        family_slug=cast(str, row["family_slug"]),
         source_url=(
-            cast(str, row.physical_document_source_url)
-            if row.physical_document_source_url is not None
+            cast(str, row["physical_document_source_url"])
+            if row["physical_document_source_url"] is not None
             else None
         ),
         download_url=None,
-        type=cast(str, row.get("family_document_type", default="")),
-        source=cast(str, row.organisation_name),
-        geography=cast(list, row.get("geographies", default=[""]))[
+        type=cast(str, row.get("family_document_type", "")),
+        source=cast(str, row["organisation_name"]),
+        geography=cast(list, row.get("geographies", [""]))[
             0
         ],  # First geography for backward compatibility
-        geographies=row.geographies,
-        corpus_import_id=cast(str, row.corpus_import_id),
-        corpus_type_name=cast(str, row.corpus_type_name),
+        geographies=row["geographies"],
+        corpus_import_id=cast(str, row["corpus_import_id"]),
+        corpus_type_name=cast(str, row["corpus_type_name"]),
         collection_title=None,
         collection_summary=None,
         languages=[
@@ -92,41 +78,115 @@ def parse_document_object(row: pd.Series) -> DocumentParserInput:
             )
         ],
         metadata=_flatten_pipeline_metadata(
-            cast(MetadataType, row.family_metadata),
-            cast(MetadataType, row.family_document_metadata),
+            cast(MetadataType, row["family_metadata"]),
+            cast(MetadataType, row["family_document_metadata"]),
         ),
     )
 
 
-def generate_pipeline_ingest_input(db=Depends(get_db)) -> Sequence[DocumentParserInput]:
-    """Generate a view of the current document db as pipeline input.
+@contextmanager
+def stream_pipeline_ingest_input(
+    db: Session,
+    changed_since: Optional[datetime] = None,
+    batch_size: int = PIPELINE_BATCH_SIZE,
+) -> Iterator[Iterator[DocumentParserInput]]:
+    """Stream the pipeline input from a server-side cursor.
+
+    Rows are fetched from the DB in batches and parsed as they are iterated
+    over, so memory use does not grow with the number of documents. The
+    documents must be consumed before the context manager exits.
 
     :param Session db: The db session to query against.
-    :return Sequence[DocumentParserInput]: A list of DocumentParserInput
-        objects that can be used by the pipeline.
+    :param Optional[datetime] changed_since: Only include documents whose
+        family, document, events or slugs changed at or after this time.
+        All documents are included if not given.
+    :param int batch_size: The number of rows to fetch per round trip.
+    :return Iterator[Iterator[DocumentParserInput]]: An iterator over the
+        DocumentParserInput objects that can be used by the pipeline.
     """
-    results = get_pipeline_data(db)
+    _LOGGER.info("Running pipeline query")
+    result = db.execute(
+        _get_pipeline_query(),
+        {"changed_since": changed_since},
+        execution_options={"stream_results": True, "yield_per": batch_size},
+    )
+    try:
+        yield (parse_document_object(row) for row in result.mappings())
+    finally:
+        result.close()
+
+
+def get_pipeline_document_ids(db: Session) -> list[str]:
+    """Get the import IDs of every document in the pipeline input.
+
+    :param Session db: The db session to query against.
+    :return list[str]: The import IDs of the documents a full export writes.
+    """
+    return list(
+        db.execute(
+            text(
+                get_query_template(
+                    os.path.join(
+                        "app", "repository", "sql", "pipeline_document_ids.sql"
+                    )
+                )
+            )
+        ).scalars()
+    )
 
-    _LOGGER.info("Parsing pipeline query data")
-    documents: Sequence[DocumentParserInput] = [
-        parse_document_object(row) for _, row in results.iterrows()
-    ]
 
+def get_untimestamped_checksum(db: Session) -> str:
+    """Get a checksum of the pipeline input data that has no edit times.
+
+    Family metadata, geographies, corpus membership, physical documents and
+    languages are not timestamped, so an incremental export can't select
+    the documents they changed. The checksum changes whenever any of them do.
+
+    :param Session db: The db session to query against.
+    :return str: The checksum.
+    """
+    return db.execute(
+        text(
+            get_query_template(
+                os.path.join("app", "repository", "sql", "pipeline_checksum.sql")
+            )
+        )
+    ).scalar_one()
+
+
+def check_pipeline_ingest_input_count(db: Session, ingest_count: int) -> None:
+    """Warn if the pipeline input has more documents than the database.
+
+    :param Session db: The db session to query against.
+    :param int ingest_count: The number of documents in the pipeline input.
+    """
     # TODO: Revert to raise a ValueError when the issue is resolved
     database_doc_count = (
         db.query(FamilyDocument)
         .filter(FamilyDocument.document_status != DocumentStatus.DELETED)
         .count()
     )
-    if len(documents) > database_doc_count:
+    if ingest_count > database_doc_count:
         _LOGGER.warning(
             "Potential Row Explosion. Ingest input is returning more documents than exist in the database",
             extra={
-                "ingest_count": len(documents),
+                "ingest_count": ingest_count,
                 "database_count": database_doc_count,
             },
         )
 
+
+def generate_pipeline_ingest_input(db=Depends(get_db)) -> Sequence[DocumentParserInput]:
+    """Generate a view of the current document db as pipeline input.
+
+    :param Session db: The db session to query against.
+    :return Sequence[DocumentParserInput]: A list of DocumentParserInput
+        objects that can be used by the pipeline.
+    """
+    with stream_pipeline_ingest_input(db) as pipeline_ingest_input:
+        documents: Sequence[DocumentParserInput] = list(pipeline_ingest_input)
+
+    check_pipeline_ingest_input_count(db, len(documents))
     return documents
 
 
@@ -0,0 +1,40 @@
+"""Replication status of the database a session is connected to."""
+
+import math
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+# A replica that has replayed all the WAL it has received is up to date, even
+# if nothing has been written on the primary for a while, but only while it is
+# still streaming WAL from the primary. If the WAL receiver has stopped, the
+# replica can't tell how far behind it is, so it is treated as lagging. Roles
+# without pg_read_all_stats only see the receiver's pid, not its status. A
+# database that is not in recovery isn't a replica, so has no lag.
+_REPLICA_LAG_QUERY = text(
+    """
+    SELECT
+        CASE
+            WHEN NOT pg_is_in_recovery() THEN 0
+            WHEN NOT EXISTS (
+                SELECT 1
+                FROM pg_stat_wal_receiver
+                WHERE COALESCE(status, 'streaming') = 'streaming'
+            ) THEN NULL
+            WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+            ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+        END
+    """
+)
+
+
+def get_replica_lag_seconds(db: Session) -> float:
+    """Get how far the database is behind the primary it replicates.
+
+    :param Session db: A session connected to the replica.
+    :return float: The lag in seconds, 0 if the database is not a replica,
+        or infinity if the replica is not streaming from the primary or has
+        not replayed anything yet.
+    """
+    lag = db.execute(_REPLICA_LAG_QUERY).scalar_one()
+    return math.inf if lag is None else float(lag)
@@ -2,8 +2,9 @@
 
 from logging import getLogger
 from time import perf_counter_ns
-from typing import cast
+from typing import Optional, Sequence, cast
 
+from db_client.models.dfce import FamilyCategory
 from db_client.models.dfce.family import (
     Corpus,
     DocumentStatus,
@@ -13,9 +14,9 @@ from db_client.models.dfce.family import (
     FamilyEvent,
 )
 from db_client.models.organisation import Organisation
-from sqlalchemy import func, literal_column, select
+from sqlalchemy import case, func, literal_column, select
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Query, Session, selectinload
 from sqlalchemy.sql import exists, literal
 
 from app.models.search import (
@@ -25,6 +26,7 @@ from app.models.search import (
     SortField,
     SortOrder,
 )
+from app.repository.family_browse_dates import family_browse_dates
 from app.repository.geography import get_geo_subquery
 from app.telemetry import observe
 
@@ -61,23 +63,20 @@ def to_search_response_family(
     )
 
 
-@observe(name="browse_rds_families")
-def browse_rds_families(db: Session, req: BrowseArgs) -> tuple[int, SearchResponse]:
-    """Browse RDS"""
-
-    t0 = perf_counter_ns()
-    geo_subquery = get_geo_subquery(db, req.geography_slugs, req.country_codes)
+def _published_families_subquery(db: Session):
     # Subquery to find families with at least one published document
     # Avoid using calculated family_status field
-    published_families = (
+    return (
         db.query(FamilyDocument.family_import_id)
         .filter(FamilyDocument.document_status == DocumentStatus.PUBLISHED)
         .distinct()
         .subquery()
     )
 
+
+def _published_date_subquery():
     # subquery to order by published_date
-    published_date_subq = (
+    return (
         select(func.min(FamilyEvent.date))
         .where(
             FamilyEvent.family_import_id == Family.import_id,
@@ -96,6 +95,46 @@ def browse_rds_families(db: Session, req: BrowseArgs) -> tuple[int, SearchRespon
         .scalar_subquery()
     )
 
+
+def _published_date_for_sort(use_browse_dates: bool):
+    published_date = _published_date_subquery()
+    if not use_browse_dates:
+        return published_date
+    # The browse dates are kept up to date on write, but compute the date of
+    # any family missing from them rather than sorting it as undated
+    return case(
+        (family_browse_dates.c.family_import_id.is_(None), published_date),
+        else_=family_browse_dates.c.published_date,
+    )
+
+
+def _join_browse_dates(query: Query, use_browse_dates: bool) -> Query:
+    if not use_browse_dates:
+        return query
+    return query.outerjoin(
+        family_browse_dates,
+        family_browse_dates.c.family_import_id == Family.import_id,
+    )
+
+
+@observe(name="browse_rds_families")
+def browse_rds_families(
+    db: Session, req: BrowseArgs, use_browse_dates: bool = False
+) -> tuple[int, SearchResponse]:
+    """Browse RDS
+
+    :param Session db: The session to query against.
+    :param BrowseArgs req: The browse arguments.
+    :param bool use_browse_dates: Whether to sort by date using the family
+        browse dates table, rather than computing each family's published
+        date in the query.
+    """
+
+    t0 = perf_counter_ns()
+    geo_subquery = get_geo_subquery(db, req.geography_slugs, req.country_codes)
+    published_families = _published_families_subquery(db)
+    published_date = _published_date_for_sort(use_browse_dates)
+
     query = (
         db.query(Family, Corpus, geo_subquery.c.value, Organisation)  # type: ignore
         .join(FamilyCorpus, FamilyCorpus.family_import_id == Family.import_id)
@@ -107,6 +146,7 @@ def browse_rds_families(db: Session, req: BrowseArgs) -> tuple[int, SearchRespon
         )
         .filter(geo_subquery.c.family_import_id == Family.import_id)  # type: ignore
     )
+    query = _join_browse_dates(query, use_browse_dates)
 
     if req.categories is not None:
         query = query.filter(Family.family_category.in_(req.categories))
@@ -121,7 +161,7 @@ def browse_rds_families(db: Session, req: BrowseArgs) -> tuple[int, SearchRespon
             query = query.order_by(Family.title.asc())
 
     if req.sort_field == SortField.DATE:
-        query = query.order_by(published_date_subq.desc())
+        query = query.order_by(published_date.desc())
 
     _LOGGER.debug("Starting families query")
     families_count = query.count()
@@ -147,3 +187,99 @@ def browse_rds_families(db: Session, req: BrowseArgs) -> tuple[int, SearchRespon
             families=families[offset : offset + limit],
         ),
     )
+
+
+@observe(name="browse_rds_families_by_category")
+def browse_rds_families_by_category(
+    db: Session,
+    geography_slugs: Sequence[str],
+    corpora_ids: Optional[Sequence[str]] = None,
+    top_n: int = 5,
+    use_browse_dates: bool = False,
+) -> dict[FamilyCategory, tuple[int, list[SearchResponseFamily]]]:
+    """Count the families in each category and get the most recent of each.
+
+    This gives the same counts and families as calling `browse_rds_families`
+    once per category, sorted by date, but in a single query. Window
+    functions number the families within each category and count them, and
+    only the top `top_n` per category are returned.
+
+    :param Session db: The session to query against.
+    :param Sequence[str] geography_slugs: The geographies to browse.
+    :param Optional[Sequence[str]] corpora_ids: The corpora to include, all
+        if None or empty.
+    :param int top_n: The number of families to return per category.
+    :param bool use_browse_dates: Whether to sort using the family browse
+        dates table.
+    :return dict[FamilyCategory, tuple[int, list[SearchResponseFamily]]]:
+        The family count and top families for every category.
+    """
+    geo_subquery = get_geo_subquery(db, geography_slugs)
+    published_families = _published_families_subquery(db)
+    published_date = _published_date_for_sort(use_browse_dates)
+
+    ranked_query = (
+        db.query(
+            Family.import_id.label("family_import_id"),
+            Family.family_category.label("family_category"),
+            Corpus.import_id.label("corpus_import_id"),
+            geo_subquery.c.value.label("geography_value"),  # type: ignore
+            func.count()
+            .over(partition_by=Family.family_category)
+            .label("category_count"),
+            func.row_number()
+            .over(
+                partition_by=Family.family_category,
+                order_by=published_date.desc(),
+            )
+            .label("category_rank"),
+        )
+        .join(FamilyCorpus, FamilyCorpus.family_import_id == Family.import_id)
+        .join(Corpus, FamilyCorpus.corpus_import_id == Corpus.import_id)
+        .join(
+            published_families,
+            published_families.c.family_import_id == Family.import_id,
+        )
+        .filter(geo_subquery.c.family_import_id == Family.import_id)  # type: ignore
+    )
+    ranked_query = _join_browse_dates(ranked_query, use_browse_dates)
+
+    if corpora_ids is not None and corpora_ids != []:
+        ranked_query = ranked_query.filter(Corpus.import_id.in_(corpora_ids))
+
+    ranked = ranked_query.subquery("ranked")
+
+    rows = (
+        db.query(
+            Family,
+            Corpus,
+            ranked.c.geography_value,
+            Organisation,
+            ranked.c.category_count,
+        )
+        .join(ranked, ranked.c.family_import_id == Family.import_id)
+        .join(Corpus, Corpus.import_id == ranked.c.corpus_import_id)
+        .join(Organisation, Organisation.id == Corpus.organisation_id)
+        .filter(ranked.c.category_rank <= top_n)
+        .order_by(ranked.c.family_category, ranked.c.category_rank)
+        .options(
+            selectinload(Family.slugs),
+            selectinload(Family.geographies),
+            # For family.published_date
+            selectinload(Family.events),
+        )
+        .all()
+    )
+
+    results: dict[FamilyCategory, tuple[int, list[SearchResponseFamily]]] = {
+        category: (0, []) for category in FamilyCategory
+    }
+    for family, corpus, geography_value, organisation, category_count in rows:
+        category = FamilyCategory(family.family_category)
+        _, families = results[category]
+        families.append(
+            to_search_response_family(family, corpus, geography_value, organisation)
+        )
+        results[category] = (category_count, families)
+
+    return results
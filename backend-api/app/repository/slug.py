@@ -0,0 +1,25 @@
+"""Bulk loading of slugs for the in-memory slug index."""
+
+import os
+from typing import Sequence
+
+from sqlalchemy import Row, text
+from sqlalchemy.orm import Session
+
+from app.repository.helpers import get_query_template
+
+
+def get_slugs_with_corpora(db: Session) -> Sequence[Row]:
+    """Get slugs along with the corpora of the families they lead to.
+
+    :param Session db: Database session.
+    :return Sequence[Row]: Rows of name, family_document_import_id,
+        family_import_id, collection_import_id and corpus_import_ids.
+    """
+    return db.execute(
+        text(
+            get_query_template(
+                os.path.join("app", "repository", "sql", "slug_index.sql")
+            )
+        )
+    ).all()
@@ -0,0 +1,28 @@
+-- The most recent edit to the data served by the read endpoints, row counts
+-- so that deletes also change the version, and checksums of the corpus and
+-- collection memberships, which have no edit times, so that moving a family
+-- between corpora or collections also changes the version.
+SELECT
+    GREATEST(
+        (SELECT MAX(f.last_modified) FROM family AS f),
+        (SELECT MAX(fd.last_modified) FROM family_document AS fd),
+        (SELECT MAX(fe.last_modified) FROM family_event AS fe),
+        (SELECT MAX(c.last_modified) FROM collection AS c)
+    ) AS last_modified,
+    (SELECT COUNT(*) FROM family) AS family_count,
+    (SELECT COUNT(*) FROM family_document) AS family_document_count,
+    (SELECT COUNT(*) FROM family_event) AS family_event_count,
+    (SELECT COUNT(*) FROM collection) AS collection_count,
+    (SELECT COUNT(*) FROM slug) AS slug_count,
+    (
+        SELECT COALESCE(
+            SUM(HASHTEXT(fc.family_import_id || ':' || fc.corpus_import_id)), 0
+        )
+        FROM family_corpus AS fc
+    ) AS family_corpus_checksum,
+    (
+        SELECT COALESCE(
+            SUM(HASHTEXT(cf.collection_import_id || ':' || cf.family_import_id)), 0
+        )
+        FROM collection_family AS cf
+    ) AS collection_family_checksum;
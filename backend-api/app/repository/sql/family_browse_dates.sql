@@ -0,0 +1,136 @@
+-- noqa: disable=all
+-- Browse sort dates for every family, so browse can order by an index rather
+-- than unpacking each family's event metadata per query.
+--
+-- The dates are kept up to date by triggers on `family` and `family_event`,
+-- in the same transaction as each write, so they are never older than the
+-- family data. This is a migration for the navigator-db-client schema, and
+-- is not run by the API. Until it is part of the db-client migrations, apply
+-- it with `python scripts/family_browse_dates.py create`. It can be re-run,
+-- and recomputes the dates of every family when it is.
+
+-- Replaces the materialised view the dates were first kept in
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM pg_matviews WHERE matviewname = 'family_browse_dates'
+    ) THEN
+        DROP MATERIALIZED VIEW family_browse_dates;
+    END IF;
+END
+$$;
+
+-- The dates computed from the family and event tables
+CREATE OR REPLACE VIEW family_browse_dates_source AS
+SELECT
+    f.import_id AS family_import_id,
+    (
+        SELECT MIN(fe.date)
+        FROM family_event AS fe
+        WHERE fe.family_import_id = f.import_id
+        AND EXISTS (
+            SELECT 1
+            FROM jsonb_array_elements_text(
+                fe.valid_metadata::jsonb -> 'datetime_event_name'
+            ) AS datetime_event_name
+            WHERE datetime_event_name = fe.event_type_name
+        )
+    ) AS published_date,
+    (
+        SELECT MAX(fe.date)
+        FROM family_event AS fe
+        WHERE fe.family_import_id = f.import_id
+    ) AS last_updated_date
+FROM family AS f;
+
+CREATE TABLE IF NOT EXISTS family_browse_dates (
+    family_import_id TEXT PRIMARY KEY,
+    published_date TIMESTAMPTZ,
+    last_updated_date TIMESTAMPTZ
+);
+
+CREATE INDEX IF NOT EXISTS family_browse_dates_published_date_idx
+ON family_browse_dates (published_date DESC);
+
+CREATE INDEX IF NOT EXISTS family_browse_dates_last_updated_date_idx
+ON family_browse_dates (last_updated_date DESC);
+
+-- Recompute the dates of one family, or remove them if it has been deleted
+CREATE OR REPLACE FUNCTION update_family_browse_dates(changed_family_import_id TEXT)
+RETURNS VOID AS $$
+BEGIN
+    -- Serialise the updates for a family, so that concurrent writes to its
+    -- events each recompute the dates with the other's changes
+    PERFORM pg_advisory_xact_lock(
+        hashtext('family_browse_dates'), hashtext(changed_family_import_id)
+    );
+
+    DELETE FROM family_browse_dates
+    WHERE family_import_id = changed_family_import_id
+    AND NOT EXISTS (SELECT 1 FROM family WHERE import_id = changed_family_import_id);
+
+    INSERT INTO family_browse_dates (
+        family_import_id, published_date, last_updated_date
+    )
+    SELECT family_import_id, published_date, last_updated_date
+    FROM family_browse_dates_source
+    WHERE family_import_id = changed_family_import_id
+    ON CONFLICT (family_import_id) DO UPDATE SET
+        published_date = EXCLUDED.published_date,
+        last_updated_date = EXCLUDED.last_updated_date;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION family_browse_dates_family_trigger()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        PERFORM update_family_browse_dates(OLD.import_id);
+    ELSE
+        PERFORM update_family_browse_dates(NEW.import_id);
+    END IF;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION family_browse_dates_family_event_trigger()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP <> 'INSERT' THEN
+        PERFORM update_family_browse_dates(OLD.family_import_id);
+    END IF;
+    IF TG_OP = 'INSERT' THEN
+        PERFORM update_family_browse_dates(NEW.family_import_id);
+    ELSIF TG_OP = 'UPDATE' THEN
+        IF NEW.family_import_id <> OLD.family_import_id THEN
+            PERFORM update_family_browse_dates(NEW.family_import_id);
+        END IF;
+    END IF;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+-- The triggers are created before the dates are recomputed below. Creating
+-- them locks out writes to the tables until this transaction commits, so no
+-- write is missed in between.
+DROP TRIGGER IF EXISTS family_browse_dates_family ON family;
+CREATE TRIGGER family_browse_dates_family
+AFTER INSERT OR DELETE ON family
+FOR EACH ROW EXECUTE FUNCTION family_browse_dates_family_trigger();
+
+DROP TRIGGER IF EXISTS family_browse_dates_family_event ON family_event;
+CREATE TRIGGER family_browse_dates_family_event
+AFTER INSERT OR UPDATE OR DELETE ON family_event
+FOR EACH ROW EXECUTE FUNCTION family_browse_dates_family_event_trigger();
+
+INSERT INTO family_browse_dates (family_import_id, published_date, last_updated_date)
+SELECT family_import_id, published_date, last_updated_date
+FROM family_browse_dates_source
+ON CONFLICT (family_import_id) DO UPDATE SET
+    published_date = EXCLUDED.published_date,
+    last_updated_date = EXCLUDED.last_updated_date;
+
+DELETE FROM family_browse_dates AS fbd
+WHERE NOT EXISTS (
+    SELECT 1 FROM family AS f WHERE f.import_id = fbd.family_import_id
+);
@@ -272,6 +272,29 @@ LEFT JOIN event_dates AS fp ON f.import_id = fp.family_import_id
 WHERE
     d.document_status != 'DELETED'
     AND fg.family_import_id = f.import_id
+    -- Only documents changed since the watermark, if one is given
+    AND (
+        CAST(:changed_since AS TIMESTAMPTZ) IS NULL
+        OR d.last_modified >= CAST(:changed_since AS TIMESTAMPTZ)
+        OR f.last_modified >= CAST(:changed_since AS TIMESTAMPTZ)
+        OR EXISTS (
+            SELECT 1
+            FROM family_event AS fe
+            WHERE
+                fe.family_import_id = f.import_id
+                AND fe.last_modified >= CAST(:changed_since AS TIMESTAMPTZ)
+        )
+        OR EXISTS (
+            SELECT 1
+            FROM slug AS s
+            WHERE
+                (
+                    s.family_document_import_id = d.import_id
+                    OR s.family_import_id = f.import_id
+                )
+                AND s.created >= CAST(:changed_since AS TIMESTAMPTZ)
+        )
+    )
 ORDER BY
     d.last_modified DESC,
     d.created DESC,
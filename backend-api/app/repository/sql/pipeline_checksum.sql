@@ -0,0 +1,59 @@
+-- Checksums of the exported data that has no edit times, so an incremental
+-- export can tell whether any of it has changed since the last export.
+SELECT
+    CONCAT_WS(
+        ':',
+        (
+            SELECT COALESCE(SUM(HASHTEXT(CONCAT_WS(':', fm.family_import_id, fm.value))), 0)
+            FROM family_metadata AS fm
+        ),
+        (
+            SELECT COALESCE(
+                SUM(HASHTEXT(CONCAT_WS(':', fg.family_import_id, fg.geography_id))), 0
+            )
+            FROM family_geography AS fg
+        ),
+        (
+            SELECT COALESCE(
+                SUM(HASHTEXT(CONCAT_WS(':', g.id, g.value, g.display_value))), 0
+            )
+            FROM geography AS g
+        ),
+        (
+            SELECT COALESCE(
+                SUM(HASHTEXT(CONCAT_WS(':', fc.family_import_id, fc.corpus_import_id))), 0
+            )
+            FROM family_corpus AS fc
+        ),
+        (
+            SELECT COALESCE(
+                SUM(
+                    HASHTEXT(
+                        CONCAT_WS(':', c.import_id, c.corpus_type_name, c.organisation_id)
+                    )
+                ),
+                0
+            )
+            FROM corpus AS c
+        ),
+        (
+            SELECT COALESCE(SUM(HASHTEXT(CONCAT_WS(':', o.id, o.name))), 0)
+            FROM organisation AS o
+        ),
+        (
+            SELECT COALESCE(
+                SUM(HASHTEXT(CONCAT_WS(':', p.id, p.title, p.source_url))), 0
+            )
+            FROM physical_document AS p
+        ),
+        (
+            SELECT COALESCE(
+                SUM(HASHTEXT(CONCAT_WS(':', pdl.document_id, pdl.language_id))), 0
+            )
+            FROM physical_document_language AS pdl
+        ),
+        (
+            SELECT COALESCE(SUM(HASHTEXT(CONCAT_WS(':', l.id, l.name))), 0)
+            FROM language AS l
+        )
+    ) AS checksum
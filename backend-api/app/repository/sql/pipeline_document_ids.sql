@@ -0,0 +1,19 @@
+-- The documents exported by pipeline.sql, without their content. Keep the
+-- joins and filters in step with pipeline.sql.
+SELECT d.import_id AS family_document_import_id
+FROM
+    family_document AS d
+INNER JOIN physical_document AS p ON d.physical_document_id = p.id
+INNER JOIN family AS f ON d.family_import_id = f.import_id
+INNER JOIN family_corpus AS fc ON f.import_id = fc.family_import_id
+INNER JOIN corpus AS c ON fc.corpus_import_id = c.import_id
+INNER JOIN organisation AS o ON c.organisation_id = o.id
+INNER JOIN family_metadata AS fm ON f.import_id = fm.family_import_id
+WHERE
+    d.document_status != 'DELETED'
+    AND EXISTS (
+        SELECT 1
+        FROM family_geography AS fg
+        WHERE fg.family_import_id = f.import_id
+    )
+ORDER BY d.import_id
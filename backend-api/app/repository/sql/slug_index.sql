@@ -0,0 +1,26 @@
+-- Every slug, with the corpora of the families it leads to. For collection
+-- slugs, these are the corpora of the families in the collection.
+SELECT
+    slug.name,
+    slug.family_document_import_id,
+    slug.family_import_id,
+    slug.collection_import_id,
+    ARRAY_REMOVE(
+        ARRAY_AGG(DISTINCT family_corpus.corpus_import_id), NULL
+    ) AS corpus_import_ids
+FROM slug
+    LEFT JOIN family_document
+        ON slug.family_document_import_id = family_document.import_id
+    LEFT JOIN collection_family
+        ON slug.collection_import_id = collection_family.collection_import_id
+    LEFT JOIN family_corpus
+        ON family_corpus.family_import_id = COALESCE(
+            slug.family_import_id,
+            family_document.family_import_id,
+            collection_family.family_import_id
+        )
+GROUP BY
+    slug.name,
+    slug.family_document_import_id,
+    slug.family_import_id,
+    slug.collection_import_id
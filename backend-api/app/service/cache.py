@@ -0,0 +1,301 @@
+"""In-process caching helpers shared by the service layer.
+
+The API runs several uvicorn workers, each with its own memory, so these caches
+are per worker. They are intended for data that only changes when new content
+is ingested, where serving a slightly stale value is acceptable.
+"""
+
+import logging
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import (
+    Any,
+    Callable,
+    Generic,
+    Hashable,
+    Optional,
+    Protocol,
+    TypeVar,
+    cast,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+V = TypeVar("V")
+
+
+class CacheBackend(Protocol):
+    """The storage interface a cache needs to provide."""
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the value for a key, or None if missing or expired."""
+        ...
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value against a key."""
+        ...
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        ...
+
+
+class InMemoryCacheBackend(Generic[V]):
+    """A bounded, thread-safe LRU cache whose entries expire after a TTL.
+
+    :param int max_entries: The maximum number of entries to hold. The
+        least recently used entry is evicted when this is exceeded.
+    :param float ttl_seconds: How long an entry is valid for after being
+        set.
+    :param Callable[[], float] clock: Monotonic clock, overridable in tests.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[V]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if self._clock() >= expires_at:
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: V) -> None:
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def values(self) -> list[V]:
+        """Return the values of all unexpired entries."""
+        with self._lock:
+            now = self._clock()
+            return [
+                value
+                for expires_at, value in self._entries.values()
+                if now < expires_at
+            ]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+def _run_in_daemon_thread(func: Callable[[], None]) -> None:
+    threading.Thread(target=func, daemon=True).start()
+
+
+class RefreshingValue(Generic[V]):
+    """A single loaded value that is refreshed in the background when stale.
+
+    The first `get` loads the value synchronously. After that, once the value
+    is older than `refresh_seconds`, `get` keeps returning it while a single
+    background refresh runs (stale-while-revalidate). If a refresh fails, the
+    last good value is kept and the refresh is retried after another interval.
+
+    :param Callable[[], V] loader: Loads a fresh value.
+    :param float refresh_seconds: How long a value is fresh for.
+    :param str name: Used to identify the value in logs.
+    :param Callable[[], float] clock: Monotonic clock, overridable in tests.
+    :param Callable[[Callable[[], None]], None] run_in_background: Starts a
+        background refresh, overridable in tests to run synchronously.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[], V],
+        refresh_seconds: float,
+        name: str = "value",
+        clock: Callable[[], float] = time.monotonic,
+        run_in_background: Callable[[Callable[[], None]], None] = _run_in_daemon_thread,
+    ) -> None:
+        self._loader = loader
+        self.refresh_seconds = refresh_seconds
+        self.name = name
+        self._clock = clock
+        self._run_in_background = run_in_background
+        self._value: Optional[V] = None
+        self._loaded_at: Optional[float] = None
+        self._refreshing = False
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+
+    def get(self) -> V:
+        """Return the current value, loading it first if there is none yet.
+
+        :raises Exception: if there is no value yet and it fails to load.
+        :return V: The current, possibly stale, value.
+        """
+        with self._lock:
+            has_value = self._loaded_at is not None
+            start_refresh = (
+                has_value
+                and not self._refreshing
+                and self._clock() - cast(float, self._loaded_at) >= self.refresh_seconds
+            )
+            if start_refresh:
+                self._refreshing = True
+
+        if not has_value:
+            return self.refresh()
+
+        if start_refresh:
+            self._run_in_background(self._background_refresh)
+
+        return cast(V, self._value)
+
+    def peek(self) -> Optional[V]:
+        """Return the current value without loading or refreshing it."""
+        return self._value
+
+    def mark_stale(self) -> None:
+        """Make the next `get` start a background refresh.
+
+        The current value is still served until the refresh completes.
+        """
+        with self._lock:
+            if self._loaded_at is not None:
+                self._loaded_at = self._clock() - self.refresh_seconds
+
+    def refresh(self) -> V:
+        """Load a fresh value now.
+
+        Concurrent callers share a single load.
+
+        :raises Exception: if the load fails and there is no previous value.
+        :return V: The fresh value, or the last good one if the load failed.
+        """
+        loaded_at = self._loaded_at
+        with self._load_lock:
+            # Someone else loaded it while we were waiting
+            if self._loaded_at is not None and self._loaded_at != loaded_at:
+                return cast(V, self._value)
+
+            try:
+                value = self._loader()
+            except Exception:
+                if self._loaded_at is None:
+                    raise
+                _LOGGER.exception(f"Failed to refresh {self.name}, keeping last value")
+                with self._lock:
+                    self._loaded_at = self._clock()
+                return cast(V, self._value)
+
+            with self._lock:
+                self._value = value
+                self._loaded_at = self._clock()
+            return value
+
+    def _background_refresh(self) -> None:
+        try:
+            self.refresh()
+        except Exception:
+            _LOGGER.exception(f"Failed to refresh {self.name}")
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+
+class VersionedRefreshingCache(Generic[V]):
+    """A `RefreshingValue` per key, all marked stale when the data version changes.
+
+    Each key's value is loaded on first request, then refreshed in the
+    background when it is older than `refresh_seconds` or a new data version
+    is seen. The previous value is served while a refresh runs.
+
+    :param Callable[[Hashable], V] loader: Loads a fresh value for a key.
+    :param Callable[[], Optional[str]] version_provider: Returns the current
+        data version, e.g. the latest ingest cycle. It is called on every
+        `get`, so must be cheap.
+    :param int max_entries: The maximum number of keys to hold.
+    :param float refresh_seconds: How long loaded values are fresh for.
+    :param str name: Used to identify the values in logs.
+    :param Callable[[Callable[[], None]], None] run_in_background: Starts a
+        background refresh, overridable in tests to run synchronously.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[Hashable], V],
+        version_provider: Callable[[], Optional[str]],
+        max_entries: int = 100,
+        refresh_seconds: float = 3600,
+        name: str = "value",
+        run_in_background: Callable[[Callable[[], None]], None] = _run_in_daemon_thread,
+    ) -> None:
+        self._loader = loader
+        self.refresh_seconds = refresh_seconds
+        self.name = name
+        self._run_in_background = run_in_background
+        self._values: InMemoryCacheBackend[RefreshingValue[V]] = InMemoryCacheBackend(
+            max_entries=max_entries, ttl_seconds=math.inf
+        )
+        self._version_provider = version_provider
+        self._seen_version: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> V:
+        """Get the value for a key.
+
+        :param Hashable key: The key to get the value for.
+        :raises Exception: if the value is not loaded yet and fails to load.
+        :return V: The current, possibly stale, value.
+        """
+        self._check_version()
+
+        with self._lock:
+            value = self._values.get(key)
+            if value is None:
+                value = RefreshingValue(
+                    loader=lambda: self._loader(key),
+                    refresh_seconds=self.refresh_seconds,
+                    name=self.name,
+                    run_in_background=self._run_in_background,
+                )
+                self._values.set(key, value)
+
+        return value.get()
+
+    def _check_version(self) -> None:
+        try:
+            version = self._version_provider()
+        except Exception as e:
+            _LOGGER.warning(f"Could not determine {self.name} version: {e}")
+            return
+
+        with self._lock:
+            if version == self._seen_version:
+                return
+            if self._seen_version is not None:
+                _LOGGER.info(
+                    f"{self.name} version changed, refreshing",
+                    extra={"props": {"old": self._seen_version, "new": version}},
+                )
+                for value in self._values.values():
+                    value.mark_stale()
+            self._seen_version = version
@@ -0,0 +1,139 @@
+"""Conditional GET support for the read endpoints.
+
+Responses carry an ETag. Clients and the CDN send it back as If-None-Match,
+and get an empty 304 Not Modified if nothing has changed.
+
+Responses don't carry a Last-Modified date, and If-Modified-Since is not
+answered. The latest edit time doesn't change when data is deleted, so it
+can't tell that a response has changed.
+"""
+
+import hashlib
+from typing import Optional, Sequence, Union
+
+from fastapi import Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.clients.db.session import is_read_replica_session
+from app.service.data_version import DataVersion, DataVersionTracker
+
+# Caches may store responses, but must revalidate them before reuse.
+CACHE_CONTROL = "no-cache"
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header matches an ETag, using weak comparison.
+
+    :param Optional[str] if_none_match: The If-None-Match header, if sent.
+    :param str etag: The current ETag of the resource.
+    :return bool: True if the client's copy is current.
+    """
+    if if_none_match is None:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (candidate.strip() for candidate in if_none_match.split(","))
+    return etag.removeprefix("W/") in (
+        candidate.removeprefix("W/") for candidate in candidates
+    )
+
+
+def content_etag(content: bytes) -> str:
+    """Create a strong ETag from the content of a response.
+
+    :param bytes content: The serialised response.
+    :return str: The quoted ETag.
+    """
+    return f'"{hashlib.sha256(content).hexdigest()[:32]}"'
+
+
+def data_version_etag(
+    data_version: DataVersion,
+    request: Request,
+    allowed_corpora: Sequence[str],
+    variant: str = "",
+) -> str:
+    """Create an ETag for a response computed from the family data.
+
+    The ETag covers the data version, the requested URL and the caller's
+    allowed corpora, so it changes whenever the response could.
+
+    :param DataVersion data_version: The current data version.
+    :param Request request: The request being responded to.
+    :param Sequence[str] allowed_corpora: The caller's allowed corpora.
+    :param str variant: Anything else the response depends on.
+    :return str: The quoted ETag.
+    """
+    key = "\n".join(
+        [
+            data_version.version,
+            request.url.path,
+            "&".join(sorted(str(request.query_params).split("&"))),
+            ",".join(sorted(set(allowed_corpora))),
+            variant,
+        ]
+    )
+    return content_etag(key.encode("utf-8"))
+
+
+def check_not_modified(
+    request: Request, response: Response, etag: str
+) -> Optional[Response]:
+    """Answer a conditional request, or add the validators to the response.
+
+    :param Request request: The request being responded to.
+    :param Response response: The response the endpoint will return, which
+        the validators are added to.
+    :param str etag: The current ETag of the resource.
+    :return Optional[Response]: A 304 response if the client's copy is
+        current, otherwise None.
+    """
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
+    return None
+
+
+def check_data_not_modified(
+    request: Request,
+    response: Response,
+    data_version_tracker: Optional[DataVersionTracker],
+    allowed_corpora: Sequence[str],
+    db: Union[Session, AsyncSession],
+    variant: str = "",
+) -> Optional[Response]:
+    """Answer a conditional request using the data version.
+
+    Call this before running any queries, so unchanged responses skip them.
+    Conditional requests are not supported if there is no data version.
+
+    The version is read from the same database as the response body, so a
+    response read from a lagging replica never gets the primary's newer
+    version.
+
+    :param Request request: The request being responded to.
+    :param Response response: The response the endpoint will return, which
+        the validators are added to.
+    :param Optional[DataVersionTracker] data_version_tracker: Provides the
+        current data version.
+    :param Sequence[str] allowed_corpora: The caller's allowed corpora.
+    :param Union[Session, AsyncSession] db: The session the response is
+        read with.
+    :param str variant: Anything else the response depends on.
+    :return Optional[Response]: A 304 response if the client's copy is
+        current, otherwise None.
+    """
+    if data_version_tracker is None:
+        return None
+    data_version = data_version_tracker.current(on_replica=is_read_replica_session(db))
+    if data_version is None:
+        return None
+
+    return check_not_modified(
+        request,
+        response,
+        data_version_etag(data_version, request, allowed_corpora, variant),
+    )
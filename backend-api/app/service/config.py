@@ -1,7 +1,7 @@
-from typing import Any, Mapping, cast
+from typing import Mapping, cast
 
 from db_client.models.dfce.family import FamilyCategory
-from db_client.models.organisation import Corpus
+from db_client.models.organisation import Corpus, CorpusType, Organisation
 from sqlalchemy.orm import Session
 
 from app import config
@@ -10,46 +10,33 @@ from app.repository import corpus_type as corpus_type_repo
 from app.repository import organisation as org_repo
 from app.repository.corpus import (
     get_allowed_corpora,
-    get_family_count_by_category_per_corpus,
-    get_total_families_per_corpus,
+    get_family_count_by_category_per_corpora,
 )
 
 
-def _get_family_stats_per_corpus(db: Session, corpus_import_id: str) -> dict[str, Any]:
+def _to_count_by_category(
+    found_categories: Mapping[FamilyCategory, int],
+) -> dict[str, int]:
     """
-    Get family statistics per corpus.
+    Get the family count for every category, supplying zeros when there aren't any.
 
-    :param Session db: Database session
-    :param str corpus_import_id: The import ID of the corpus
-    :return dict[str, Any]: A dictionary containing total families and count by category
+    :param Mapping[FamilyCategory, int] found_categories: The counts of the
+        categories found in a corpus
+    :return dict[str, int]: The count of families for each category value
     """
-    total = get_total_families_per_corpus(db, corpus_import_id)
-
-    counts = get_family_count_by_category_per_corpus(db, corpus_import_id)
-    found_categories = {c[0].value: c[1] for c in counts}
-    count_by_category = {}
-
-    # Supply zeros when there aren't any
-    for category in [e.value for e in FamilyCategory]:
-        if category in found_categories.keys():
-            count_by_category[category] = found_categories[category]
-        else:
-            count_by_category[category] = 0
+    return {
+        category.value: found_categories.get(category, 0) for category in FamilyCategory
+    }
 
-    return {"total": total, "count_by_category": count_by_category}
 
-
-def _to_corpus_type_config(db: Session, corpus: Corpus) -> CorpusTypeConfig:
+def _to_corpus_type_config(corpus_type: CorpusType) -> CorpusTypeConfig:
     """
     Get configuration for a corpus type.
 
-    :param Session db: Database session
-    :param Corpus corpus: Corpus object
+    :param CorpusType corpus_type: CorpusType object
     :return CorpusTypeConfig: A dictionary containing CorpusTypeConfig for a single corpus type
     without the related corpora
     """
-    corpus_type = corpus_type_repo.get(db, str(corpus.corpus_type_name))
-
     return CorpusTypeConfig(
         corpus_type_name=str(corpus_type.name),
         corpus_type_description=str(corpus_type.description),
@@ -58,15 +45,21 @@ def _to_corpus_type_config(db: Session, corpus: Corpus) -> CorpusTypeConfig:
     )
 
 
-def _to_corpus_config(db, corpus) -> CorpusConfig:
+def _to_corpus_config(
+    corpus: Corpus,
+    organisation: Organisation,
+    found_categories: Mapping[FamilyCategory, int],
+) -> CorpusConfig:
     """
     Convert corpus, organisation, and stats to CorpusConfig.
 
     :param Corpus corpus: A Corpus object
+    :param Organisation organisation: The organisation that owns the corpus
+    :param Mapping[FamilyCategory, int] found_categories: The counts of the
+        published families in the corpus by category
     :return CorpusConfig: An object containing config for a specific corpus
     """
-    stats = _get_family_stats_per_corpus(db, str(corpus.import_id))
-    organisation = org_repo.get(db, int(str(corpus.organisation_id)))
+    count_by_category = _to_count_by_category(found_categories)
     image_url = (
         f"https://{config.CDN_DOMAIN}/{corpus.corpus_image_url}"
         if corpus.corpus_image_url is not None and len(str(corpus.corpus_image_url)) > 0
@@ -82,8 +75,8 @@ def _to_corpus_config(db, corpus) -> CorpusConfig:
         image_url=image_url,
         organisation_id=int(str(organisation.id)),
         organisation_name=str(organisation.name),
-        total=stats["total"],
-        count_by_category=stats["count_by_category"],
+        total=sum(count_by_category.values()),
+        count_by_category=count_by_category,
     )
 
 
@@ -93,21 +86,38 @@ def get_corpus_type_config_for_allowed_corpora(
     """
     Get CorpusTypeConfig for allowed corpora.
 
+    The corpus types, organisations and family counts for all the corpora are
+    each loaded in a single query.
+
     :param Session db: Database session
     :param list[str] allowed_corpora: A list of allowed corpora
     :return CorpusTypeConfig: A mapping of CorpusTypeConfig for allowed corpora
     """
     corpora = get_allowed_corpora(db, allowed_corpora)
 
+    corpus_types = corpus_type_repo.get_by_names(
+        db, sorted({str(corpus.corpus_type_name) for corpus in corpora})
+    )
+    organisations = org_repo.get_by_ids(
+        db, sorted({int(str(corpus.organisation_id)) for corpus in corpora})
+    )
+    family_counts = get_family_count_by_category_per_corpora(
+        db, [str(corpus.import_id) for corpus in corpora]
+    )
+
     corpus_type_config = {}
 
     for corpus in corpora:
         if corpus.corpus_type_name not in corpus_type_config:
             corpus_type_config[corpus.corpus_type_name] = _to_corpus_type_config(
-                db, corpus
+                corpus_types[str(corpus.corpus_type_name)]
             )
     for corpus in corpora:
-        new_corpus = _to_corpus_config(db, corpus)
+        new_corpus = _to_corpus_config(
+            corpus,
+            organisations[int(str(corpus.organisation_id))],
+            family_counts.get(str(corpus.import_id), {}),
+        )
         corpus_type_config[corpus.corpus_type_name].corpora.append(new_corpus)
 
     return corpus_type_config
@@ -0,0 +1,146 @@
+"""In-process snapshots of the application config.
+
+The config is assembled from the geographies, languages, variants and corpora,
+which only change when data is ingested or edited in the admin service. Each
+allowed corpora set's config is built once, with an ETag over its content, and
+refreshed in the background when stale or when a new data version is seen.
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Hashable, Optional, cast
+
+from fastapi import Request
+from sqlalchemy.orm import Session
+
+from app.clients.db.session import SessionLocal
+from app.config import (
+    CONFIG_CACHE_ENABLED,
+    CONFIG_CACHE_MAX_ENTRIES,
+    CONFIG_CACHE_REFRESH_SECONDS,
+    CONFIG_CACHE_VERSION_CHECK_SECONDS,
+)
+from app.models.config import ApplicationConfig
+from app.repository.lookups import get_config
+from app.service.cache import VersionedRefreshingCache, _run_in_daemon_thread
+from app.service.conditional_get import content_etag
+from app.service.json_response import model_to_json
+from app.service.data_version import DataVersionTracker
+from app.service.util import get_cache_version_provider
+
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """The config for a set of allowed corpora, with an ETag over its content."""
+
+    config: ApplicationConfig
+    content: bytes
+    etag: str
+
+
+def make_config_snapshot(config: ApplicationConfig) -> ConfigSnapshot:
+    """Create a snapshot of a config, computing its ETag.
+
+    :param ApplicationConfig config: The config to snapshot.
+    :return ConfigSnapshot: The config, serialised, and a strong ETag for it.
+    """
+    content = model_to_json(config)
+    return ConfigSnapshot(config=config, content=content, etag=content_etag(content))
+
+
+def _corpora_key(allowed_corpora: list[str]) -> tuple[str, ...]:
+    return tuple(sorted(set(allowed_corpora)))
+
+
+class ConfigCache:
+    """Holds a config snapshot for each set of allowed corpora.
+
+    :param Callable[[], Session] session_factory: Creates a DB session for
+        building the config.
+    :param Callable[[], Optional[str]] version_provider: Returns the current
+        data version.
+    :param int max_entries: The maximum number of corpora sets to hold.
+    :param float refresh_seconds: How long a snapshot is fresh for. This
+        bounds how long edits to corpora, organisations and taxonomies take
+        to show, as they don't change the data version.
+    :param Callable[[Callable[[], None]], None] run_in_background: Starts a
+        background refresh, overridable in tests to run synchronously.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        version_provider: Callable[[], Optional[str]],
+        max_entries: int = 100,
+        refresh_seconds: float = 900,
+        run_in_background: Callable[[Callable[[], None]], None] = _run_in_daemon_thread,
+    ) -> None:
+        self._session_factory = session_factory
+        self._snapshots: VersionedRefreshingCache[ConfigSnapshot] = (
+            VersionedRefreshingCache(
+                loader=self._load,
+                version_provider=version_provider,
+                max_entries=max_entries,
+                refresh_seconds=refresh_seconds,
+                name="config",
+                run_in_background=run_in_background,
+            )
+        )
+
+    def get(self, allowed_corpora: list[str]) -> ConfigSnapshot:
+        """Get the config snapshot for a set of allowed corpora.
+
+        :param list[str] allowed_corpora: The corpora the config is for.
+        :raises Exception: if the config is not built yet and fails to build.
+        :return ConfigSnapshot: The current, possibly stale, config snapshot.
+        """
+        return self._snapshots.get(_corpora_key(allowed_corpora))
+
+    def _load(self, allowed_corpora: Hashable) -> ConfigSnapshot:
+        db = self._session_factory()
+        try:
+            return make_config_snapshot(
+                get_config(db, list(cast(tuple[str, ...], allowed_corpora)))
+            )
+        finally:
+            db.close()
+
+
+def make_config_cache(
+    data_version_tracker: Optional[DataVersionTracker] = None,
+) -> Optional[ConfigCache]:
+    """Create the config cache if it is enabled in config.
+
+    :param Optional[DataVersionTracker] data_version_tracker: Provides the
+        data version the config is rebuilt on.
+    """
+    if not CONFIG_CACHE_ENABLED:
+        return None
+
+    return ConfigCache(
+        session_factory=SessionLocal,
+        version_provider=get_cache_version_provider(
+            data_version_tracker, CONFIG_CACHE_VERSION_CHECK_SECONDS
+        ),
+        max_entries=CONFIG_CACHE_MAX_ENTRIES,
+        refresh_seconds=CONFIG_CACHE_REFRESH_SECONDS,
+    )
+
+
+def get_config_cache(request: Request) -> Optional[ConfigCache]:
+    return getattr(request.app.state, "config_cache", None)
+
+
+def get_config_snapshot(
+    db: Session, allowed_corpora: list[str], cache: Optional[ConfigCache] = None
+) -> ConfigSnapshot:
+    """Get the config snapshot for a set of allowed corpora.
+
+    :param Session db: The database session, used when there is no cache.
+    :param list[str] allowed_corpora: The corpora the config is for.
+    :param Optional[ConfigCache] cache: Serves the config without querying
+        the database when given.
+    :return ConfigSnapshot: The config and its ETag.
+    """
+    if cache is not None:
+        return cache.get(allowed_corpora)
+    return make_config_snapshot(get_config(db, allowed_corpora))
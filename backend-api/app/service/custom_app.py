@@ -1,7 +1,8 @@
 import logging
 import os
+import time
 from datetime import datetime
-from typing import Optional, cast
+from typing import Callable, Collection, Optional
 
 import jwt
 from dateutil.relativedelta import relativedelta
@@ -12,13 +13,110 @@ from pydantic_core import Url
 from sqlalchemy import distinct, select
 from sqlalchemy.orm import Session
 
+from app.clients.db.session import SessionLocal
+from app.config import (
+    APP_TOKEN_CACHE_ENABLED,
+    APP_TOKEN_CACHE_MAX_ENTRIES,
+    APP_TOKEN_CACHE_TTL_SECONDS,
+    CORPUS_IDS_REFRESH_SECONDS,
+)
 from app.models.custom_app import CustomAppConfigDTO
 from app.service import security
+from app.service.cache import InMemoryCacheBackend, RefreshingValue
 
 _LOGGER = logging.getLogger(__name__)
 TOKEN_SECRET_KEY = os.environ["TOKEN_SECRET_KEY"]
 
 
+def _get_corpus_ids_from_db(db: Session) -> frozenset[str]:
+    return frozenset(db.scalars(select(distinct(Corpus.import_id))).all())
+
+
+class AppTokenCache:
+    """Caches decoded app tokens and the set of corpus IDs in the DB.
+
+    App tokens and corpora are only created occasionally, but every request
+    that takes an app token needs both. Decoded tokens are held until they
+    expire (or the cache TTL passes, if sooner), and the corpus IDs are
+    refreshed in the background.
+
+    :param int max_entries: The maximum number of decoded tokens to hold.
+    :param float ttl_seconds: How long to hold a decoded token for.
+    :param Callable[[], frozenset[str]] corpus_ids_loader: Loads the corpus
+        import IDs from the DB.
+    :param float corpus_ids_refresh_seconds: How often to refresh the corpus
+        import IDs.
+    :param Callable[[], float] clock: Wall clock used to check token expiry,
+        overridable in tests.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        corpus_ids_loader: Callable[[], frozenset[str]],
+        corpus_ids_refresh_seconds: float,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._decoded_tokens: InMemoryCacheBackend[dict] = InMemoryCacheBackend(
+            max_entries=max_entries, ttl_seconds=ttl_seconds
+        )
+        self._corpus_ids = RefreshingValue(
+            loader=corpus_ids_loader,
+            refresh_seconds=corpus_ids_refresh_seconds,
+            name="corpus IDs",
+        )
+        self._clock = clock
+
+    def get_decoded_token(self, token: str) -> Optional[dict]:
+        """Get the claims of a previously decoded token, if it has not expired.
+
+        :param str token: The encoded app token.
+        :return Optional[dict]: A copy of the decoded claims, or None.
+        """
+        decoded_token = self._decoded_tokens.get(token)
+        if decoded_token is None:
+            return None
+
+        # Expired tokens must be decoded again so the usual error is raised
+        expiry = decoded_token.get("exp")
+        if expiry is not None and expiry <= self._clock():
+            return None
+        return dict(decoded_token)
+
+    def set_decoded_token(self, token: str, decoded_token: dict) -> None:
+        self._decoded_tokens.set(token, dict(decoded_token))
+
+    def corpus_ids(self) -> frozenset[str]:
+        """Get the corpus import IDs in the DB, which may be slightly stale."""
+        return self._corpus_ids.get()
+
+
+def _load_corpus_ids() -> frozenset[str]:
+    db = SessionLocal()
+    try:
+        return _get_corpus_ids_from_db(db)
+    finally:
+        db.close()
+
+
+def make_app_token_cache() -> Optional[AppTokenCache]:
+    """Create the app token cache if it is enabled in config."""
+    if not APP_TOKEN_CACHE_ENABLED:
+        return None
+
+    return AppTokenCache(
+        max_entries=APP_TOKEN_CACHE_MAX_ENTRIES,
+        ttl_seconds=APP_TOKEN_CACHE_TTL_SECONDS,
+        corpus_ids_loader=_load_corpus_ids,
+        corpus_ids_refresh_seconds=CORPUS_IDS_REFRESH_SECONDS,
+    )
+
+
+def get_app_token_cache(request: Request) -> Optional[AppTokenCache]:
+    return getattr(request.app.state, "app_token_cache", None)
+
+
 class AppTokenFactory:
     def __init__(self) -> None:
         # TODO: revisit/configure access token expiry
@@ -123,21 +221,37 @@ class AppTokenFactory:
             origin = Url(origin).host
         return origin
 
-    def verify_corpora_in_db(self, db: Session, any_exist: bool = True) -> bool:
+    def verify_corpora_in_db(
+        self,
+        db: Session,
+        any_exist: bool = True,
+        cache: Optional[AppTokenCache] = None,
+    ) -> bool:
         """Validate given corpus IDs against the existing corpora in DB.
 
+        If a cache is given, its corpus IDs are checked first. As these may
+        be slightly stale, the DB is only queried if they fail validation,
+        e.g. because a corpus has just been created.
+
         :param Session db: A session to query against.
         :param bool any_exist: Whether to check any or all corpora are
             valid. True by default.
+        :param Optional[AppTokenCache] cache: Cached corpus IDs to check
+            before querying the DB.
         :return bool: Return whether or not the corpora are valid.
         """
         if self.allowed_corpora_ids is None:
             return False
 
-        corpora_ids_from_db = cast(
-            list, db.scalars(select(distinct(Corpus.import_id))).all()
-        )
+        if cache is not None and self._corpora_exist(cache.corpus_ids(), any_exist):
+            return True
+
+        return self._corpora_exist(_get_corpus_ids_from_db(db), any_exist)
 
+    def _corpora_exist(
+        self, corpora_ids_from_db: Collection[str], any_exist: bool
+    ) -> bool:
+        """Check any or all of the allowed corpora IDs are in the given IDs."""
         if any_exist:
             validate_success = any(
                 corpus in corpora_ids_from_db for corpus in self.allowed_corpora_ids
@@ -175,15 +289,27 @@ class AppTokenFactory:
             )
         return validate_success
 
-    def decode(self, token: str, audience: Optional[str]) -> list[str]:
+    def decode(
+        self,
+        token: str,
+        audience: Optional[str],
+        cache: Optional[AppTokenCache] = None,
+    ) -> list[str]:
         """Decodes a configuration token.
 
         :param str token : A JWT token that has been encoded with a list of
             allowed corpora ids that the custom app should show, an expiry
             date and an issued at date.
         :param Optional[str] audience: An audience to verify against.
+        :param Optional[AppTokenCache] cache: Where previously decoded
+            tokens are held.
         :return list[str]: A decoded list of valid corpora ids.
         """
+        decoded_token = cache.get_decoded_token(token) if cache else None
+        if decoded_token is not None:
+            self._set_claims(decoded_token)
+            return decoded_token  # type: ignore
+
         try:
             decoded_token = jwt.decode(
                 token,
@@ -201,23 +327,41 @@ class AppTokenFactory:
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
-        self.allowed_corpora_ids = decoded_token.get("allowed_corpora_ids")
+        if cache is not None:
+            cache.set_decoded_token(token, decoded_token)
+        self._set_claims(decoded_token)
+
+        return decoded_token
+
+    def _set_claims(self, decoded_token: dict) -> None:
+        allowed_corpora_ids = decoded_token.get("allowed_corpora_ids")
+        # Copied so that callers cannot modify a cached token
+        self.allowed_corpora_ids = (
+            list(allowed_corpora_ids)
+            if isinstance(allowed_corpora_ids, list)
+            else allowed_corpora_ids
+        )
         self.aud = decoded_token.get("aud")
         self.exp = decoded_token.get("exp")
         self.iat = decoded_token.get("iat")
         self.iss = decoded_token.get("iss")
         self.sub = decoded_token.get("sub")
 
-        return decoded_token
-
-    def validate(self, db: Session, any_exist: bool = True) -> None:
+    def validate(
+        self,
+        db: Session,
+        any_exist: bool = True,
+        cache: Optional[AppTokenCache] = None,
+    ) -> None:
         """Validate that any or all corpora IDs exist in the database.
 
         :param Session db: A session to query against.
         :param bool any_exist: Whether to check any or all corpora are
             valid. True by default.
+        :param Optional[AppTokenCache] cache: Cached corpus IDs to check
+            before querying the DB.
         """
-        if not self.verify_corpora_in_db(db, any_exist):
+        if not self.verify_corpora_in_db(db, any_exist, cache):
             msg = "Error verifying corpora IDs."
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -254,11 +398,12 @@ class AppTokenFactory:
             valid. True by default.
         """
         origin = self.get_origin(request)
+        cache = get_app_token_cache(request)
 
         # Decode the app token and validate it.
-        self.decode(token, origin)
+        self.decode(token, origin, cache)
 
         # First corpora validation is app token against DB. At least one of the app token
         # corpora IDs must be present in the DB to continue the search request.
         any_exist = False if not self.allowed_corpora_ids else True
-        self.validate(db, any_exist)
+        self.validate(db, any_exist, cache)
@@ -0,0 +1,278 @@
+"""Background generation of the whole database download.
+
+Building a dump takes minutes, so it is done off the request path. Builds are
+single-flight per (app, ingest cycle): concurrent requests for a dump that is
+being built wait on the in-progress build rather than starting their own.
+
+Dumps that nobody has asked for yet are prebuilt: a dump's other formats, and
+when a request reveals a new ingest cycle, the dumps of every other app that
+has requested one from this worker, so most callers find their dump already in
+S3. Prebuilds are queued separately, so they never delay a requested build.
+
+Locks are held per worker. The S3 object is checked before each build, so a
+dump uploaded by another worker is not rebuilt.
+"""
+
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, replace
+from typing import Callable, Literal, Optional
+
+from fastapi import Request
+from sqlalchemy.orm import Session
+
+from app.clients.aws.client import get_s3_client
+from app.clients.aws.s3_document import S3Document
+from app.clients.db.session import SessionLocal
+from app.config import (
+    AWS_REGION,
+    DATA_DUMP_BUILDER_ENABLED,
+    DATA_DUMP_BUILDER_MAX_WORKERS,
+)
+from app.service.download import (
+    write_data_download_parquet,
+    write_data_download_zip_archive,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_DUMP_S3_PREFIX = "navigator/dumps"
+
+DataDumpFormat = Literal["zip", "parquet"]
+
+_CONTENT_TYPES: dict[str, str] = {
+    "zip": "application/zip",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+
+@dataclass(frozen=True)
+class DataDumpSpec:
+    """Everything needed to build the whole database dump for an app.
+
+    :param Optional[str] app_name: The `sub` of the requesting app token.
+    :param str ingest_cycle_start: The ingest cycle the dump is for.
+    :param tuple[str, ...] allowed_corpora_ids: The corpora to include.
+    :param str url_base: The base of the URLs in the dump.
+    :param str bucket_name: The bucket the dump is uploaded to.
+    :param DataDumpFormat file_format: Either the zip archive of CSV (or XLSX
+        for CCC) and a README, or a single Parquet file.
+    """
+
+    app_name: Optional[str]
+    ingest_cycle_start: str
+    allowed_corpora_ids: tuple[str, ...]
+    url_base: str
+    bucket_name: str
+    file_format: DataDumpFormat = "zip"
+
+    @property
+    def key(self) -> tuple[Optional[str], str, DataDumpFormat]:
+        return (self.app_name, self.ingest_cycle_start, self.file_format)
+
+    @property
+    def theme(self) -> Optional[str]:
+        return self.app_name.lower() if self.app_name else None
+
+    @property
+    def s3_key(self) -> str:
+        return (
+            f"{DATA_DUMP_S3_PREFIX}/{self.app_name}-whole_data_dump-"
+            f"{self.ingest_cycle_start}.{self.file_format}"
+        )
+
+
+def build_data_dump(spec: DataDumpSpec, db: Session) -> None:
+    """Build a dump and upload it to S3.
+
+    Nothing is done if the dump already exists.
+
+    :param DataDumpSpec spec: The dump to build.
+    :param Session db: The session to query against.
+    """
+    s3_client = get_s3_client()
+    s3_document = S3Document(spec.bucket_name, AWS_REGION, spec.s3_key)
+    if s3_client.document_exists(s3_document):
+        return
+
+    _LOGGER.info(
+        f"Generating {spec.app_name} {spec.file_format} dump for ingest cycle "
+        f"w/c {spec.ingest_cycle_start}..."
+    )
+    write_dump = (
+        write_data_download_parquet
+        if spec.file_format == "parquet"
+        else write_data_download_zip_archive
+    )
+    # The dump is streamed into a multipart upload as it is generated, so it
+    # is never held in memory.
+    with s3_client.open_multipart_upload(
+        bucket=spec.bucket_name,
+        key=spec.s3_key,
+        content_type=_CONTENT_TYPES[spec.file_format],
+    ) as upload:
+        write_dump(
+            upload,
+            spec.ingest_cycle_start,
+            list(spec.allowed_corpora_ids),
+            db,
+            spec.theme,
+            spec.url_base,
+        )
+    _LOGGER.info(f"Finished uploading data dump to {spec.bucket_name}")
+
+
+@dataclass(frozen=True)
+class _Build:
+    future: Future
+    prebuild: bool
+
+
+class DataDumpBuilder:
+    """Builds data dumps in background threads, one build per dump at a time.
+
+    Requested dumps and prebuilds have separate queues. Prebuilds are built
+    one at a time, and a queued prebuild that is then requested is moved to
+    the requested queue.
+
+    :param Callable[[], Session] session_factory: Creates a DB session for
+        each build.
+    :param int max_workers: The maximum number of requested dumps built
+        concurrently.
+    :param Callable[[DataDumpSpec, Session], None] build: Builds and uploads
+        a dump, overridable in tests.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        max_workers: int = 1,
+        build: Callable[[DataDumpSpec, Session], None] = build_data_dump,
+    ) -> None:
+        self._session_factory = session_factory
+        self._build = build
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="data-dump"
+        )
+        self._prebuild_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="data-dump-prebuild"
+        )
+        self._in_progress: dict[tuple[Optional[str], str, DataDumpFormat], _Build] = {}
+        self._latest_specs: dict[Optional[str], DataDumpSpec] = {}
+        self._latest_ingest_cycle: Optional[str] = None
+        # Re-entrant, as cancelling a queued prebuild runs its done callback
+        # while the lock is held
+        self._lock = threading.RLock()
+
+    def submit(self, spec: DataDumpSpec, prebuild: bool = False) -> Future:
+        """Start building a dump, or join the build already in progress.
+
+        :param DataDumpSpec spec: The dump to build.
+        :param bool prebuild: Whether nobody is waiting for the dump yet, so
+            it is built in the prebuild queue.
+        :return Future: Completes when the dump has been built.
+        """
+        with self._lock:
+            build = self._in_progress.get(spec.key)
+            if build is not None and not build.future.done():
+                # Join the build unless it is a prebuild that hasn't started,
+                # which is cancelled and requeued as a requested build
+                if prebuild or not build.prebuild or not build.future.cancel():
+                    return build.future
+
+            executor = self._prebuild_executor if prebuild else self._executor
+            future = executor.submit(self._run, spec)
+            self._in_progress[spec.key] = _Build(future=future, prebuild=prebuild)
+        future.add_done_callback(lambda done: self._finished(spec, done))
+        return future
+
+    def request(self, spec: DataDumpSpec, timeout: Optional[float]) -> bool:
+        """Ensure a dump is being built and wait a while for it to finish.
+
+        The dump's other formats are prebuilt. A newer ingest cycle than
+        previously seen also prebuilds the dumps of the other apps that have
+        requested one.
+
+        :param DataDumpSpec spec: The dump that was requested.
+        :param Optional[float] timeout: How long to wait for the build, in
+            seconds, or None to wait until it finishes.
+        :return bool: Whether the build finished within the timeout. A build
+            that failed is treated as finished.
+        """
+        other_specs = self._observe(spec)
+
+        future = self.submit(spec)
+        for other_format in _CONTENT_TYPES:
+            if other_format != spec.file_format:
+                self.submit(replace(spec, file_format=other_format), prebuild=True)
+        for other_spec in other_specs:
+            self.submit(other_spec, prebuild=True)
+
+        try:
+            future.result(timeout=timeout)
+        except FutureTimeoutError:
+            return False
+        except Exception:
+            _LOGGER.exception("Failed to upload data dump to s3")
+        return True
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._prebuild_executor.shutdown(wait=False, cancel_futures=True)
+
+    def _observe(self, spec: DataDumpSpec) -> list[DataDumpSpec]:
+        with self._lock:
+            previous_cycle = self._latest_ingest_cycle
+            self._latest_specs[spec.app_name] = replace(spec, file_format="zip")
+            if previous_cycle is not None and spec.ingest_cycle_start <= previous_cycle:
+                return []
+
+            self._latest_ingest_cycle = spec.ingest_cycle_start
+            if previous_cycle is None:
+                return []
+
+            return [
+                replace(
+                    other_spec,
+                    ingest_cycle_start=spec.ingest_cycle_start,
+                    file_format=file_format,
+                )
+                for app_name, other_spec in self._latest_specs.items()
+                if app_name != spec.app_name
+                for file_format in _CONTENT_TYPES
+            ]
+
+    def _run(self, spec: DataDumpSpec) -> None:
+        db = self._session_factory()
+        try:
+            self._build(spec, db)
+        finally:
+            db.close()
+
+    def _finished(self, spec: DataDumpSpec, future: Future) -> None:
+        with self._lock:
+            build = self._in_progress.get(spec.key)
+            if build is not None and build.future is future:
+                del self._in_progress[spec.key]
+
+
+def make_data_dump_builder(
+    session_factory: Callable[[], Session] = SessionLocal,
+) -> Optional[DataDumpBuilder]:
+    """Create the data dump builder if it is enabled in config.
+
+    :param Callable[[], Session] session_factory: Creates a DB session for
+        each build.
+    """
+    if not DATA_DUMP_BUILDER_ENABLED:
+        return None
+
+    return DataDumpBuilder(
+        session_factory=session_factory, max_workers=DATA_DUMP_BUILDER_MAX_WORKERS
+    )
+
+
+def get_data_dump_builder(request: Request) -> Optional[DataDumpBuilder]:
+    return getattr(request.app.state, "data_dump_builder", None)
@@ -0,0 +1,151 @@
+"""Tracks a cheap, global version of the family data.
+
+Family, document, event and collection data only changes on ingest or admin
+edits. Read endpoints use the version to answer conditional requests before
+running their queries. It is re-checked every few seconds rather than on every
+request, so a response may be revalidated against the previous version for up
+to `refresh_seconds` after an edit.
+
+When there is a read replica, its version is tracked separately, and
+responses read from the replica are versioned with it. A version read from
+the primary could be ahead of a lagging replica, and would then be served
+with an older response body that clients keep until the next edit.
+
+The version is also used to invalidate in-memory caches of the family data.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Optional
+
+from fastapi import Request
+from sqlalchemy.orm import Session
+
+from app.clients.db.session import ReadSessionLocal, SessionLocal
+from app.config import DATA_VERSION_ENABLED, DATA_VERSION_REFRESH_SECONDS
+from app.repository.data_version import get_data_version
+from app.service.cache import RefreshingValue, _run_in_daemon_thread
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class DataVersion:
+    """A version of the family data."""
+
+    version: str
+    last_modified: Optional[datetime]
+
+
+class DataVersionTracker:
+    """Loads the data version and refreshes it in the background.
+
+    :param Callable[[], Session] session_factory: Creates a DB session on
+        the primary for loading the version.
+    :param float refresh_seconds: How often to re-check the version.
+    :param Optional[Callable[[], Session]] replica_session_factory: Creates
+        a DB session on the read replica, if there is one.
+    :param Callable[[Callable[[], None]], None] run_in_background: Starts the
+        first load for `current_version(load=False)`, overridable in tests.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        refresh_seconds: float = 10,
+        replica_session_factory: Optional[Callable[[], Session]] = None,
+        run_in_background: Callable[[Callable[[], None]], None] = _run_in_daemon_thread,
+    ) -> None:
+        self._run_in_background = run_in_background
+        self._loading = False
+        self._lock = threading.Lock()
+        self._version = RefreshingValue(
+            loader=lambda: self._load(session_factory),
+            refresh_seconds=refresh_seconds,
+            name="data version",
+        )
+        self._replica_version = (
+            RefreshingValue(
+                loader=lambda: self._load(replica_session_factory),
+                refresh_seconds=refresh_seconds,
+                name="read replica data version",
+            )
+            if replica_session_factory is not None
+            else None
+        )
+
+    def current(self, on_replica: bool = False) -> Optional[DataVersion]:
+        """Get the current data version.
+
+        :param bool on_replica: Get the version of the read replica rather
+            than the primary, for responses read from the replica.
+        :return Optional[DataVersion]: The current, possibly stale, version,
+            or None if it could not be loaded.
+        """
+        version = self._replica_version if on_replica else self._version
+        if version is None:
+            return None
+        try:
+            return version.get()
+        except Exception:
+            _LOGGER.exception(f"Failed to load the {version.name}")
+            return None
+
+    def current_version(self, load: bool = True) -> Optional[str]:
+        """Get the current data version string of the primary, for versioning
+        caches.
+
+        :param bool load: Load the version if it hasn't been loaded yet. The
+            first load blocks, so pass False on the event loop or on every
+            request, and the first load is started in the background instead.
+        :return Optional[str]: The current, possibly stale, version, or None
+            if it could not be loaded, or is not loaded yet and `load` is
+            False.
+        """
+        if not load and self._version.peek() is None:
+            self._start_loading()
+            return None
+        data_version = self.current()
+        return data_version.version if data_version is not None else None
+
+    def _start_loading(self) -> None:
+        with self._lock:
+            if self._loading:
+                return
+            self._loading = True
+
+        def load() -> None:
+            try:
+                self.current()
+            finally:
+                with self._lock:
+                    self._loading = False
+
+        self._run_in_background(load)
+
+    @staticmethod
+    def _load(session_factory: Callable[[], Session]) -> DataVersion:
+        db = session_factory()
+        try:
+            last_modified, version = get_data_version(db)
+        finally:
+            db.close()
+        return DataVersion(version=version, last_modified=last_modified)
+
+
+def make_data_version_tracker() -> Optional[DataVersionTracker]:
+    """Create the data version tracker if it is enabled in config."""
+    if not DATA_VERSION_ENABLED:
+        return None
+
+    return DataVersionTracker(
+        session_factory=SessionLocal,
+        refresh_seconds=DATA_VERSION_REFRESH_SECONDS,
+        replica_session_factory=ReadSessionLocal,
+    )
+
+
+def get_data_version_tracker(request: Request) -> Optional[DataVersionTracker]:
+    return getattr(request.app.state, "data_version_tracker", None)
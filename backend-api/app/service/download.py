@@ -1,13 +1,27 @@
 """Functions to support browsing the RDS document structure"""
 
 import csv
+import itertools
 import zipfile
 from collections import defaultdict
+from datetime import date, datetime
 from io import BytesIO, StringIO
 from logging import getLogger
-from typing import Any, Iterator, Mapping, Optional, Sequence, cast
+from typing import (
+    Any,
+    BinaryIO,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Sequence,
+    cast,
+)
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import xlsxwriter
 from db_client.models.dfce import (
     Collection,
     CollectionFamily,
@@ -26,7 +40,10 @@ from sqlalchemy.orm import Session
 from app.clients.db.session import get_db
 from app.errors import ValidationError
 from app.models.search import SearchResponseFamily
-from app.repository.download import get_whole_database_dump
+from app.repository.download import (
+    get_whole_database_dump,
+    stream_whole_database_dump,
+)
 from app.repository.lookups import (
     doc_type_from_family_document_metadata,  # TODO: update this to use geographies api endpoint when refactoring geographies to use iso codes
 )
@@ -35,6 +52,26 @@ from app.telemetry import observe
 
 _LOGGER = getLogger(__name__)
 
+PARQUET_ROW_GROUP_SIZE = 10000
+
+# The Parquet types of the PostgreSQL types in the whole database dump, by
+# type OID. Columns of any other type are written as text.
+_PARQUET_TYPES_BY_PG_TYPE_CODE = {
+    16: pa.bool_(),  # bool
+    19: pa.string(),  # name
+    20: pa.int64(),  # int8
+    21: pa.int16(),  # int2
+    23: pa.int32(),  # int4
+    25: pa.string(),  # text
+    700: pa.float32(),  # float4
+    701: pa.float64(),  # float8
+    1042: pa.string(),  # bpchar
+    1043: pa.string(),  # varchar
+    1082: pa.date32(),  # date
+    1114: pa.timestamp("us"),  # timestamp
+    1184: pa.timestamp("us", tz="UTC"),  # timestamptz
+}
+
 _CSV_SEARCH_RESPONSE_COLUMNS = [
     "Collection Name",
     "Collection Summary",
@@ -612,30 +649,166 @@ def replace_slug_with_qualified_url(
     return df
 
 
+def stream_dump_rows_into_csv(
+    columns: Sequence[str], rows: Iterable[Sequence[Any]], chunk_size: int = 1000
+) -> Iterator[bytes]:
+    """Encode rows of the whole database dump as CSV, a chunk at a time.
+
+    The output matches `convert_dump_to_csv`, but only `chunk_size` rows are
+    held in memory at once.
+
+    :param Sequence[str] columns: The column names for the header row.
+    :param Iterable[Sequence[Any]] rows: The rows of the dump.
+    :param int chunk_size: The number of rows per yielded chunk.
+    :return Iterator[bytes]: UTF-8 encoded CSV chunks.
+    """
+    csv_buffer = StringIO()
+    # Match the line endings pandas uses in convert_dump_to_csv
+    writer = csv.writer(csv_buffer, lineterminator="\n")
+    writer.writerow(columns)
+
+    rows_in_chunk = 0
+    for row in rows:
+        writer.writerow(row)
+        rows_in_chunk += 1
+        if rows_in_chunk >= chunk_size:
+            yield csv_buffer.getvalue().encode("utf-8")
+            csv_buffer.seek(0)
+            csv_buffer.truncate(0)
+            rows_in_chunk = 0
+
+    if csv_buffer.tell() > 0:
+        yield csv_buffer.getvalue().encode("utf-8")
+
+
 def convert_dump_to_csv(df: pd.DataFrame):
     csv_buffer = BytesIO()
     df.to_csv(csv_buffer, sep=",", index=False, encoding="utf-8")
     return csv_buffer
 
 
-def convert_dump_to_xlsx(df: pd.DataFrame):
-    """Convert DataFrame to XLSX format in memory."""
-    # Create a copy to avoid modifying the original DataFrame
-    df_copy = df.copy()
+def _xlsx_cell_value(value: Any) -> Any:
+    # Excel does not support timezones, so keep the wall clock time
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        return value.replace(tzinfo=None)
+    return value
+
 
-    # Strip timezone info from datetime columns for Excel compatibility
-    for col in df_copy.columns:
-        if pd.api.types.is_datetime64_any_dtype(df_copy[col]):
-            df_copy[col] = df_copy[col].dt.tz_localize(None)
+def stream_dump_rows_into_xlsx(
+    fileobj: BinaryIO, columns: Sequence[str], rows: Iterable[Sequence[Any]]
+) -> None:
+    """Write rows of the whole database dump to an XLSX workbook, a row at a time.
 
+    XlsxWriter's constant memory mode flushes each row to a temporary file as
+    soon as the next one is written, so memory use does not grow with the
+    size of the dump. The output matches `convert_dump_to_xlsx`.
+
+    :param BinaryIO fileobj: Where to write the workbook. It does not need to
+        be seekable.
+    :param Sequence[str] columns: The column names for the header row.
+    :param Iterable[Sequence[Any]] rows: The rows of the dump.
+    """
+    workbook = xlsxwriter.Workbook(
+        fileobj,
+        {
+            "constant_memory": True,
+            "default_date_format": "yyyy-mm-dd hh:mm:ss",
+        },
+    )
+    # Match the header style and date formats pandas uses in to_excel
+    header_format = workbook.add_format(
+        {"bold": True, "border": 1, "align": "center", "valign": "top"}
+    )
+    date_format = workbook.add_format({"num_format": "yyyy-mm-dd"})
+    worksheet = workbook.add_worksheet("Data")
+    worksheet.write_row(0, 0, columns, header_format)
+    for row_number, row in enumerate(rows, start=1):
+        for column_number, value in enumerate(row):
+            if isinstance(value, date) and not isinstance(value, datetime):
+                worksheet.write_datetime(row_number, column_number, value, date_format)
+            else:
+                worksheet.write(row_number, column_number, _xlsx_cell_value(value))
+    workbook.close()
+
+
+def convert_dump_to_xlsx(df: pd.DataFrame):
+    """Convert DataFrame to XLSX format in memory."""
     xlsx_buffer = BytesIO()
-    # Use XlsxWriter as its lenient with special characters and doesn't require
-    # sanitisation
-    with pd.ExcelWriter(xlsx_buffer, engine="xlsxwriter") as writer:  # type: ignore
-        df_copy.to_excel(writer, index=False, sheet_name="Data")
+    stream_dump_rows_into_xlsx(
+        xlsx_buffer,
+        list(df.columns),
+        (
+            tuple(None if pd.isna(value) else value for value in row)
+            for row in df.astype(object).itertuples(index=False, name=None)
+        ),
+    )
     return xlsx_buffer
 
 
+def dump_parquet_schema(
+    columns: Sequence[str], column_type_codes: Sequence[int]
+) -> pa.Schema:
+    """Get the Parquet schema of the whole database dump from its SQL types.
+
+    The schema is fixed before any rows are read, as a column can be empty
+    for the first rows of the dump, e.g. the event dates of families without
+    events.
+
+    :param Sequence[str] columns: The column names.
+    :param Sequence[int] column_type_codes: The PostgreSQL type OIDs of the
+        columns, from the cursor description.
+    :return pa.Schema: The schema to write every row group with.
+    """
+    return pa.schema(
+        [
+            pa.field(name, _PARQUET_TYPES_BY_PG_TYPE_CODE.get(type_code, pa.string()))
+            for name, type_code in zip(columns, column_type_codes)
+        ]
+    )
+
+
+def _parquet_array(values: Sequence[Any], field: pa.Field) -> pa.Array:
+    try:
+        return pa.array(values, type=field.type)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        if not pa.types.is_string(field.type):
+            raise
+        # Columns of types without a Parquet mapping are written as text
+        return pa.array(
+            [value if value is None else str(value) for value in values],
+            type=field.type,
+        )
+
+
+def _parquet_row_group(rows: Sequence[Sequence[Any]], schema: pa.Schema) -> pa.Table:
+    arrays = [
+        _parquet_array(values, field) for values, field in zip(zip(*rows), schema)
+    ]
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+
+def stream_dump_rows_into_parquet(
+    fileobj: BinaryIO,
+    schema: pa.Schema,
+    rows: Iterable[Sequence[Any]],
+    row_group_size: int = PARQUET_ROW_GROUP_SIZE,
+) -> None:
+    """Write rows of the whole database dump to a Parquet file, a row group at a time.
+
+    Only `row_group_size` rows are held in memory at once.
+
+    :param BinaryIO fileobj: Where to write the Parquet file. It does not need
+        to be seekable.
+    :param pa.Schema schema: The column names and types, see
+        `dump_parquet_schema`.
+    :param Iterable[Sequence[Any]] rows: The rows of the dump.
+    :param int row_group_size: The number of rows per row group.
+    """
+    with pq.ParquetWriter(fileobj, schema, compression="zstd") as writer:
+        for batch in itertools.batched(rows, row_group_size):
+            writer.write_table(_parquet_row_group(batch, schema))
+
+
 def generate_data_dump_as_file(
     ingest_cycle_start: str,
     allowed_corpora_ids: list[str],
@@ -708,6 +881,49 @@ def generate_data_dump_readme(ingest_cycle_start: str, theme: Optional[str] = No
     return file_buffer
 
 
+def write_data_download_zip_archive(
+    fileobj: BinaryIO,
+    ingest_cycle_start: str,
+    allowed_corpora_ids: list[str],
+    db: Session,
+    theme: Optional[str] = None,
+    url_base: Optional[str] = None,
+) -> None:
+    """Write the whole database download zip archive to a stream.
+
+    CSV or XLSX data is streamed from a server-side cursor straight into the
+    compressed archive, so `fileobj` can be an unseekable stream such as an
+    S3 multipart upload and memory use does not grow with the dump size.
+
+    :param BinaryIO fileobj: Where to write the zip archive.
+    :param str ingest_cycle_start: The current ingest cycle date.
+    :param list[str] allowed_corpora_ids: The corpora to include.
+    :param Session db: The session to query against.
+    :param Optional[str] theme: The theme of the app requesting the dump.
+    :param Optional[str] url_base: The base of the URLs in the dump.
+    """
+    readme_buffer = generate_data_dump_readme(ingest_cycle_start, theme)
+    convert_to_xlsx = True if theme and theme.upper() == "CCC" else False
+    file_extension = "xlsx" if convert_to_xlsx else "csv"
+    data_file_name = f"Document_Data_Download-{ingest_cycle_start}.{file_extension}"
+
+    with zipfile.ZipFile(fileobj, "w", zipfile.ZIP_DEFLATED, True) as zip_file:
+        zip_file.writestr("README.txt", readme_buffer.getvalue())
+
+        with (
+            stream_whole_database_dump(
+                ingest_cycle_start, allowed_corpora_ids, db, theme, url_base
+            ) as (columns, _, rows),
+            zip_file.open(data_file_name, "w", force_zip64=True) as data_file,
+        ):
+            if convert_to_xlsx:
+                stream_dump_rows_into_xlsx(cast(BinaryIO, data_file), columns, rows)
+                return
+
+            for chunk in stream_dump_rows_into_csv(columns, rows):
+                data_file.write(chunk)
+
+
 def create_data_download_zip_archive(
     ingest_cycle_start: str,
     allowed_corpora_ids: list[str],
@@ -715,23 +931,38 @@ def create_data_download_zip_archive(
     theme: Optional[str] = None,
     url_base: Optional[str] = None,
 ):
-    readme_buffer = generate_data_dump_readme(ingest_cycle_start, theme)
-
-    convert_to_xlsx = True if theme and theme.upper() == "CCC" else False
-    file_buffer = generate_data_dump_as_file(
-        ingest_cycle_start, allowed_corpora_ids, db, theme, url_base, convert_to_xlsx
+    """Create the whole database download zip archive in memory."""
+    zip_buffer = BytesIO()
+    write_data_download_zip_archive(
+        zip_buffer, ingest_cycle_start, allowed_corpora_ids, db, theme, url_base
     )
+    return zip_buffer
 
-    zip_buffer = BytesIO()
-    file_extension = "xlsx" if convert_to_xlsx else "csv"
-    with zipfile.ZipFile(zip_buffer, "a", zipfile.ZIP_DEFLATED, False) as zip_file:
-        for file_name, data in [
-            ("README.txt", readme_buffer),
-            (
-                f"Document_Data_Download-{ingest_cycle_start}.{file_extension}",
-                file_buffer,
-            ),
-        ]:
-            zip_file.writestr(file_name, data.getvalue())
 
-    return zip_buffer
+def write_data_download_parquet(
+    fileobj: BinaryIO,
+    ingest_cycle_start: str,
+    allowed_corpora_ids: list[str],
+    db: Session,
+    theme: Optional[str] = None,
+    url_base: Optional[str] = None,
+) -> None:
+    """Write the whole database download as a zstd compressed Parquet file.
+
+    Rows are written from a server-side cursor in row groups, so `fileobj`
+    can be an unseekable stream such as an S3 multipart upload and memory use
+    does not grow with the dump size.
+
+    :param BinaryIO fileobj: Where to write the Parquet file.
+    :param str ingest_cycle_start: The current ingest cycle date.
+    :param list[str] allowed_corpora_ids: The corpora to include.
+    :param Session db: The session to query against.
+    :param Optional[str] theme: The theme of the app requesting the dump.
+    :param Optional[str] url_base: The base of the URLs in the dump.
+    """
+    with stream_whole_database_dump(
+        ingest_cycle_start, allowed_corpora_ids, db, theme, url_base
+    ) as (columns, column_type_codes, rows):
+        stream_dump_rows_into_parquet(
+            fileobj, dump_parquet_schema(columns, column_type_codes), rows
+        )
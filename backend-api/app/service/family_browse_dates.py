@@ -0,0 +1,94 @@
+"""Tracks whether the family browse dates table can be used.
+
+The table, and the triggers that keep it up to date on family and event
+writes, are created by scripts/family_browse_dates.py, not by the API
+workers. Each worker only checks that the triggers are in place, and browse
+falls back to computing the dates per query until they are.
+"""
+
+import logging
+import threading
+from typing import Callable, Optional
+
+from fastapi import Request
+from sqlalchemy.orm import Session
+
+from app.clients.db.session import SessionLocal
+from app.config import (
+    FAMILY_BROWSE_DATES_CHECK_SECONDS,
+    FAMILY_BROWSE_DATES_ENABLED,
+)
+from app.repository.family_browse_dates import is_family_browse_dates_maintained
+from app.service.cache import RefreshingValue
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class FamilyBrowseDates:
+    """Checks in the background whether the family browse dates are usable.
+
+    A failed or negative check is retried every `check_seconds`, so browse
+    starts using the table once it is available without a restart, and stops
+    using it if its triggers are disabled.
+
+    :param Callable[[], Session] session_factory: Creates a DB session for
+        checking the table.
+    :param float check_seconds: How often to check the table.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        check_seconds: float = 60,
+    ) -> None:
+        self._session_factory = session_factory
+        self._maintained = RefreshingValue(
+            loader=self._check,
+            refresh_seconds=check_seconds,
+            name="family browse dates",
+        )
+
+    def start(self) -> None:
+        """Check the table without blocking startup."""
+        threading.Thread(target=self._maintained.refresh, daemon=True).start()
+
+    def is_available(self) -> bool:
+        """Whether browse can sort using the table.
+
+        This never blocks on the database. It starts a background check if
+        the last one is older than `check_seconds`.
+        """
+        if self._maintained.peek() is None:
+            return False
+        return self._maintained.get()
+
+    def _check(self) -> bool:
+        db = self._session_factory()
+        try:
+            maintained = is_family_browse_dates_maintained(db)
+        except Exception:
+            _LOGGER.exception("Failed to check family browse dates, not using them")
+            return False
+        finally:
+            db.close()
+
+        if not maintained:
+            _LOGGER.info("Family browse dates are not maintained, not using them")
+        return maintained
+
+
+def make_family_browse_dates() -> Optional[FamilyBrowseDates]:
+    """Create and start the family browse dates if they are enabled in config."""
+    if not FAMILY_BROWSE_DATES_ENABLED:
+        return None
+
+    family_browse_dates = FamilyBrowseDates(
+        session_factory=SessionLocal,
+        check_seconds=FAMILY_BROWSE_DATES_CHECK_SECONDS,
+    )
+    family_browse_dates.start()
+    return family_browse_dates
+
+
+def get_family_browse_dates(request: Request) -> Optional[FamilyBrowseDates]:
+    return getattr(request.app.state, "family_browse_dates", None)
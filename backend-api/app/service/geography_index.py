@@ -0,0 +1,186 @@
+"""In-memory index of geographies used to resolve search filters.
+
+Converting search filters needs region to country, slug to ISO code and ISO
+code validity lookups. These only change when geographies are updated, so they
+are loaded into memory (from the DB and the geographies API) and refreshed
+periodically, rather than being looked up on every search.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Callable, Mapping, Optional, Sequence
+
+from db_client.models.dfce import Geography
+from fastapi import Request
+from sqlalchemy.orm import Session
+
+from app.clients.api.geographies import fetch_all_countries
+from app.clients.db.session import SessionLocal
+from app.config import GEOGRAPHY_INDEX_ENABLED, GEOGRAPHY_INDEX_REFRESH_SECONDS
+from app.service.cache import RefreshingValue
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class GeographySnapshot:
+    """A point in time view of the geographies, with lookups served from memory.
+
+    Mirrors the behaviour of the equivalent functions in
+    `app.repository.lookups`.
+    """
+
+    region_countries: Mapping[str, Sequence[str]] = field(default_factory=dict)
+    """Region slug to the ISO codes of the countries in the region."""
+
+    slug_to_iso: Mapping[str, str] = field(default_factory=dict)
+    """Slug to ISO code, for countries and subdivisions."""
+
+    iso_to_slug: Mapping[str, str] = field(default_factory=dict)
+    """ISO code to slug, for countries and subdivisions."""
+
+    api_iso_codes: Mapping[str, str] = field(default_factory=dict)
+    """Upper cased ISO code to ISO code, for countries in the geographies API."""
+
+    def countries_for_region(self, region_slug: str) -> Sequence[str]:
+        """Get the ISO codes of the countries in a region.
+
+        :param str region_slug: The slug of the region.
+        :return Sequence[str]: The ISO codes, empty if the slug is not a region.
+        """
+        return self.region_countries.get(region_slug, [])
+
+    def geographies_as_iso_codes_with_fallback(
+        self, geography_identifiers: Sequence[str]
+    ) -> list[str]:
+        """Resolve a mixed list of ISO codes and slugs to ISO codes.
+
+        As in `get_geographies_as_iso_codes_with_fallback`, ISO codes known
+        to the geographies API are used if any match, otherwise the
+        identifiers are treated as slugs.
+
+        :param Sequence[str] geography_identifiers: ISO codes or slugs.
+        :return list[str]: The ISO codes of valid geographies.
+        """
+        if not geography_identifiers:
+            return []
+
+        country_codes = set(code.upper() for code in geography_identifiers)
+        iso_codes = [
+            iso_code
+            for upper_iso_code, iso_code in self.api_iso_codes.items()
+            if upper_iso_code in country_codes
+        ]
+        if iso_codes:
+            return iso_codes
+
+        return [
+            self.slug_to_iso[slug]
+            for slug in geography_identifiers
+            if slug in self.slug_to_iso
+        ]
+
+    def subdivision_iso_codes(self, geography_identifiers: Sequence[str]) -> list[str]:
+        """Filter a list of ISO codes to those of known countries or subdivisions.
+
+        :param Sequence[str] geography_identifiers: ISO codes to validate.
+        :return list[str]: The valid ISO codes.
+        """
+        return [code for code in geography_identifiers if code in self.iso_to_slug]
+
+    def slug_for_iso_code(self, iso_code: str) -> Optional[str]:
+        """Get the slug of a country or subdivision from its ISO code."""
+        return self.iso_to_slug.get(iso_code)
+
+
+def load_geography_snapshot(
+    db: Session, all_countries: Sequence[dict]
+) -> GeographySnapshot:
+    """Build a snapshot from the geographies in the DB and the geographies API.
+
+    :param Session db: Database session.
+    :param Sequence[dict] all_countries: Countries from the geographies API.
+    :return GeographySnapshot: The snapshot.
+    """
+    geographies = db.query(
+        Geography.id, Geography.slug, Geography.value, Geography.parent_id
+    ).all()
+
+    region_slugs = {
+        geo.id: str(geo.slug) for geo in geographies if geo.parent_id is None
+    }
+    region_countries: dict[str, list[str]] = {
+        slug: [] for slug in region_slugs.values()
+    }
+    slug_to_iso: dict[str, str] = {}
+    iso_to_slug: dict[str, str] = {}
+    for geo in geographies:
+        if geo.parent_id is None:
+            continue
+        if geo.parent_id in region_slugs:
+            region_countries[region_slugs[geo.parent_id]].append(str(geo.value))
+        slug_to_iso[str(geo.slug)] = str(geo.value)
+        iso_to_slug.setdefault(str(geo.value), str(geo.slug))
+
+    return GeographySnapshot(
+        region_countries=region_countries,
+        slug_to_iso=slug_to_iso,
+        iso_to_slug=iso_to_slug,
+        api_iso_codes={
+            country["alpha_3"].upper(): country["alpha_3"] for country in all_countries
+        },
+    )
+
+
+class GeographyIndex:
+    """Serves a geography snapshot, refreshing it in the background.
+
+    If a refresh fails, for example because the geographies API is down, the
+    last good snapshot continues to be served.
+
+    :param Callable[[], Session] session_factory: Creates a DB session for
+        loading the snapshot.
+    :param float refresh_seconds: How often to refresh the snapshot.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        refresh_seconds: float = 3600,
+    ) -> None:
+        self._session_factory = session_factory
+        self._snapshot = RefreshingValue(
+            loader=self._load,
+            refresh_seconds=refresh_seconds,
+            name="geography index",
+        )
+
+    def _load(self) -> GeographySnapshot:
+        all_countries = fetch_all_countries()
+        db = self._session_factory()
+        try:
+            snapshot = load_geography_snapshot(db, all_countries)
+        finally:
+            db.close()
+        _LOGGER.info(
+            "Loaded geography index",
+            extra={"props": {"regions": len(snapshot.region_countries)}},
+        )
+        return snapshot
+
+    def snapshot(self) -> GeographySnapshot:
+        return self._snapshot.get()
+
+
+def make_geography_index() -> Optional[GeographyIndex]:
+    """Create the geography index if it is enabled in config."""
+    if not GEOGRAPHY_INDEX_ENABLED:
+        return None
+
+    return GeographyIndex(
+        session_factory=SessionLocal, refresh_seconds=GEOGRAPHY_INDEX_REFRESH_SECONDS
+    )
+
+
+def get_geography_index(request: Request) -> Optional[GeographyIndex]:
+    return getattr(request.app.state, "geography_index", None)
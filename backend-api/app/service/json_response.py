@@ -0,0 +1,45 @@
+"""JSON responses for payloads that have already been serialised.
+
+An endpoint that returns a model has it validated against the route's
+`response_model` and serialised by pydantic. That is cheap for a model that
+was just built, so most endpoints return their models as they are.
+
+The config is different: it is served from a cache, and its JSON is already
+computed once per load to make its ETag. The config endpoint returns those
+bytes as they are, rather than having FastAPI serialise the config again on
+every request. The `response_model` stays on the route for the OpenAPI schema.
+"""
+
+from typing import Optional
+
+from fastapi import Response
+from pydantic import BaseModel
+
+
+def model_to_json(model: BaseModel) -> bytes:
+    """Serialise a model to JSON bytes, with the aliases FastAPI would use.
+
+    :param BaseModel model: The validated model to serialise.
+    :return bytes: The UTF-8 encoded JSON.
+    """
+    return model.__pydantic_serializer__.to_json(model, by_alias=True)
+
+
+def serialised_json_response(
+    content: bytes, response: Optional[Response] = None
+) -> Response:
+    """Create a response of pre-serialised JSON, keeping the endpoint's headers.
+
+    Headers set on the `Response` injected into an endpoint, such as the
+    conditional GET validators, are dropped by FastAPI when the endpoint
+    returns its own response, so they are copied across.
+
+    :param bytes content: The serialised JSON, e.g. from `model_to_json`.
+    :param Optional[Response] response: The response injected into the
+        endpoint, if any.
+    :return Response: The response to return from the endpoint.
+    """
+    json_response = Response(content=content, media_type="application/json")
+    if response is not None:
+        json_response.raw_headers.extend(response.raw_headers)
+    return json_response
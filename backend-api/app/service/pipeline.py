@@ -5,21 +5,43 @@ import re
 from dataclasses import dataclass
 from datetime import datetime
 from io import BytesIO
-from typing import Any, Collection, Mapping, Optional, Sequence, Union
+from typing import (
+    Any,
+    BinaryIO,
+    Collection,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Sequence,
+    Union,
+)
 
 from fastapi import Depends
+from sqlalchemy.orm import Session
 
 from app.clients.aws.client import S3Client
 from app.clients.aws.s3_document import S3Document
 from app.clients.db.session import get_db
-from app.config import INGEST_TRIGGER_ROOT, PIPELINE_BUCKET
+from app.config import AWS_REGION, INGEST_TRIGGER_ROOT, PIPELINE_BUCKET
 from app.models.document import DocumentParserInput
-from app.repository.pipeline import generate_pipeline_ingest_input
+from app.repository.pipeline import (
+    check_pipeline_ingest_input_count,
+    generate_pipeline_ingest_input,
+    get_pipeline_document_ids,
+    get_untimestamped_checksum,
+    stream_pipeline_ingest_input,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 MetadataType = dict[str, list[str]]
 
+# The state of the last export, which the next incremental export is compared
+# with. It is kept outside the ingest trigger root, so it doesn't start an
+# ingest.
+DB_STATE_CHECKPOINT_KEY = "ingest_state/db_state_checkpoint.json"
+
 _ID_ELEMENT = r"[a-zA-Z0-9]+([-_]?[a-zA-Z0-9]+)*"
 IMPORT_ID_MATCHER = re.compile(
     rf"^{_ID_ELEMENT}\.{_ID_ELEMENT}\.{_ID_ELEMENT}\.{_ID_ELEMENT}$"
@@ -115,6 +137,157 @@ def write_documents_to_s3(
     )
 
 
+def write_db_state(
+    documents: Iterable[DocumentParserInput],
+    stream: BinaryIO,
+    header: Optional[Mapping[str, Any]] = None,
+) -> int:
+    """Write the db_state.json content to a stream as compact JSON.
+
+    Each document is encoded and written as it is read, so the content is
+    never held in memory. Without a header, the output is equivalent to
+    dumping the result of `format_pipeline_ingest_input`.
+
+    :param Iterable[DocumentParserInput] documents: The documents to write.
+    :param BinaryIO stream: The stream to write the content to.
+    :param Optional[Mapping[str, Any]] header: Extra keys to write alongside
+        the documents.
+    :return int: The number of documents written.
+    """
+    stream.write(b"{")
+    for key, value in (header or {}).items():
+        stream.write(
+            json.dumps(key).encode("utf8")
+            + b":"
+            + json.dumps(value, separators=(",", ":")).encode("utf8")
+            + b","
+        )
+
+    count = 0
+    stream.write(b'"documents":{')
+    for document in documents:
+        if count:
+            stream.write(b",")
+        stream.write(
+            json.dumps(document.import_id).encode("utf8")
+            + b":"
+            + json.dumps(document.to_json(), separators=(",", ":")).encode("utf8")
+        )
+        count += 1
+    stream.write(b"}}")
+    return count
+
+
+def _read_db_state_checkpoint(s3_client: S3Client) -> Optional[dict[str, Any]]:
+    s3_document = S3Document(PIPELINE_BUCKET, AWS_REGION, DB_STATE_CHECKPOINT_KEY)
+    if not s3_client.document_exists(s3_document):
+        return None
+    return json.loads(s3_client.download_file(s3_document).read())
+
+
+def _write_db_state_checkpoint(
+    s3_client: S3Client, checksum: str, document_ids: Sequence[str]
+) -> None:
+    content = {"checksum": checksum, "document_ids": sorted(document_ids)}
+    _write_content_to_s3(
+        s3_client=s3_client,
+        s3_object_key=DB_STATE_CHECKPOINT_KEY,
+        bytes_content=BytesIO(json.dumps(content).encode("utf8")),
+    )
+
+
+def _record_import_ids(
+    documents: Iterable[DocumentParserInput], import_ids: list[str]
+) -> Iterator[DocumentParserInput]:
+    for document in documents:
+        import_ids.append(document.import_id)
+        yield document
+
+
+def stream_db_state_to_s3(
+    db: Session,
+    s3_client: S3Client,
+    s3_prefix: str,
+    changed_since: Optional[datetime] = None,
+) -> S3Document:
+    """Write the current state of documents into S3 to trigger a pipeline run.
+
+    The documents are streamed from the DB into a multipart upload, so memory
+    use does not grow with the number of documents.
+
+    Given `changed_since`, only the documents whose family, document, events
+    or slugs changed since then are written, to db_state_delta.json. The
+    delta's `deleted_document_ids` are the documents in the last export
+    that are no longer exported, e.g. because they were deleted, or their
+    family was deleted or lost its geographies.
+
+    Each export records a checkpoint of the documents it covers and a
+    checksum of the data that has no edit times, such as family metadata,
+    geographies and corpus membership. If that data has changed since the
+    last export, or there is no checkpoint, a full db_state.json is written
+    instead of the delta.
+
+    :param Session db: The db session to query against.
+    :param S3Client s3_client: An S3 client to use to write data.
+    :param str s3_prefix: Prefix into which to write the db state in S3.
+    :param Optional[datetime] changed_since: The watermark for an incremental
+        export, usually the start of the last ingest.
+    :return S3Document: The uploaded db_state.json or db_state_delta.json file.
+    """
+    if not PIPELINE_BUCKET:
+        raise RuntimeError("PIPELINE_BUCKET not set")
+
+    # Read before the documents, so a change made during the export is
+    # seen by the next one
+    checksum = get_untimestamped_checksum(db)
+    exported_ids: list[str] = []
+    deleted_document_ids: list[str] = []
+    if changed_since is not None:
+        checkpoint = _read_db_state_checkpoint(s3_client)
+        if checkpoint is None or checkpoint["checksum"] != checksum:
+            _LOGGER.info(
+                "Data without edit times has changed since the last export, "
+                "writing a full export",
+                extra={"props": {"has_checkpoint": checkpoint is not None}},
+            )
+            changed_since = None
+        else:
+            exported_ids = get_pipeline_document_ids(db)
+            deleted_document_ids = sorted(
+                set(checkpoint["document_ids"]) - set(exported_ids)
+            )
+
+    if changed_since is None:
+        documents_object_key = f"{s3_prefix}/db_state.json"
+        header = None
+    else:
+        documents_object_key = f"{s3_prefix}/db_state_delta.json"
+        header = {
+            "changed_since": changed_since.isoformat(),
+            "deleted_document_ids": deleted_document_ids,
+        }
+
+    _LOGGER.info(
+        "Streaming Documents file into S3",
+        extra={"props": {"bucket": PIPELINE_BUCKET, "file": documents_object_key}},
+    )
+    with (
+        stream_pipeline_ingest_input(db, changed_since) as documents,
+        s3_client.open_multipart_upload(
+            bucket=PIPELINE_BUCKET,
+            key=documents_object_key,
+            content_type="application/json",
+        ) as upload,
+    ):
+        if changed_since is None:
+            documents = _record_import_ids(documents, exported_ids)
+        count = write_db_state(documents, upload, header)
+
+    _write_db_state_checkpoint(s3_client, checksum, exported_ids)
+    check_pipeline_ingest_input_count(db, count)
+    return S3Document(PIPELINE_BUCKET, AWS_REGION, documents_object_key)
+
+
 def write_ingest_results_to_s3(
     s3_client: S3Client,
     s3_prefix: str,
@@ -0,0 +1,118 @@
+"""Routes read only sessions to a read replica while it is keeping up.
+
+The replica's lag is checked in the background. Sessions are created on the
+primary until the first check has completed, and whenever the replica is
+unreachable or lagging more than the allowed maximum, so reads never see
+data older than that.
+"""
+
+import logging
+import math
+from typing import Callable, Optional
+
+from sqlalchemy.orm import Session
+
+from app.clients.db.session import ReadSessionLocal, SessionLocal
+from app.config import READ_REPLICA_LAG_CHECK_SECONDS, READ_REPLICA_MAX_LAG_SECONDS
+from app.repository.replica import get_replica_lag_seconds
+from app.service.cache import RefreshingValue, _run_in_daemon_thread
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ReadReplica:
+    """Creates sessions on the read replica, or the primary if it is lagging.
+
+    :param Callable[[], Session] replica_session_factory: Creates a session
+        on the replica.
+    :param Callable[[], Session] primary_session_factory: Creates a session
+        on the primary.
+    :param float max_lag_seconds: The most the replica can lag behind the
+        primary and still be used.
+    :param float lag_check_seconds: How often to check the replica's lag.
+    :param Callable[[Callable[[], None]], None] run_in_background: Starts a
+        background check, overridable in tests to run synchronously.
+    """
+
+    def __init__(
+        self,
+        replica_session_factory: Callable[[], Session],
+        primary_session_factory: Callable[[], Session],
+        max_lag_seconds: float = 30,
+        lag_check_seconds: float = 10,
+        run_in_background: Callable[[Callable[[], None]], None] = _run_in_daemon_thread,
+    ) -> None:
+        self._replica_session_factory = replica_session_factory
+        self._primary_session_factory = primary_session_factory
+        self.max_lag_seconds = max_lag_seconds
+        self._run_in_background = run_in_background
+        self._lag = RefreshingValue(
+            loader=self._load_lag,
+            refresh_seconds=lag_check_seconds,
+            name="read replica lag",
+            run_in_background=run_in_background,
+        )
+
+    def start(self) -> None:
+        """Check the replica's lag without blocking startup."""
+        self._run_in_background(self._lag.refresh)
+
+    def is_usable(self) -> bool:
+        """Whether the replica is reachable and keeping up with the primary.
+
+        Also starts a background check if the last one is stale.
+        """
+        if self._lag.peek() is None:
+            return False
+        return self._lag.get() <= self.max_lag_seconds
+
+    def session(self) -> Session:
+        """Create a session on the replica if it is usable, else the primary."""
+        if self.is_usable():
+            return self._replica_session_factory()
+        return self._primary_session_factory()
+
+    def _load_lag(self) -> float:
+        try:
+            db = self._replica_session_factory()
+            try:
+                lag = get_replica_lag_seconds(db)
+            finally:
+                db.close()
+        except Exception as e:
+            _LOGGER.warning(f"Could not check read replica lag, using primary: {e}")
+            return math.inf
+
+        if lag > self.max_lag_seconds:
+            _LOGGER.warning(
+                "Read replica is lagging, using primary",
+                extra={"props": {"lag_seconds": lag}},
+            )
+        return lag
+
+
+def make_read_replica() -> Optional[ReadReplica]:
+    """Create and start the read replica if one is configured."""
+    if ReadSessionLocal is None:
+        return None
+
+    read_replica = ReadReplica(
+        replica_session_factory=ReadSessionLocal,
+        primary_session_factory=SessionLocal,
+        max_lag_seconds=READ_REPLICA_MAX_LAG_SECONDS,
+        lag_check_seconds=READ_REPLICA_LAG_CHECK_SECONDS,
+    )
+    read_replica.start()
+    return read_replica
+
+
+def get_read_session_factory(
+    read_replica: Optional[ReadReplica],
+) -> Callable[[], Session]:
+    """Get the session factory for background reads, e.g. caches and dumps.
+
+    :param Optional[ReadReplica] read_replica: The read replica, if any.
+    :return Callable[[], Session]: Creates a session on the replica while it
+        is usable, otherwise on the primary.
+    """
+    return read_replica.session if read_replica is not None else SessionLocal
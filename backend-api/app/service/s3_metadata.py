@@ -0,0 +1,145 @@
+"""Cached answers to the S3 and STS metadata lookups made on hot endpoints.
+
+The homepage counts need the latest ingest cycle, which lists the pipeline
+bucket, and the data download checks the AWS credentials and whether the dump
+exists. These answers change at most once per ingest, so each worker keeps
+them in memory and refreshes them in the background, keeping S3 latency off
+the request path.
+"""
+
+import logging
+import threading
+from typing import Callable, Optional
+
+from fastapi import Request
+
+from app.clients.aws.client import S3Client, get_s3_client
+from app.clients.aws.s3_document import S3Document
+from app.config import (
+    INGEST_TRIGGER_ROOT,
+    PIPELINE_BUCKET,
+    S3_DOCUMENT_EXISTS_CACHE_MAX_ENTRIES,
+    S3_DOCUMENT_EXISTS_CACHE_TTL_SECONDS,
+    S3_METADATA_CACHE_ENABLED,
+    S3_METADATA_REFRESH_SECONDS,
+)
+from app.service.cache import (
+    InMemoryCacheBackend,
+    RefreshingValue,
+    _run_in_daemon_thread,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class S3MetadataCache:
+    """Serves S3 and STS metadata lookups from memory.
+
+    Only documents that exist are cached: dumps are created after they are
+    first looked for, and existing objects are not deleted, so a missing
+    document is always checked in S3.
+
+    :param S3Client s3_client: The client to make the lookups with.
+    :param str pipeline_bucket: The bucket the ingest cycles are started in.
+    :param str ingest_trigger_root: The prefix of the ingest cycles.
+    :param float refresh_seconds: How often to refresh the latest ingest
+        cycle and connection status.
+    :param int max_documents: The maximum number of existing documents to
+        remember.
+    :param float document_ttl_seconds: How long to remember that a document
+        exists for.
+    :param Callable[[Callable[[], None]], None] run_in_background: Starts a
+        background refresh, overridable in tests to run synchronously.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        s3_client: S3Client,
+        pipeline_bucket: str,
+        ingest_trigger_root: str,
+        refresh_seconds: float = 300,
+        max_documents: int = 1000,
+        document_ttl_seconds: float = 3600,
+        run_in_background: Callable[[Callable[[], None]], None] = _run_in_daemon_thread,
+    ) -> None:
+        self._s3_client = s3_client
+        self._latest_ingest_start = RefreshingValue(
+            loader=lambda: s3_client.get_latest_ingest_start(
+                pipeline_bucket, ingest_trigger_root
+            ),
+            refresh_seconds=refresh_seconds,
+            name="latest ingest start",
+            run_in_background=run_in_background,
+        )
+        self._connected = RefreshingValue(
+            loader=s3_client.is_connected,
+            refresh_seconds=refresh_seconds,
+            name="AWS connection status",
+            run_in_background=run_in_background,
+        )
+        self._existing_documents: InMemoryCacheBackend[bool] = InMemoryCacheBackend(
+            max_entries=max_documents, ttl_seconds=document_ttl_seconds
+        )
+
+    def start(self) -> None:
+        """Load the latest ingest cycle and connection status without blocking."""
+        threading.Thread(target=self._initial_load, daemon=True).start()
+
+    def latest_ingest_start(self) -> str:
+        """Get the date of the most recent ingest.
+
+        :raises Exception: if it is not loaded yet and fails to load.
+        :return str: The date in the format `%Y-%m-%d`.
+        """
+        return self._latest_ingest_start.get()
+
+    def is_connected(self) -> bool:
+        """Check whether we are connected to AWS.
+
+        :raises Exception: if it is not loaded yet and fails to load.
+        :return bool: Connection status.
+        """
+        return self._connected.get()
+
+    def document_exists(self, s3_document: S3Document) -> bool:
+        """Detect whether an S3Document exists in storage.
+
+        :param S3Document s3_document: The s3 document description to check for.
+        :return bool: A flag indicating whether the described document exists.
+        """
+        key = (s3_document.bucket_name, s3_document.key)
+        if self._existing_documents.get(key):
+            return True
+
+        exists = self._s3_client.document_exists(s3_document)
+        if exists:
+            self._existing_documents.set(key, True)
+        return exists
+
+    def _initial_load(self) -> None:
+        for value in (self._latest_ingest_start, self._connected):
+            try:
+                value.refresh()
+            except Exception:
+                _LOGGER.exception(f"Failed to load {value.name}")
+
+
+def make_s3_metadata_cache() -> Optional[S3MetadataCache]:
+    """Create and start the S3 metadata cache if it is enabled in config."""
+    if not S3_METADATA_CACHE_ENABLED:
+        return None
+
+    s3_metadata_cache = S3MetadataCache(
+        s3_client=get_s3_client(),
+        pipeline_bucket=PIPELINE_BUCKET,
+        ingest_trigger_root=INGEST_TRIGGER_ROOT,
+        refresh_seconds=S3_METADATA_REFRESH_SECONDS,
+        max_documents=S3_DOCUMENT_EXISTS_CACHE_MAX_ENTRIES,
+        document_ttl_seconds=S3_DOCUMENT_EXISTS_CACHE_TTL_SECONDS,
+    )
+    s3_metadata_cache.start()
+    return s3_metadata_cache
+
+
+def get_s3_metadata_cache(request: Request) -> Optional[S3MetadataCache]:
+    return getattr(request.app.state, "s3_metadata_cache", None)
@@ -1,7 +1,7 @@
 import logging
 import re
 from enum import Enum
-from typing import Mapping, Optional, Sequence, Tuple
+from typing import Mapping, Optional, Sequence, Tuple, Union
 
 from cpr_sdk.exceptions import QueryError
 from cpr_sdk.models.search import Document as CprSdkResponseDocument
@@ -15,7 +15,8 @@ from cpr_sdk.models.search import filter_fields
 from cpr_sdk.search_adaptors import VespaSearchAdapter
 from db_client.models.dfce import Family, FamilyDocument, FamilyMetadata
 from db_client.models.dfce.family import FamilyStatus
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
+from starlette.concurrency import run_in_threadpool
 
 from app.clients.aws.client import S3Client
 from app.clients.aws.s3_document import S3Document
@@ -39,6 +40,10 @@ from app.repository.lookups import (
 from app.repository.lookups import (
     get_countries_for_region,
 )
+from app.service.geography_index import GeographyIndex
+from app.service.s3_metadata import S3MetadataCache
+from app.service.search_cache import SearchResponseCache
+from app.service.search_metrics import SearchStage, search_stage
 from app.service.util import to_cdn_url
 from app.telemetry import observe
 
@@ -112,9 +117,16 @@ def _convert_filter_field(filter_field: str) -> Optional[str]:
 def _convert_filters(
     db: Session,
     keyword_filters: Optional[Mapping[BackendFilterValues, Sequence[str]]],
+    geography_index: Optional[GeographyIndex] = None,
 ) -> Optional[Mapping[str, Sequence[str]]]:
+    """Convert F/E keyword filters into Vespa filters.
+
+    Geographies are resolved from the in-memory geography index if one is
+    given, otherwise they are looked up in the DB and geographies API.
+    """
     if not keyword_filters:
         return None
+    geographies = geography_index.snapshot() if geography_index else None
     new_keyword_filters = {}
     regions = []
     countries = []
@@ -126,16 +138,25 @@ def _convert_filters(
         new_field = _convert_filter_field(field)
         if field == FilterField.REGION:
             for region in values:
+                if geographies is not None:
+                    regions.extend(geographies.countries_for_region(region))
+                    continue
                 regions.extend(
                     [country.value for country in get_countries_for_region(db, region)]
                 )
         elif field == FilterField.COUNTRY:
             countries.extend(
+                geographies.geographies_as_iso_codes_with_fallback(values)
+                if geographies is not None
                 # TODO: remove this once frontend is updated to use ISO codes in favour of get_countries_by_iso_codes
-                get_geographies_as_iso_codes_with_fallback(db, values)
+                else get_geographies_as_iso_codes_with_fallback(db, values)
             )
         elif field == FilterField.SUBDIVISION:
-            subdivisions.extend(validate_subdivision_iso_codes(db, values))
+            subdivisions.extend(
+                geographies.subdivision_iso_codes(values)
+                if geographies is not None
+                else validate_subdivision_iso_codes(db, values)
+            )
 
         else:
             new_values = values
@@ -292,11 +313,23 @@ def _cached_or_new_family(
 
 @observe("_get_rds_data_for_vespa_response")
 def _get_rds_data_for_vespa_response(db: Session, all_response_family_ids: list[str]):
+    """Load the RDS data needed to enrich a page of Vespa results.
+
+    The family documents (with their physical documents, for the titles) and
+    the family events (for the published date) are loaded up front, so the
+    number of queries does not grow with the number of families on the page.
+    """
     # TODO: Potential disparity between what's in postgres and vespa
     family_and_family_metadata: Sequence[tuple[Family, FamilyMetadata]] = (
         db.query(Family, FamilyMetadata)
         .filter(Family.import_id.in_(all_response_family_ids))
         .join(FamilyMetadata, FamilyMetadata.family_import_id == Family.import_id)
+        .options(
+            selectinload(Family.family_documents).joinedload(
+                FamilyDocument.physical_document
+            ),
+            selectinload(Family.events),
+        )
         .all()
     )  # type: ignore
     db_family_lookup: Mapping[str, tuple[Family, FamilyMetadata]] = {
@@ -334,14 +367,36 @@ def _process_vespa_search_response_families(
     """
     vespa_families_to_process = vespa_families[offset : limit + offset]
     all_response_family_ids = [vf.id for vf in vespa_families_to_process]
-    db_family_lookup, db_family_document_lookup = _get_rds_data_for_vespa_response(
-        db, all_response_family_ids
-    )
+    with search_stage(SearchStage.rds_enrichment):
+        db_family_lookup, db_family_document_lookup = _get_rds_data_for_vespa_response(
+            db, all_response_family_ids
+        )
 
+    with search_stage(SearchStage.vespa_response_parsing):
+        response_families = _build_response_families(
+            vespa_families_to_process, db_family_lookup, db_family_document_lookup
+        )
+
+    if sort_within_page:
+        with search_stage(SearchStage.passage_sorting):
+            _sort_passages_within_page(response_families)
+
+    return response_families
+
+
+def _build_response_families(
+    vespa_families: Sequence[CprSdkResponseFamily],
+    db_family_lookup: Mapping[str, tuple[Family, FamilyMetadata]],
+    db_family_document_lookup: Mapping[str, FamilyDocument],
+) -> list[SearchResponseFamily]:
+    """Build the response families for a page of Vespa results.
+
+    Hits for unpublished families and unknown documents are skipped.
+    """
     response_families = []
     response_family = None
 
-    for vespa_family in vespa_families_to_process:
+    for vespa_family in vespa_families:
         response_family_lookup: Mapping[str, SearchResponseFamily] = {}
         response_document_lookup: Mapping[str, SearchResponseFamilyDocument] = {}
 
@@ -401,25 +456,27 @@ def _process_vespa_search_response_families(
         response_families.append(response_family)
         response_family = None
 
-    # OK NOW lets sort the passages within each document
+    return response_families
 
-    if sort_within_page:
-        for response_family in response_families:
-            for response_document in response_family.family_documents:
-                # Updated to use keys from _vespa_passage_hit_to_search_passage
-                # So we don't need defensive logic here.
-                response_document.document_passage_matches.sort(
-                    key=lambda x: (
-                        (
-                            x.text_block_page
-                            if x.text_block_page is not None
-                            else float("inf")
-                        ),
-                        x.block_id_sort_key,
-                    )
-                )
 
-    return response_families
+def _sort_passages_within_page(
+    response_families: Sequence[SearchResponseFamily],
+) -> None:
+    """Sort the passages within each document by their order in the document."""
+    for response_family in response_families:
+        for response_document in response_family.family_documents:
+            # Updated to use keys from _vespa_passage_hit_to_search_passage
+            # So we don't need defensive logic here.
+            response_document.document_passage_matches.sort(
+                key=lambda x: (
+                    (
+                        x.text_block_page
+                        if x.text_block_page is not None
+                        else float("inf")
+                    ),
+                    x.block_id_sort_key,
+                )
+            )
 
 
 @observe("process_vespa_search_response")
@@ -429,11 +486,24 @@ def process_vespa_search_response(
     limit: int,
     offset: int,
     sort_within_page: bool,
+    result_limit: Optional[int] = None,
 ) -> SearchResponse:
-    """Process a Vespa search response into a F/E search response"""
+    """Process a Vespa search response into a F/E search response
+
+    If the Vespa request was narrowed to the requested page (see
+    `paginate_vespa_search_params`), `result_limit` should be the limit the
+    caller asked for, so that `hits` still reflects the number of families
+    available up to that limit rather than the number fetched for the page.
+    It must be None for requests that were not narrowed, such as those with
+    continuation tokens, as `total_result_hits` counts the whole result set
+    rather than the families after the continuation.
+    """
+    hits = len(vespa_search_response.results)
+    if result_limit is not None:
+        hits = max(hits, min(vespa_search_response.total_result_hits, result_limit))
 
     return SearchResponse(
-        hits=len(vespa_search_response.results),
+        hits=hits,
         total_family_hits=vespa_search_response.total_result_hits,
         query_time_ms=vespa_search_response.query_time_ms or 0,
         total_time_ms=vespa_search_response.total_time_ms or 0,
@@ -452,10 +522,14 @@ def process_vespa_search_response(
 
 @observe("create_vespa_search_params")
 def create_vespa_search_params(
-    db: Session, search_body: SearchRequestBody
+    db: Session,
+    search_body: SearchRequestBody,
+    geography_index: Optional[GeographyIndex] = None,
 ) -> SearchRequestBody:
     """Create Vespa search parameters from a F/E search request body"""
-    converted_filters = _convert_filters(db, search_body.keyword_filters)
+    converted_filters = _convert_filters(
+        db, search_body.keyword_filters, geography_index
+    )
     if converted_filters:
         search_body.filters = CprSdkKeywordFilters.model_validate(converted_filters)
     else:
@@ -463,6 +537,48 @@ def create_vespa_search_params(
     return search_body
 
 
+def paginate_vespa_search_params(search_body: SearchRequestBody) -> SearchRequestBody:
+    """Limit the families requested from Vespa to those needed for the page.
+
+    Vespa grouping has no offset, so a page is sliced out of the families
+    returned from the start of the result set. Rather than fetching up to
+    `limit` families and discarding most of them, only fetch as far as the
+    end of the requested page.
+
+    The family continuation token returned by Vespa then continues from the
+    end of the requested page rather than from `limit`. The two are the same
+    for the last page before `limit`.
+
+    Requests with continuation tokens are not narrowed. Vespa only tells us
+    how many families there are in the whole result set, so fetching up to
+    `limit` families after the continuation is the only way to know how many
+    are left for `hits`.
+
+    :param SearchRequestBody search_body: The search parameters to send to Vespa.
+    :return SearchRequestBody: The parameters to send, copied with a reduced
+        limit if they were narrowed.
+    """
+    if search_body.continuation_tokens:
+        return search_body
+
+    page_end = search_body.offset + search_body.page_size
+    return search_body.model_copy(
+        update={"limit": max(1, min(search_body.limit, page_end))}
+    )
+
+
+def get_result_limit(search_body: SearchRequestBody) -> Optional[int]:
+    """Get the `result_limit` for a search, see `process_vespa_search_response`.
+
+    :param SearchRequestBody search_body: The search request.
+    :return Optional[int]: The requested limit if the Vespa request is
+        narrowed to the page, otherwise None.
+    """
+    if search_body.continuation_tokens:
+        return None
+    return search_body.limit
+
+
 @observe("identify_search_type")
 def identify_search_type(search_body: SearchRequestBody) -> str:
     """Identify the search type from parameters"""
@@ -496,22 +612,42 @@ def make_search_request(
     db: Session,
     vespa_search_adapter: VespaSearchAdapter,
     search_body: SearchRequestBody,
+    cache: Optional[SearchResponseCache] = None,
+    allowed_corpora_ids: Optional[Sequence[str]] = None,
+    geography_index: Optional[GeographyIndex] = None,
 ) -> SearchResponse:
-    """Perform a search request against the Vespa search engine"""
+    """Perform a search request against the Vespa search engine
+
+    If a cache is given, an identical request for the same allowed corpora
+    in the current ingest cycle is served from the cache.
+    """
 
     try:
+        cache_key = cache.make_key(search_body, allowed_corpora_ids) if cache else None
+        if cache is not None and (cached := cache.get(cache_key)) is not None:
+            return cached
+
         search_body = mutate_search_body_for_search_type(search_body=search_body)
-        cpr_sdk_search_params = create_vespa_search_params(db, search_body)
-        cpr_sdk_search_response = observe("vespa_search")(vespa_search_adapter.search)(
-            parameters=cpr_sdk_search_params
-        )
-        return process_vespa_search_response(
+        with search_stage(SearchStage.filter_conversion):
+            cpr_sdk_search_params = create_vespa_search_params(
+                db, search_body, geography_index
+            )
+        with search_stage(SearchStage.vespa_round_trip):
+            cpr_sdk_search_response = observe("vespa_search")(
+                vespa_search_adapter.search
+            )(parameters=paginate_vespa_search_params(cpr_sdk_search_params))
+        search_response = process_vespa_search_response(
             db,
             cpr_sdk_search_response,
             limit=search_body.page_size,
             offset=search_body.offset,
             sort_within_page=search_body.sort_within_page,
+            result_limit=get_result_limit(search_body),
         ).increment_pages()
+
+        if cache is not None:
+            cache.set(cache_key, search_response)
+        return search_response
     except QueryError as e:
         _LOGGER.error(f"make_search_request QueryError: {e}")
         raise ValidationError(e)
@@ -520,6 +656,63 @@ def make_search_request(
         raise Exception(e)
 
 
+@observe("make_search_request_async")
+async def make_search_request_async(
+    db: Session,
+    vespa_search_adapter: VespaSearchAdapter,
+    search_body: SearchRequestBody,
+    cache: Optional[SearchResponseCache] = None,
+    allowed_corpora_ids: Optional[Sequence[str]] = None,
+    geography_index: Optional[GeographyIndex] = None,
+) -> SearchResponse:
+    """Perform a search request against Vespa without blocking the event loop.
+
+    The Vespa round trip is awaited using the non-blocking client, whilst the
+    synchronous RDS work (filter conversion and enrichment of the Vespa
+    response) is run on the threadpool so the worker can keep serving other
+    in-flight requests. Caching behaves as in `make_search_request`.
+    """
+
+    try:
+        cache_key = (
+            await run_in_threadpool(cache.make_key, search_body, allowed_corpora_ids)
+            if cache
+            else None
+        )
+        if cache is not None and (cached := cache.get(cache_key)) is not None:
+            return cached
+
+        search_body = mutate_search_body_for_search_type(search_body=search_body)
+        with search_stage(SearchStage.filter_conversion):
+            cpr_sdk_search_params = await run_in_threadpool(
+                create_vespa_search_params, db, search_body, geography_index
+            )
+        with search_stage(SearchStage.vespa_round_trip):
+            cpr_sdk_search_response = await observe("vespa_search")(
+                vespa_search_adapter.async_search
+            )(parameters=paginate_vespa_search_params(cpr_sdk_search_params))
+        search_response = await run_in_threadpool(
+            process_vespa_search_response,
+            db,
+            cpr_sdk_search_response,
+            limit=search_body.page_size,
+            offset=search_body.offset,
+            sort_within_page=search_body.sort_within_page,
+            result_limit=get_result_limit(search_body),
+        )
+        search_response = search_response.increment_pages()
+
+        if cache is not None:
+            cache.set(cache_key, search_response)
+        return search_response
+    except QueryError as e:
+        _LOGGER.error(f"make_search_request_async QueryError: {e}")
+        raise ValidationError(e)
+    except Exception as e:
+        _LOGGER.error(f"make_search_request_async Exception: {e}")
+        raise Exception(e)
+
+
 @observe("get_family_from_vespa")
 def get_family_from_vespa(
     family_id: str,
@@ -588,7 +781,9 @@ def get_document_from_vespa(
 
 @observe("get_s3_doc_url_from_cdn")
 def get_s3_doc_url_from_cdn(
-    s3_client: S3Client, s3_document: S3Document, data_dump_s3_key: str
+    s3_client: Union[S3Client, S3MetadataCache],
+    s3_document: S3Document,
+    data_dump_s3_key: str,
 ) -> Optional[str]:
     redirect_url = None
     if s3_client.document_exists(s3_document):
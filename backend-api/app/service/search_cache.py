@@ -0,0 +1,171 @@
+"""Response cache for search requests.
+
+Identical searches are common (homepage links, shared URLs and pagination), and
+search results only change when data is ingested or edited. Responses are cached
+against a canonical form of the request body and the caller's allowed corpora,
+and the whole cache is dropped whenever the data version changes.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from typing import Any, Callable, Optional, Sequence
+
+from fastapi import Request
+
+from app.config import (
+    SEARCH_CACHE_ENABLED,
+    SEARCH_CACHE_MAX_ENTRIES,
+    SEARCH_CACHE_TTL_SECONDS,
+    SEARCH_CACHE_VERSION_CHECK_SECONDS,
+)
+from app.models.search import SearchRequestBody, SearchResponse
+from app.service.cache import CacheBackend, InMemoryCacheBackend
+from app.service.data_version import DataVersionTracker
+from app.service.util import get_cache_version_provider
+
+_LOGGER = logging.getLogger(__name__)
+
+# Request fields where the order of the values does not affect the results.
+_UNORDERED_FIELDS = (
+    "corpus_import_ids",
+    "corpus_type_names",
+    "family_ids",
+    "document_ids",
+)
+
+
+def canonicalise_search_body(search_body: SearchRequestBody) -> dict[str, Any]:
+    """Normalise a search request so that equivalent requests compare equal.
+
+    Whitespace in the query string is collapsed, and the values of fields
+    where ordering is irrelevant are sorted. The derived `filters` field is
+    excluded as it is computed from `keyword_filters`.
+
+    :param SearchRequestBody search_body: The search request to normalise.
+    :return dict[str, Any]: A JSON serialisable canonical form.
+    """
+    body = search_body.model_dump(mode="json", exclude={"filters"})
+
+    body["query_string"] = " ".join((body.get("query_string") or "").split())
+
+    for field in _UNORDERED_FIELDS:
+        if body.get(field) is not None:
+            body[field] = sorted(body[field])
+
+    if body.get("keyword_filters"):
+        body["keyword_filters"] = {
+            field: sorted(values)
+            for field, values in body["keyword_filters"].items()
+            if values
+        }
+
+    return body
+
+
+class SearchResponseCache:
+    """Caches search responses for the current data version.
+
+    :param CacheBackend backend: Where cached responses are stored.
+    :param Callable[[], Optional[str]] version_provider: Returns the
+        current data version. It is called on every request, so must be
+        cheap. Nothing is cached while this is unknown.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        version_provider: Callable[[], Optional[str]],
+    ) -> None:
+        self.backend = backend
+        self._version_provider = version_provider
+        self._version: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def current_version(self) -> Optional[str]:
+        """Get the data version, clearing the cache if it has changed.
+
+        :return Optional[str]: The current data version, or None if it
+            could not be determined.
+        """
+        with self._lock:
+            try:
+                version = self._version_provider()
+            except Exception as e:
+                _LOGGER.warning(f"Could not determine search cache version: {e}")
+                return self._version
+
+            if version != self._version:
+                _LOGGER.info(
+                    "Search cache version changed, clearing cache",
+                    extra={"props": {"old": self._version, "new": version}},
+                )
+                self.backend.clear()
+                self._version = version
+            return self._version
+
+    def make_key(
+        self,
+        search_body: SearchRequestBody,
+        allowed_corpora_ids: Optional[Sequence[str]],
+    ) -> Optional[str]:
+        """Build the cache key for a request.
+
+        :param SearchRequestBody search_body: The incoming search request.
+        :param Optional[Sequence[str]] allowed_corpora_ids: The corpora the
+            caller's app token allows.
+        :return Optional[str]: The key, or None if the response should not
+            be cached.
+        """
+        version = self.current_version()
+        if version is None:
+            return None
+
+        key_content = {
+            "version": version,
+            "allowed_corpora_ids": sorted(allowed_corpora_ids or []),
+            "search_body": canonicalise_search_body(search_body),
+        }
+        serialised = json.dumps(key_content, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(serialised.encode("utf-8")).hexdigest()
+
+    def get(self, key: Optional[str]) -> Optional[SearchResponse]:
+        if key is None:
+            return None
+        response = self.backend.get(key)
+        if response is None:
+            return None
+        # Hand out a copy so callers cannot mutate the cached response
+        return response.model_copy(deep=True)
+
+    def set(self, key: Optional[str], response: SearchResponse) -> None:
+        if key is None:
+            return
+        self.backend.set(key, response.model_copy(deep=True))
+
+
+def make_search_response_cache(
+    data_version_tracker: Optional[DataVersionTracker] = None,
+) -> Optional[SearchResponseCache]:
+    """Create the search response cache if it is enabled in config.
+
+    :param Optional[DataVersionTracker] data_version_tracker: Provides the
+        data version the cache is invalidated on.
+    """
+    if not SEARCH_CACHE_ENABLED:
+        return None
+
+    return SearchResponseCache(
+        backend=InMemoryCacheBackend(
+            max_entries=SEARCH_CACHE_MAX_ENTRIES,
+            ttl_seconds=SEARCH_CACHE_TTL_SECONDS,
+        ),
+        version_provider=get_cache_version_provider(
+            data_version_tracker, SEARCH_CACHE_VERSION_CHECK_SECONDS
+        ),
+    )
+
+
+def get_search_response_cache(request: Request) -> Optional[SearchResponseCache]:
+    return getattr(request.app.state, "search_response_cache", None)
@@ -0,0 +1,166 @@
+"""Per-stage latency histograms for search requests.
+
+Search spans tell us how long a request took, but not which stage to blame
+when the tail latency regresses. Each stage of a search is timed into the
+`SearchStageTimings` active for the request, and the durations are recorded
+to a histogram once the size of the response is known, labelled with the
+stage, the search type and a bucketed result size.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import Enum
+from typing import Iterator, Optional
+
+from fastapi import Request
+from opentelemetry.metrics import Histogram
+
+from app.config import SEARCH_METRICS_ENABLED
+from app.models.search import SearchRequestBody, SearchResponse
+from app.telemetry import Telemetry
+
+
+class SearchStage(str, Enum):
+    filter_conversion = "filter_conversion"
+    vespa_round_trip = "vespa_round_trip"
+    vespa_response_parsing = "vespa_response_parsing"
+    rds_enrichment = "rds_enrichment"
+    passage_sorting = "passage_sorting"
+    serialisation = "serialisation"
+
+
+# The upper bound of each result size bucket, and the bucket's label.
+_RESULT_SIZE_BUCKETS = ((0, "0"), (10, "1-10"), (100, "11-100"), (1000, "101-1000"))
+
+_current_timings: ContextVar[Optional["SearchStageTimings"]] = ContextVar(
+    "search_stage_timings", default=None
+)
+
+
+def get_search_type_label(search_body: SearchRequestBody) -> str:
+    """Label a search as a browse, exact or semantic search.
+
+    :param SearchRequestBody search_body: The search request.
+    :return str: The search type label.
+    """
+    if not search_body.query_string:
+        return "browse"
+    return "exact" if search_body.exact_match else "semantic"
+
+
+def get_result_size(search_response: SearchResponse) -> int:
+    """Count the families and passage matches in a search response.
+
+    :param SearchResponse search_response: The search response.
+    :return int: The number of families and passages returned.
+    """
+    return sum(
+        1
+        + sum(
+            len(family_document.document_passage_matches)
+            for family_document in family.family_documents
+        )
+        for family in search_response.families
+    )
+
+
+def get_result_size_bucket(result_size: int) -> str:
+    """Bucket a result size to keep the label cardinality low.
+
+    :param int result_size: The number of families and passages returned.
+    :return str: The result size bucket label.
+    """
+    for upper_bound, label in _RESULT_SIZE_BUCKETS:
+        if result_size <= upper_bound:
+            return label
+    return f"{_RESULT_SIZE_BUCKETS[-1][0] + 1}+"
+
+
+class SearchStageTimings:
+    """The durations of the stages of a single search request, in seconds."""
+
+    def __init__(self) -> None:
+        self.durations: dict[SearchStage, float] = {}
+
+    @contextmanager
+    def activate(self) -> Iterator["SearchStageTimings"]:
+        """Time stages run in this context, including on the threadpool."""
+        token = _current_timings.set(self)
+        try:
+            yield self
+        finally:
+            _current_timings.reset(token)
+
+    def add(self, stage: SearchStage, seconds: float) -> None:
+        self.durations[stage] = self.durations.get(stage, 0.0) + seconds
+
+
+@contextmanager
+def search_stage(stage: SearchStage) -> Iterator[None]:
+    """Time a stage of the search request being handled, if any.
+
+    :param SearchStage stage: The stage being run.
+    """
+    timings = _current_timings.get()
+    if timings is None:
+        yield
+        return
+
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add(stage, time.perf_counter() - started)
+
+
+class SearchMetrics:
+    """Records search stage durations to a histogram.
+
+    :param Histogram histogram: The histogram to record durations with.
+    """
+
+    def __init__(self, histogram: Histogram) -> None:
+        self._histogram = histogram
+
+    def record(
+        self,
+        timings: SearchStageTimings,
+        search_body: SearchRequestBody,
+        search_response: SearchResponse,
+    ) -> None:
+        """Record the stage durations of a search request.
+
+        :param SearchStageTimings timings: The durations to record.
+        :param SearchRequestBody search_body: The search request.
+        :param SearchResponse search_response: The response, to bucket the
+            result size.
+        """
+        attributes = {
+            "search_type": get_search_type_label(search_body),
+            "result_size_bucket": get_result_size_bucket(
+                get_result_size(search_response)
+            ),
+        }
+        for stage, seconds in timings.durations.items():
+            self._histogram.record(seconds, {**attributes, "stage": stage.value})
+
+
+def make_search_metrics(telemetry: Telemetry) -> Optional[SearchMetrics]:
+    """Create the search metrics if they are enabled in config.
+
+    :param Telemetry telemetry: The telemetry to create the histogram with.
+    """
+    if not SEARCH_METRICS_ENABLED:
+        return None
+
+    return SearchMetrics(
+        telemetry.create_histogram(
+            "search_stage_duration",
+            description="Time spent in each stage of a search request",
+        )
+    )
+
+
+def get_search_metrics(request: Request) -> Optional[SearchMetrics]:
+    return getattr(request.app.state, "search_metrics", None)
@@ -0,0 +1,262 @@
+"""In-memory index of slugs used to resolve family, document and collection pages.
+
+Every page view starts by resolving its slug to an import ID. Slugs only change
+with the family data, so each worker keeps an index of them, loaded at startup
+and reloaded whenever the data version changes.
+
+The index only answers lookups it can answer positively, and only while it
+was loaded at the current data version. Unknown slugs, slugs that are not in
+the caller's allowed corpora, and lookups made while the index is catching up
+with an edit are looked up in the DB, so the index never serves a slug that
+has since been removed from a corpus or deleted.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Mapping, NamedTuple, Optional
+
+from fastapi import Request
+from sqlalchemy.orm import Session
+
+from app.clients.db.session import SessionLocal
+from app.config import SLUG_INDEX_ENABLED, SLUG_INDEX_REFRESH_SECONDS
+from app.repository.collection import get_id_from_slug
+from app.repository.document import get_slugged_objects
+from app.repository.slug import get_slugs_with_corpora
+from app.service.cache import RefreshingValue
+from app.service.data_version import DataVersionTracker
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SlugTarget(NamedTuple):
+    """The entity a slug leads to, and the corpora it is visible in."""
+
+    family_document_import_id: Optional[str]
+    family_import_id: Optional[str]
+    collection_import_id: Optional[str]
+    corpus_import_ids: frozenset[str]
+
+    def is_visible_in(self, allowed_corpora: Optional[list[str]]) -> bool:
+        if allowed_corpora in [None, []]:
+            return True
+        return not self.corpus_import_ids.isdisjoint(allowed_corpora)
+
+
+@dataclass(frozen=True)
+class SlugSnapshot:
+    """A point in time view of the slugs."""
+
+    targets: Mapping[str, SlugTarget] = field(default_factory=dict)
+    version: Optional[str] = None
+    """The data version the slugs were loaded at."""
+
+
+def load_slug_snapshot(db: Session, version: Optional[str]) -> SlugSnapshot:
+    """Load all slugs.
+
+    :param Session db: Database session.
+    :param Optional[str] version: The data version read before loading.
+    :return SlugSnapshot: The new snapshot.
+    """
+    targets = {}
+
+    # Most slugs share the same few corpora sets, so share the frozensets too
+    corpora_sets: dict[frozenset[str], frozenset[str]] = {}
+    for row in get_slugs_with_corpora(db):
+        corpora = frozenset(row.corpus_import_ids or [])
+        targets[row.name] = SlugTarget(
+            family_document_import_id=row.family_document_import_id,
+            family_import_id=row.family_import_id,
+            collection_import_id=row.collection_import_id,
+            corpus_import_ids=corpora_sets.setdefault(corpora, corpora),
+        )
+
+    return SlugSnapshot(targets=targets, version=version)
+
+
+class SlugIndex:
+    """Serves slug lookups from memory, reloading them when the data changes.
+
+    :param Callable[[], Session] session_factory: Creates a DB session for
+        loading the slugs.
+    :param DataVersionTracker data_version_tracker: Provides the current
+        data version.
+    :param float refresh_seconds: How often to check whether the data version
+        has moved on from the loaded slugs.
+    :param Callable[[], float] clock: Monotonic clock, overridable in tests.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        data_version_tracker: DataVersionTracker,
+        refresh_seconds: float = 10,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._session_factory = session_factory
+        self._data_version_tracker = data_version_tracker
+        self._clock = clock
+        self._snapshot = RefreshingValue(
+            loader=self._load,
+            refresh_seconds=refresh_seconds,
+            name="slug index",
+            clock=clock,
+        )
+        self._initial_load_started_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """Load the index without blocking startup."""
+        self._start_initial_load()
+
+    def lookup(self, slug: str) -> Optional[SlugTarget]:
+        """Get what a slug leads to, if the index knows about it.
+
+        Also starts a background reload check if one is due.
+
+        :param str slug: The slug name.
+        :return Optional[SlugTarget]: The slug's target, or None if the
+            slug is unknown, or the index is not loaded at the current data
+            version yet.
+        """
+        if self._snapshot.peek() is None:
+            self._start_initial_load()
+            return None
+
+        # Lookups run on the event loop, so they don't wait for the first
+        # load of the data version
+        snapshot = self._snapshot.get()
+        version = self._data_version_tracker.current_version(load=False)
+        if version is None or version != snapshot.version:
+            return None
+        return snapshot.targets.get(slug)
+
+    def _start_initial_load(self) -> None:
+        # Retry a failed initial load at most once per refresh interval
+        with self._lock:
+            now = self._clock()
+            if (
+                self._initial_load_started_at is not None
+                and now - self._initial_load_started_at < self._snapshot.refresh_seconds
+            ):
+                return
+            self._initial_load_started_at = now
+        threading.Thread(target=self._initial_load, daemon=True).start()
+
+    def _initial_load(self) -> None:
+        try:
+            self._snapshot.refresh()
+        except Exception:
+            _LOGGER.exception("Failed to load slug index")
+
+    def _load(self) -> SlugSnapshot:
+        # Read the version first, so an edit made during the load moves the
+        # version on and causes another reload
+        version = self._data_version_tracker.current_version()
+        previous = self._snapshot.peek()
+        if previous is not None and version is not None and version == previous.version:
+            return previous
+
+        db = self._session_factory()
+        try:
+            snapshot = load_slug_snapshot(db, version)
+        finally:
+            db.close()
+        _LOGGER.info(
+            "Loaded slug index",
+            extra={"props": {"slugs": len(snapshot.targets)}},
+        )
+        return snapshot
+
+
+def make_slug_index(
+    data_version_tracker: Optional[DataVersionTracker],
+) -> Optional[SlugIndex]:
+    """Create and start the slug index if it is enabled in config.
+
+    The index relies on the data version to know when its slugs are out of
+    date, so it is disabled along with the data version.
+
+    :param Optional[DataVersionTracker] data_version_tracker: The data
+        version tracker, if enabled.
+    :return Optional[SlugIndex]: The started slug index, or None.
+    """
+    if not SLUG_INDEX_ENABLED:
+        return None
+    if data_version_tracker is None:
+        _LOGGER.warning("Slug index is disabled as the data version is disabled")
+        return None
+
+    slug_index = SlugIndex(
+        session_factory=SessionLocal,
+        data_version_tracker=data_version_tracker,
+        refresh_seconds=SLUG_INDEX_REFRESH_SECONDS,
+    )
+    slug_index.start()
+    return slug_index
+
+
+def get_slug_index(request: Request) -> Optional[SlugIndex]:
+    return getattr(request.app.state, "slug_index", None)
+
+
+def resolve_family_or_document_slug(
+    db: Session,
+    slug: str,
+    allowed_corpora: Optional[list[str]] = None,
+    slug_index: Optional[SlugIndex] = None,
+) -> tuple[Optional[str], Optional[str]]:
+    """Match a slug to a FamilyDocument or Family import ID.
+
+    As `get_slugged_objects`, but served from the slug index when it knows
+    the slug.
+
+    :param Session db: Database session, used if the index can't answer.
+    :param str slug: The slug name.
+    :param Optional[list[str]] allowed_corpora: The corpora IDs to look
+        for the slugged object in.
+    :param Optional[SlugIndex] slug_index: The slug index, if enabled.
+    :return tuple[Optional[str], Optional[str]]: the FamilyDocument
+        import id or the Family import_id.
+    """
+    target = slug_index.lookup(slug) if slug_index is not None else None
+    if (
+        target is not None
+        and (target.family_document_import_id or target.family_import_id)
+        and target.is_visible_in(allowed_corpora)
+    ):
+        return target.family_document_import_id, target.family_import_id
+
+    return get_slugged_objects(db, slug, allowed_corpora)
+
+
+def resolve_collection_slug(
+    db: Session,
+    slug: str,
+    allowed_corpora: Optional[list[str]] = None,
+    slug_index: Optional[SlugIndex] = None,
+) -> Optional[str]:
+    """Match a slug to a Collection import ID.
+
+    As `get_id_from_slug`, but served from the slug index when it knows the
+    slug.
+
+    :param Session db: Database session, used if the index can't answer.
+    :param str slug: The slug name.
+    :param Optional[list[str]] allowed_corpora: The corpora IDs to look
+        for the collection in.
+    :param Optional[SlugIndex] slug_index: The slug index, if enabled.
+    :return Optional[str]: The Collection import_id, or None if not found.
+    """
+    target = slug_index.lookup(slug) if slug_index is not None else None
+    if (
+        target is not None
+        and target.collection_import_id is not None
+        and target.is_visible_in(allowed_corpora)
+    ):
+        return target.collection_import_id
+
+    return get_id_from_slug(db, slug, allowed_corpora)
@@ -2,7 +2,7 @@ import logging
 import os
 import random
 import string
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 from db_client.models import AnyModel
 from fastapi import HTTPException, status
@@ -15,6 +15,8 @@ from app.config import (
     PIPELINE_BUCKET,
     PUBLIC_APP_URL,
 )
+from app.service.cache import RefreshingValue
+from app.service.data_version import DataVersionTracker
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -109,3 +111,31 @@ def get_latest_ingest_start() -> str:
         PIPELINE_BUCKET, INGEST_TRIGGER_ROOT
     )
     return latest_ingest_start
+
+
+def get_cache_version_provider(
+    data_version_tracker: Optional[DataVersionTracker],
+    ingest_check_seconds: float = 300,
+) -> Callable[[], Optional[str]]:
+    """Get the version provider for caches of the family data.
+
+    The data version changes as soon as ingested data or an edit lands, and
+    the tracker already refreshes it in the background, so it is read on
+    every call. If it is disabled, caches fall back to the date of the
+    latest ingest cycle, which misses a second ingest on the same day and
+    changes when an ingest starts rather than when its data lands. That is
+    read from S3, so it is only re-checked every `ingest_check_seconds`.
+
+    :param Optional[DataVersionTracker] data_version_tracker: The data
+        version tracker, if enabled.
+    :param float ingest_check_seconds: How often to re-check the latest
+        ingest cycle when there is no tracker.
+    :return Callable[[], Optional[str]]: Returns the current version.
+    """
+    if data_version_tracker is None:
+        return RefreshingValue(
+            loader=get_latest_ingest_start,
+            refresh_seconds=ingest_check_seconds,
+            name="latest ingest start",
+        ).get
+    return lambda: data_version_tracker.current_version(load=False)
@@ -1,36 +1,141 @@
 """Functions to support the geographies endpoint."""
 
 import logging
-from typing import Optional
+from typing import Callable, Hashable, Optional, cast
 
+from fastapi import Request
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import Session
 
+from app.clients.db.session import SessionLocal
+from app.config import (
+    WORLD_MAP_CACHE_ENABLED,
+    WORLD_MAP_CACHE_MAX_ENTRIES,
+    WORLD_MAP_CACHE_REFRESH_SECONDS,
+    WORLD_MAP_CACHE_VERSION_CHECK_SECONDS,
+)
 from app.errors import RepositoryError, ValidationError
 from app.models.geography import GeographyStatsDTO
 from app.repository.geography import count_families_per_category_in_each_geo
+from app.service.cache import VersionedRefreshingCache, _run_in_daemon_thread
+from app.service.data_version import DataVersionTracker
+from app.service.util import get_cache_version_provider
 from app.telemetry import observe
 
 _LOGGER = logging.getLogger(__file__)
 
 
+class WorldMapStatsCache:
+    """Holds the world map stats for each set of allowed corpora.
+
+    The stats only change when data is ingested, so they are served from a
+    `VersionedRefreshingCache` keyed on the allowed corpora and refreshed
+    when a new data version is seen.
+
+    :param Callable[[], Session] session_factory: Creates a DB session for
+        loading the stats.
+    :param Callable[[], Optional[str]] version_provider: Returns the current
+        data version.
+    :param int max_entries: The maximum number of corpora sets to hold.
+    :param float refresh_seconds: How long loaded stats are fresh for.
+    :param Callable[[Callable[[], None]], None] run_in_background: Starts a
+        background refresh, overridable in tests to run synchronously.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        version_provider: Callable[[], Optional[str]],
+        max_entries: int = 100,
+        refresh_seconds: float = 3600,
+        run_in_background: Callable[[Callable[[], None]], None] = _run_in_daemon_thread,
+    ) -> None:
+        self._session_factory = session_factory
+        self._stats: VersionedRefreshingCache[list[GeographyStatsDTO]] = (
+            VersionedRefreshingCache(
+                loader=self._load,
+                version_provider=version_provider,
+                max_entries=max_entries,
+                refresh_seconds=refresh_seconds,
+                name="world map stats",
+                run_in_background=run_in_background,
+            )
+        )
+
+    def get(self, allowed_corpora: list[str]) -> list[GeographyStatsDTO]:
+        """Get the stats for a set of allowed corpora.
+
+        :param list[str] allowed_corpora: The corpora to count families in.
+        :raises Exception: if the stats are not loaded yet and fail to load.
+        :return list[GeographyStatsDTO]: The current, possibly stale, stats.
+        """
+        return list(self._stats.get(tuple(sorted(set(allowed_corpora)))))
+
+    def _load(self, allowed_corpora: Hashable) -> list[GeographyStatsDTO]:
+        db = self._session_factory()
+        try:
+            return count_families_per_category_in_each_geo(
+                db, list(cast(tuple[str, ...], allowed_corpora))
+            )
+        finally:
+            db.close()
+
+
+def make_world_map_stats_cache(
+    session_factory: Callable[[], Session] = SessionLocal,
+    data_version_tracker: Optional[DataVersionTracker] = None,
+) -> Optional[WorldMapStatsCache]:
+    """Create the world map stats cache if it is enabled in config.
+
+    :param Callable[[], Session] session_factory: Creates a DB session for
+        loading the stats.
+    :param Optional[DataVersionTracker] data_version_tracker: Provides the
+        data version the stats are refreshed on.
+    """
+    if not WORLD_MAP_CACHE_ENABLED:
+        return None
+
+    return WorldMapStatsCache(
+        session_factory=session_factory,
+        version_provider=get_cache_version_provider(
+            data_version_tracker, WORLD_MAP_CACHE_VERSION_CHECK_SECONDS
+        ),
+        max_entries=WORLD_MAP_CACHE_MAX_ENTRIES,
+        refresh_seconds=WORLD_MAP_CACHE_REFRESH_SECONDS,
+    )
+
+
+def get_world_map_stats_cache(request: Request) -> Optional[WorldMapStatsCache]:
+    return getattr(request.app.state, "world_map_stats_cache", None)
+
+
 @observe(name="get_world_map_stats")
 def get_world_map_stats(
-    db: Session, allowed_corpora: Optional[list[str]]
+    db: Optional[Session],
+    allowed_corpora: Optional[list[str]],
+    cache: Optional[WorldMapStatsCache] = None,
 ) -> list[GeographyStatsDTO]:
     """
     Get a count of fam per category per geography for all geographies.
 
-    :param db Session: The database session.
+    :param db Optional[Session]: The database session, not used if there is
+        a cache.
     :param Optional[list[str]] allowed_corpora: The list of allowed
         corpora IDs to filter on.
+    :param Optional[WorldMapStatsCache] cache: Serves the stats without
+        querying the database when given.
     :return list[GeographyStatsDTO]: A list of Geography stats objects
     """
     if allowed_corpora is None or allowed_corpora == []:
         raise ValidationError("No allowed corpora provided")
 
     try:
-        family_geo_stats = count_families_per_category_in_each_geo(db, allowed_corpora)
+        if cache is not None:
+            family_geo_stats = cache.get(allowed_corpora)
+        else:
+            family_geo_stats = count_families_per_category_in_each_geo(
+                cast(Session, db), allowed_corpora
+            )
     except OperationalError as e:
         _LOGGER.error(e)
         raise RepositoryError("Error querying the database for geography stats")
@@ -1,4 +1,5 @@
 import functools
+import inspect
 import logging
 import logging.config
 from contextlib import nullcontext
@@ -8,15 +9,19 @@ from typing import Callable
 from fastapi import FastAPI
 
 ## Tracing imports - stable
-from opentelemetry import trace
+from opentelemetry import metrics, trace
 from opentelemetry._logs import set_logger_provider
 from opentelemetry.exporter.otlp.proto.http._log_exporter import OTLPLogExporter
+from opentelemetry.exporter.otlp.proto.http.metric_exporter import OTLPMetricExporter
 from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
 from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+from opentelemetry.metrics import Histogram
 
 # These are beta still, so may change and break compatibility
 from opentelemetry.sdk._logs import LoggerProvider, LoggingHandler
 from opentelemetry.sdk._logs.export import BatchLogRecordProcessor
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor
 from opentelemetry.trace import NonRecordingSpan
@@ -70,6 +75,7 @@ class Telemetry:
 
         self.tracer = trace.get_tracer(self.config.service_instance_id)
 
+        self._configure_metrics()
         self._configure_logging()
         self.get_logger().info("Telemetry initialized")
 
@@ -85,6 +91,36 @@ class Telemetry:
         """Returns the otel tracer"""
         return self.tracer
 
+    def _configure_metrics(self):
+        """Configure the meter provider and OTLP metrics exporter"""
+        metric_reader = PeriodicExportingMetricReader(
+            OTLPMetricExporter(
+                endpoint=(
+                    f"{self.config.otlp_endpoint}/v1/metrics"
+                    if self.config.otlp_endpoint
+                    else None
+                )
+            ),
+            export_interval_millis=self.config.metrics_export_interval_ms,
+        )
+        self.meter_provider = MeterProvider(
+            resource=self.resource, metric_readers=[metric_reader]
+        )
+        metrics.set_meter_provider(self.meter_provider)
+        self.meter = metrics.get_meter(self.config.service_name)
+
+    def full_metric_name(self, metric: str) -> str:
+        """Returns the namespaced metric name, as used across Navigator services"""
+        return f"cpr_{self.config.namespace_name}_{self.config.service_name}_{self.config.component_name}_{metric}"
+
+    def create_histogram(
+        self, name: str, description: str = "", unit: str = "s"
+    ) -> Histogram:
+        """Returns a histogram for measuring distributions, e.g. latencies"""
+        return self.meter.create_histogram(
+            name=self.full_metric_name(name), description=description, unit=unit
+        )
+
     def _configure_logging(self):
         """Configure logging integration"""
         logger_provider = LoggerProvider(resource=self.resource)
@@ -130,14 +166,23 @@ def observe(name: str) -> Callable:
     """Decorator to wrap a function in an OTel span."""
 
     def decorator(func: Callable):
-        @functools.wraps(func)
-        def wraps(*args, **kwargs):
+        def _span():
             if isinstance(trace.get_current_span(), NonRecordingSpan):
-                span = nullcontext()
-            else:
-                span = trace.get_tracer(func.__module__).start_as_current_span(name)
+                return nullcontext()
+            return trace.get_tracer(func.__module__).start_as_current_span(name)
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wraps(*args, **kwargs):
+                with _span():
+                    return await func(*args, **kwargs)
 
-            with span:
+            return async_wraps
+
+        @functools.wraps(func)
+        def wraps(*args, **kwargs):
+            with _span():
                 return func(*args, **kwargs)
 
         return wraps
@@ -58,6 +58,7 @@ class TelemetryConfig(BaseSettings):
     otlp_endpoint: str = Field(default="")
     resource_attributes: str = Field(default="")
     log_level: str = Field(default="INFO")
+    metrics_export_interval_ms: int = Field(default=60000)
 
     # Automatic attributes
     hostname: str = Field(default="")
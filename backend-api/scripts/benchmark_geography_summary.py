@@ -0,0 +1,91 @@
+"""Benchmark the geography summary queries against a local database.
+
+Compares running `browse_rds_families` once per family category with the
+single `browse_rds_families_by_category` query, and checks they agree.
+
+Load a database dump into your local Postgres first (see
+docs/local_full_stack_setup/README.md), then run from the backend-api
+directory with DATABASE_URL pointing at it:
+
+    uv run python scripts/benchmark_geography_summary.py --geography india
+"""
+
+import logging
+import statistics
+import time
+from typing import Callable
+
+import click
+from db_client.models.dfce import FamilyCategory
+
+from app.clients.db.session import SessionLocal
+from app.models.search import BrowseArgs
+from app.repository.search import (
+    browse_rds_families,
+    browse_rds_families_by_category,
+)
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def per_category_summary(db, geography_slug: str) -> dict:
+    summary = {}
+    for category in FamilyCategory:
+        (families_count, results) = browse_rds_families(
+            db,
+            BrowseArgs(
+                geography_slugs=[geography_slug],
+                categories=[category],
+                offset=0,
+                limit=None,
+            ),
+        )
+        summary[category] = (families_count, list(results.families))
+    return summary
+
+
+def single_query_summary(db, geography_slug: str) -> dict:
+    return browse_rds_families_by_category(db, [geography_slug])
+
+
+def time_summary(
+    summary: Callable[..., dict], db, geography_slug: str, iterations: int
+) -> list[float]:
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        summary(db, geography_slug)
+        timings.append((time.perf_counter() - start) * 1000)
+        # Don't let the identity map hide the cost of loading families
+        db.expunge_all()
+    return timings
+
+
+@click.command()
+@click.option("--geography", "geography_slug", required=True, help="Geography slug")
+@click.option("--iterations", default=20, show_default=True)
+def main(geography_slug: str, iterations: int) -> None:
+    db = SessionLocal()
+    try:
+        per_category = per_category_summary(db, geography_slug)
+        single_query = single_query_summary(db, geography_slug)
+        for category in FamilyCategory:
+            if per_category[category][0] != single_query[category][0]:
+                logger.warning(f"💥 Family counts differ for {category}")
+
+        for name, summary in [
+            ("per category", per_category_summary),
+            ("single query", single_query_summary),
+        ]:
+            timings = time_summary(summary, db, geography_slug, iterations)
+            logger.info(
+                f"⏱️ {name}: median {statistics.median(timings):.1f}ms, "
+                f"min {min(timings):.1f}ms, max {max(timings):.1f}ms"
+            )
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Benchmark serving a large response as a model and as pre-serialised JSON.
+
+Compares FastAPI's default handling of a returned `SearchResponse` (validation
+against the `response_model`, then serialisation) with serving JSON that was
+serialised ahead of time, as the config endpoint does. The response has 100
+families with 10 passages each. Each is served through a test client, so the
+figures include the rest of the request handling too.
+
+Run from the backend-api directory:
+
+    uv run python scripts/benchmark_json_response.py
+"""
+
+import logging
+import statistics
+import time
+
+import click
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.models.search import (
+    SearchResponse,
+    SearchResponseDocumentPassage,
+    SearchResponseFamily,
+    SearchResponseFamilyDocument,
+)
+from app.service.json_response import model_to_json, serialised_json_response
+
+logging.basicConfig(level=logging.INFO)
+logging.getLogger("httpx").setLevel(logging.WARNING)
+logger = logging.getLogger(__name__)
+
+
+def make_search_response(families: int, passages: int) -> SearchResponse:
+    return SearchResponse(
+        hits=families,
+        total_family_hits=families,
+        query_time_ms=10,
+        total_time_ms=20,
+        families=[
+            SearchResponseFamily(
+                family_slug=f"family-{f}",
+                family_name=f"Family {f}",
+                family_description="A national climate change adaptation strategy.",
+                family_category="Executive",
+                family_date="2020-01-01T00:00:00+00:00",
+                family_source="CCLW",
+                corpus_import_id="CCLW.corpus.i00000001.n0000",
+                corpus_type_name="Laws and Policies",
+                family_geographies=["GBR"],
+                family_metadata={"topic": ["Adaptation"], "sector": ["Energy"]},
+                family_title_match=False,
+                family_description_match=False,
+                total_passage_hits=passages,
+                family_documents=[
+                    SearchResponseFamilyDocument(
+                        document_title=f"Document {f}",
+                        document_slug=f"document-{f}",
+                        document_type="Strategy",
+                        document_url=f"https://cdn.climatepolicyradar.org/{f}.pdf",
+                        document_content_type="application/pdf",
+                        document_passage_matches=[
+                            SearchResponseDocumentPassage(
+                                text="Adaptation to the impacts of climate change "
+                                "across the energy sector.",
+                                text_block_id=f"p{p}_b{p}",
+                                text_block_page=p,
+                                text_block_coords=[(0.0, 0.0), (1.0, 1.0)],
+                                block_id_sort_key=p,
+                            )
+                            for p in range(passages)
+                        ],
+                    )
+                ],
+            )
+            for f in range(families)
+        ],
+    )
+
+
+def make_client(search_response: SearchResponse) -> TestClient:
+    app = FastAPI()
+
+    @app.get("/default", response_model=SearchResponse)
+    def default():
+        return search_response
+
+    content = model_to_json(search_response)
+
+    @app.get("/serialised", response_model=SearchResponse)
+    def serialised():
+        return serialised_json_response(content)
+
+    return TestClient(app)
+
+
+def time_requests(client: TestClient, path: str, iterations: int) -> list[float]:
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        client.get(path).raise_for_status()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+@click.command()
+@click.option("--families", default=100, show_default=True)
+@click.option("--passages", default=10, show_default=True)
+@click.option("--iterations", default=200, show_default=True)
+def main(families: int, passages: int, iterations: int) -> None:
+    client = make_client(make_search_response(families, passages))
+    paths = ["/default", "/serialised"]
+    expected = client.get("/default").json()
+    if any(client.get(path).json() != expected for path in paths):
+        logger.warning("💥 Responses differ")
+
+    for path in paths:
+        timings = time_requests(client, path, iterations)
+        logger.info(
+            f"⏱️ {path}: {len(timings) / sum(timings):.0f} requests/s, "
+            f"median {statistics.median(timings) * 1000:.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Create the family browse dates table and the triggers that maintain it.
+
+The API only reads the `family_browse_dates` table, and sorts browse results
+by it once its triggers are in place. The triggers keep the dates up to date
+on every family and event write, so there is nothing to refresh. Create the
+table once, until it is part of the navigator-db-client migrations:
+
+    uv run python scripts/family_browse_dates.py create
+
+Running it again recomputes the dates of every family, e.g. if the triggers
+were disabled for a bulk load.
+
+Run from the backend-api directory with DATABASE_URL pointing at the
+database.
+"""
+
+import logging
+
+import click
+
+from app.clients.db.session import SessionLocal
+from app.repository.family_browse_dates import create_family_browse_dates
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+@click.group()
+def main() -> None:
+    pass
+
+
+@main.command()
+def create() -> None:
+    """Create the table and its triggers, and compute the dates."""
+    db = SessionLocal()
+    try:
+        create_family_browse_dates(db)
+    finally:
+        db.close()
+    logger.info("Created family browse dates")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+import json
+import tracemalloc
+from typing import Any, Callable
+
+from cpr_sdk.models.search import Family as CprSdkFamily
+from cpr_sdk.models.search import Passage as CprSdkPassage
+from cpr_sdk.models.search import SearchResponse as CprSdkSearchResponse
+from sqlalchemy.orm import Session
+
+from tests.search.vespa.setup_search_tests import (
+    VESPA_DOCUMENT_PATH,
+    VESPA_FAMILY_PATH,
+    VespaFixture,
+    _create_document,
+    _create_family,
+    _create_family_event,
+    _create_family_metadata_deterministic,
+)
+
+# The number of passage hits in each benchmarked Vespa response
+BENCHMARK_HIT_COUNTS = [10, 100, 1000]
+HITS_PER_FAMILY = 10
+BENCHMARK_ROUNDS = 10
+
+
+def _load_fixture(path) -> list[VespaFixture]:
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def _benchmark_family(family: VespaFixture, index: int) -> VespaFixture:
+    """Copy a recorded family document under new ids, so it can be repeated."""
+    fields = dict(family["fields"])
+    source = fields["family_source"]
+    document_import_id = f"{source}.document.{index}.0"
+    fields.update(
+        family_import_id=f"{source}.family.{index}.0",
+        document_import_id=document_import_id,
+        family_slug=f"{fields['family_slug']}-{index}",
+        document_slug=f"{fields['document_slug']}-{index}",
+    )
+    return {
+        "id": f"id:doc_search:family_document::{document_import_id}",
+        "fields": fields,
+    }
+
+
+def _benchmark_families(hit_count: int) -> list[VespaFixture]:
+    recorded_families = _load_fixture(VESPA_FAMILY_PATH)
+    return [
+        _benchmark_family(recorded_families[i % len(recorded_families)], i)
+        for i in range(hit_count // HITS_PER_FAMILY)
+    ]
+
+
+def make_benchmark_search_response(hit_count: int) -> CprSdkSearchResponse:
+    """
+    Build a Vespa search response from the recorded search fixtures
+
+    The recorded passages are spread over copies of the recorded families,
+    with `HITS_PER_FAMILY` passage hits each. As in a Vespa response, each
+    passage hit carries the fields of its family document.
+    """
+    # The recorded concepts predate the SDK's concept model, and the search
+    # responses don't use them
+    recorded_passages = [
+        {
+            "id": passage["id"],
+            "fields": {k: v for k, v in passage["fields"].items() if k != "concepts"},
+        }
+        for passage in _load_fixture(VESPA_DOCUMENT_PATH)
+    ]
+    results = []
+    for i, family in enumerate(_benchmark_families(hit_count)):
+        hits = []
+        for j in range(HITS_PER_FAMILY):
+            passage = recorded_passages[
+                (i * HITS_PER_FAMILY + j) % len(recorded_passages)
+            ]
+            hits.append(
+                CprSdkPassage.from_vespa_response(
+                    {
+                        "id": passage["id"],
+                        "relevance": 1.0,
+                        "fields": {**family["fields"], **passage["fields"]},
+                    }
+                )
+            )
+        results.append(
+            CprSdkFamily(
+                id=family["fields"]["family_import_id"],
+                hits=hits,
+                total_passage_hits=len(hits),
+            )
+        )
+
+    return CprSdkSearchResponse(
+        total_hits=hit_count,
+        total_result_hits=len(results),
+        query_time_ms=100,
+        total_time_ms=120,
+        results=results,
+    )
+
+
+def populate_benchmark_db(db: Session, hit_count: int) -> None:
+    """Sets up the database with the families in the benchmark response"""
+    recorded_passage = _load_fixture(VESPA_DOCUMENT_PATH)[0]
+    for family in _benchmark_families(hit_count):
+        _create_family(db, family)
+        _create_family_event(db, family)
+        _create_family_metadata_deterministic(db, family)
+        _create_document(db, recorded_passage, family)
+
+
+def record_peak_memory(benchmark, fn: Callable, *args: Any, **kwargs: Any) -> None:
+    """Run `fn` once more and record its peak memory use with the benchmark"""
+    tracemalloc.start()
+    try:
+        fn(*args, **kwargs)
+        _, peak_memory_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    benchmark.extra_info["peak_memory_bytes"] = peak_memory_bytes
@@ -0,0 +1,135 @@
+import copy
+
+import pytest
+from cpr_sdk.models.search import SearchResponse as CprSdkSearchResponse
+from sqlalchemy.orm import Session
+
+from app.models.search import SearchResponse
+from app.service.download import stream_result_into_csv
+from app.service.search import (
+    _parse_text_block_id,
+    _sort_passages_within_page,
+    process_vespa_search_response,
+)
+from tests.benchmarks.setup_benchmarks import (
+    BENCHMARK_HIT_COUNTS,
+    BENCHMARK_ROUNDS,
+    make_benchmark_search_response,
+    populate_benchmark_db,
+    record_peak_memory,
+)
+
+
+@pytest.fixture(params=BENCHMARK_HIT_COUNTS, ids=lambda count: f"{count}_hits")
+def hit_count(request) -> int:
+    return request.param
+
+
+@pytest.fixture
+def vespa_response(hit_count: int) -> CprSdkSearchResponse:
+    return make_benchmark_search_response(hit_count)
+
+
+@pytest.fixture
+def benchmark_db(data_db: Session, hit_count: int) -> Session:
+    populate_benchmark_db(data_db, hit_count)
+    return data_db
+
+
+def _process(
+    db: Session, vespa_response: CprSdkSearchResponse, sort_within_page: bool = True
+) -> SearchResponse:
+    return process_vespa_search_response(
+        db=db,
+        vespa_search_response=vespa_response,
+        limit=len(vespa_response.results),
+        offset=0,
+        sort_within_page=sort_within_page,
+    )
+
+
+@pytest.mark.benchmark(group="process_vespa_search_response")
+def test_benchmark_process_vespa_search_response(
+    benchmark, benchmark_db: Session, vespa_response: CprSdkSearchResponse
+):
+    # Expire loaded rows before each round so the enrichment queries are timed
+    search_response = benchmark.pedantic(
+        _process,
+        args=(benchmark_db, vespa_response),
+        setup=benchmark_db.expire_all,
+        rounds=BENCHMARK_ROUNDS,
+        warmup_rounds=1,
+    )
+    benchmark_db.expire_all()
+    record_peak_memory(benchmark, _process, benchmark_db, vespa_response)
+
+    assert len(search_response.families) == len(vespa_response.results)
+
+
+@pytest.mark.benchmark(group="passage_sorting")
+def test_benchmark_parse_text_block_ids(
+    benchmark, vespa_response: CprSdkSearchResponse
+):
+    text_block_ids = [
+        hit.text_block_id for family in vespa_response.results for hit in family.hits
+    ]
+
+    def parse_text_block_ids():
+        return [_parse_text_block_id(block_id) for block_id in text_block_ids]
+
+    parsed = benchmark(parse_text_block_ids)
+    record_peak_memory(benchmark, parse_text_block_ids)
+
+    assert len(parsed) == len(text_block_ids)
+
+
+@pytest.mark.benchmark(group="passage_sorting")
+def test_benchmark_sort_passages_within_page(
+    benchmark, benchmark_db: Session, vespa_response: CprSdkSearchResponse
+):
+    response_families = _process(
+        benchmark_db, vespa_response, sort_within_page=False
+    ).families
+
+    # Sort a fresh copy each round, as sorting sorted passages is cheaper
+    def unsorted_families():
+        return (copy.deepcopy(response_families),), {}
+
+    benchmark.pedantic(
+        _sort_passages_within_page,
+        setup=unsorted_families,
+        rounds=BENCHMARK_ROUNDS,
+        warmup_rounds=1,
+    )
+    record_peak_memory(
+        benchmark, _sort_passages_within_page, copy.deepcopy(response_families)
+    )
+
+
+@pytest.mark.benchmark(group="stream_result_into_csv")
+def test_benchmark_stream_result_into_csv(
+    benchmark, benchmark_db: Session, vespa_response: CprSdkSearchResponse
+):
+    response_families = _process(benchmark_db, vespa_response).families
+
+    def export_csv() -> bytes:
+        return b"".join(
+            stream_result_into_csv(
+                benchmark_db,
+                response_families,
+                base_url="localhost:3000",
+                is_browse=False,
+            )
+        )
+
+    csv_content = benchmark.pedantic(
+        export_csv,
+        setup=benchmark_db.expire_all,
+        rounds=BENCHMARK_ROUNDS,
+        warmup_rounds=1,
+    )
+    benchmark_db.expire_all()
+    record_peak_memory(benchmark, export_csv)
+
+    # A header, then at least a row for each family's document
+    assert csv_content.count(b"\n") > len(response_families)
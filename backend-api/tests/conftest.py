@@ -12,16 +12,32 @@ from fastapi.testclient import TestClient
 from moto import mock_aws
 from sqlalchemy import create_engine
 from sqlalchemy.engine import Engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy_utils import create_database, database_exists, drop_database
 
 from app.clients.aws.client import S3Client, get_s3_client
-from app.clients.db.session import get_db
+from app.clients.db.session import get_async_read_db, get_db, get_read_db
 from app.main import app
 from app.service import custom_app, security
 from app.service.custom_app import AppTokenFactory
 
 
+class SyncSessionRunner:
+    """Stands in for an `AsyncSession` on a sync test session.
+
+    The async endpoints only use `AsyncSession.run_sync`, so running those
+    callables on the test session lets them see the data in the test's
+    transaction.
+    """
+
+    def __init__(self, session: Session) -> None:
+        self.sync_session = session
+        self.bind = session.bind
+
+    async def run_sync(self, fn, *args, **kwargs):
+        return fn(self.sync_session, *args, **kwargs)
+
+
 @pytest.fixture(scope="function")
 def mock_aws_creds():
     """Mocked AWS Credentials for moto."""
@@ -285,10 +301,15 @@ def data_client(data_db, test_s3_client, test_vespa):
     def get_data_db():
         yield data_db
 
+    async def get_data_async_db():
+        yield SyncSessionRunner(data_db)
+
     def get_test_s3_client():
         yield test_s3_client
 
     app.dependency_overrides[get_db] = get_data_db
+    app.dependency_overrides[get_read_db] = get_data_db
+    app.dependency_overrides[get_async_read_db] = get_data_async_db
     app.dependency_overrides[get_s3_client] = get_test_s3_client
 
     app.state.vespa_search_adapter = test_vespa
@@ -303,10 +324,15 @@ def test_client(test_db, test_s3_client, test_vespa):
     def get_test_db():
         yield test_db
 
+    async def get_test_async_db():
+        yield SyncSessionRunner(test_db)
+
     def get_test_s3_client():
         yield test_s3_client
 
     app.dependency_overrides[get_db] = get_test_db
+    app.dependency_overrides[get_read_db] = get_test_db
+    app.dependency_overrides[get_async_read_db] = get_test_async_db
     app.dependency_overrides[get_s3_client] = get_test_s3_client
 
     app.state.vespa_search_adapter = test_vespa
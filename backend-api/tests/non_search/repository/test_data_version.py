@@ -0,0 +1,22 @@
+from sqlalchemy import text
+
+from app.repository.data_version import get_data_version
+from tests.non_search.setup_helpers import setup_with_two_docs
+
+
+def test_data_version_changes_when_a_family_moves_corpus(data_db):
+    setup_with_two_docs(data_db)
+    _, version = get_data_version(data_db)
+
+    data_db.execute(
+        text(
+            "UPDATE family_corpus SET corpus_import_id = :corpus_import_id "
+            "WHERE family_import_id = :family_import_id"
+        ),
+        {
+            "corpus_import_id": "UNFCCC.corpus.i00000001.n0000",
+            "family_import_id": "CCLW.family.1001.0",
+        },
+    )
+
+    assert get_data_version(data_db)[1] != version
@@ -0,0 +1,70 @@
+from db_client.functions.dfce_helpers import (
+    add_collections,
+    add_families,
+    link_collection_family,
+)
+
+from app.repository.document import (
+    get_family_and_documents,
+    get_family_document_and_context,
+)
+from tests.non_search.setup_helpers import (
+    get_default_collections,
+    get_default_documents,
+    get_default_families,
+)
+from tests.utils import count_statements
+
+# The family with its geographies, metadata and organisation; its slugs; its
+# events; its documents with their physical documents; the document slugs;
+# the document languages; its collections; the families in those collections.
+MAX_FAMILY_AND_DOCUMENTS_STATEMENTS = 8
+# The document with its family and geographies; the family slugs, events
+# and documents; the document slugs; the document languages.
+MAX_FAMILY_DOCUMENT_AND_CONTEXT_STATEMENTS = 6
+
+
+def _setup_families_in_two_collections(db):
+    collection1, collection2 = get_default_collections()
+    add_collections(db, collections=[collection1, collection2])
+
+    document1, document2 = get_default_documents()
+    family1, family2, _ = get_default_families()
+    family1["documents"] = [document1]
+    family2["documents"] = [document2]
+    add_families(db, families=[family1, family2])
+
+    link_collection_family(
+        db,
+        [
+            (collection1["import_id"], family1["import_id"]),
+            (collection1["import_id"], family2["import_id"]),
+            (collection2["import_id"], family1["import_id"]),
+        ],
+    )
+    return family1, document1
+
+
+def test_get_family_and_documents_uses_a_fixed_number_of_statements(data_db):
+    family, _ = _setup_families_in_two_collections(data_db)
+    # Make sure nothing is served from objects already loaded by the setup
+    data_db.expire_all()
+
+    with count_statements(data_db) as statements:
+        response = get_family_and_documents(data_db, family["import_id"])
+
+    assert len(response.documents) == 1
+    assert sorted(len(c.families) for c in response.collections) == [1, 2]
+    assert len(statements) <= MAX_FAMILY_AND_DOCUMENTS_STATEMENTS
+
+
+def test_get_family_document_and_context_uses_a_fixed_number_of_statements(data_db):
+    family, document = _setup_families_in_two_collections(data_db)
+    data_db.expire_all()
+
+    with count_statements(data_db) as statements:
+        response = get_family_document_and_context(data_db, document["import_id"])
+
+    assert response.family.import_id == family["import_id"]
+    assert response.document.import_id == document["import_id"]
+    assert len(statements) <= MAX_FAMILY_DOCUMENT_AND_CONTEXT_STATEMENTS
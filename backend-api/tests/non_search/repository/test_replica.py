@@ -0,0 +1,5 @@
+from app.repository.replica import get_replica_lag_seconds
+
+
+def test_get_replica_lag_seconds_when_not_a_replica(data_db):
+    assert get_replica_lag_seconds(data_db) == 0
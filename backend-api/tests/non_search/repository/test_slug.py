@@ -0,0 +1,35 @@
+import pytest
+from db_client.models.dfce.family import Slug
+
+from app.repository.collection import get_id_from_slug
+from app.repository.document import get_slugged_objects
+from app.service.slug_index import load_slug_snapshot
+from tests.non_search.setup_helpers import setup_with_two_docs
+
+
+@pytest.mark.parametrize(
+    "allowed_corpora",
+    [None, ["CCLW.corpus.i00000001.n0000"], ["UNFCCC.corpus.i00000001.n0000"]],
+)
+def test_slug_snapshot_matches_db_lookups(data_db, allowed_corpora):
+    setup_with_two_docs(data_db)
+    snapshot = load_slug_snapshot(data_db, None)
+
+    slugs = [slug.name for slug in data_db.query(Slug).all()]
+    assert set(snapshot.targets) == set(slugs)
+
+    for slug in slugs:
+        target = snapshot.targets[slug]
+        if not target.is_visible_in(allowed_corpora):
+            assert get_slugged_objects(data_db, slug, allowed_corpora) == (None, None)
+            continue
+        if target.collection_import_id is not None:
+            assert (
+                get_id_from_slug(data_db, slug, allowed_corpora)
+                == target.collection_import_id
+            )
+        else:
+            assert get_slugged_objects(data_db, slug, allowed_corpora) == (
+                target.family_document_import_id,
+                target.family_import_id,
+            )
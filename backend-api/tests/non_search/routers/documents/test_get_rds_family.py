@@ -5,7 +5,10 @@ from fastapi.testclient import TestClient
 from sqlalchemy import update
 from sqlalchemy.orm import Session
 
+from app.main import app
+from app.service.data_version import DataVersionTracker, get_data_version_tracker
 from tests.non_search.routers.documents.setup_doc_fam_lookup import (
+    DOCUMENTS_ENDPOINT,
     _make_doc_fam_lookup_request,
 )
 from tests.non_search.setup_helpers import (
@@ -245,3 +248,45 @@ def test_documents_family_slug_returns_404_when_corpora_mismatch(
         expected_status_code=status.HTTP_404_NOT_FOUND,
     )
     assert json_response["detail"] == "Nothing found for FamSlug1"
+
+
+def test_documents_family_slug_supports_conditional_get(
+    data_db: Session, data_client: TestClient, valid_token
+):
+    setup_with_two_docs(data_db)
+    tracker = DataVersionTracker(
+        session_factory=lambda: Session(bind=data_db.get_bind())
+    )
+    app.dependency_overrides[get_data_version_tracker] = lambda: tracker
+    url = f"{DOCUMENTS_ENDPOINT}/FamSlug1"
+
+    try:
+        response = data_client.get(url, headers={"app-token": valid_token})
+        assert response.status_code == status.HTTP_200_OK
+        etag = response.headers["ETag"]
+        assert "Last-Modified" not in response.headers
+
+        not_modified = data_client.get(
+            url, headers={"app-token": valid_token, "If-None-Match": etag}
+        )
+        assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+        assert not_modified.headers["ETag"] == etag
+
+        # The edit time can't tell when data is deleted, so it isn't used
+        modified = data_client.get(
+            url,
+            headers={
+                "app-token": valid_token,
+                "If-Modified-Since": "Fri, 01 Jan 2100 00:00:00 GMT",
+            },
+        )
+        assert modified.status_code == status.HTTP_200_OK
+
+        other_family = data_client.get(
+            f"{DOCUMENTS_ENDPOINT}/FamSlug2",
+            headers={"app-token": valid_token, "If-None-Match": etag},
+        )
+        assert other_family.status_code == status.HTTP_200_OK
+        assert other_family.headers["ETag"] != etag
+    finally:
+        del app.dependency_overrides[get_data_version_tracker]
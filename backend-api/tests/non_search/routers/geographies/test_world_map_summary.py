@@ -9,6 +9,8 @@ from db_client.models.dfce.family import (
 from db_client.models.dfce.geography import Geography
 from fastapi import status
 
+from app.repository.geography import count_families_per_category_in_each_geo
+from app.service.world_map import WorldMapStatsCache
 from tests.non_search.routers.geographies.setup_world_map_helpers import (
     _make_world_map_lookup_request,
     setup_all_docs_published_world_map,
@@ -205,3 +207,17 @@ def test_endpoint_returns_different_results_with_alt_token(
         sum(resp["family_counts"].values())
         == expected_exec + expected_leg + expected_unfccc
     )
+
+
+def test_world_map_stats_cache_matches_live_query(data_db):
+    setup_mixed_doc_statuses_world_map(data_db)
+    allowed_corpora = [corpus.import_id for corpus in data_db.query(Corpus).all()]
+
+    live_stats = count_families_per_category_in_each_geo(data_db, allowed_corpora)
+    cache = WorldMapStatsCache(
+        session_factory=lambda: data_db, version_provider=lambda: "2024-03-22"
+    )
+
+    assert len(live_stats) > 0
+    assert cache.get(allowed_corpora) == live_stats
+    assert cache.get(list(reversed(allowed_corpora))) == live_stats
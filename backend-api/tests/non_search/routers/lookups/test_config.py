@@ -1,6 +1,6 @@
 import os
 from datetime import datetime
-from http.client import OK
+from http.client import NOT_MODIFIED, OK
 from typing import Any
 from unittest.mock import MagicMock
 
@@ -583,3 +583,26 @@ def test_tree_table_to_json(data, expected):
     processed_data = tree_table_to_json(table_mock, db)
 
     assert processed_data == expected
+
+
+def test_config_endpoint_returns_not_modified_for_matching_etag(
+    data_client, data_db, valid_token
+):
+    url_under_test = "/api/v1/config"
+
+    response = data_client.get(url_under_test, headers={"app-token": valid_token})
+    assert response.status_code == OK
+    etag = response.headers["ETag"]
+
+    not_modified = data_client.get(
+        url_under_test, headers={"app-token": valid_token, "If-None-Match": etag}
+    )
+    assert not_modified.status_code == NOT_MODIFIED
+    assert not_modified.headers["ETag"] == etag
+    assert not_modified.content == b""
+
+    modified = data_client.get(
+        url_under_test, headers={"app-token": valid_token, "If-None-Match": '"stale"'}
+    )
+    assert modified.status_code == OK
+    assert modified.json() == response.json()
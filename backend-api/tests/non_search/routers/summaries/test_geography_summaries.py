@@ -1,8 +1,14 @@
 from typing import Optional
+from unittest.mock import patch
 
 import pytest
 from db_client.models.dfce.family import Family
 from fastapi import status
+from sqlalchemy.orm import Session
+
+from app.main import app
+from app.repository.search import browse_rds_families_by_category
+from app.service.data_version import DataVersionTracker, get_data_version_tracker
 
 from tests.non_search.setup_helpers import (
     setup_with_six_families_same_geography,
@@ -142,3 +148,44 @@ def test_endpoint_returns_404_when_not_found(geo, data_client, valid_token):
         data_client, valid_token, geo, expected_status_code=status.HTTP_404_NOT_FOUND
     )
     assert resp
+
+
+def test_geography_summary_supports_conditional_get(data_client, data_db, valid_token):
+    setup_with_two_docs(data_db)
+    tracker = DataVersionTracker(
+        session_factory=lambda: Session(bind=data_db.get_bind())
+    )
+    app.dependency_overrides[get_data_version_tracker] = lambda: tracker
+    url = f"{GEOGRAPHY_PAGE_ENDPOINT}/india"
+
+    try:
+        response = data_client.get(url, headers={"app-token": valid_token})
+        assert response.status_code == status.HTTP_200_OK
+        etag = response.headers["ETag"]
+        assert "Last-Modified" not in response.headers
+
+        # The ETag is checked before the summary is queried
+        with patch(
+            "app.api.api_v1.routers.summaries.browse_rds_families_by_category",
+            wraps=browse_rds_families_by_category,
+        ) as browse:
+            not_modified = data_client.get(
+                url, headers={"app-token": valid_token, "If-None-Match": etag}
+            )
+            assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+            assert not_modified.headers["ETag"] == etag
+            browse.assert_not_called()
+
+        # A change to the summary changes the data version, and so the ETag
+        family = data_db.query(Family).filter(Family.title == "Fam2").one()
+        family.title = "Renamed"
+        data_db.commit()
+        tracker._version.refresh()
+
+        changed = data_client.get(
+            url, headers={"app-token": valid_token, "If-None-Match": etag}
+        )
+        assert changed.status_code == status.HTTP_200_OK
+        assert changed.headers["ETag"] != etag
+    finally:
+        del app.dependency_overrides[get_data_version_tracker]
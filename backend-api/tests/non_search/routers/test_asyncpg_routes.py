@@ -0,0 +1,122 @@
+"""The async read endpoints, against a real asyncpg engine.
+
+The other router tests stand a sync session in for the `AsyncSession`. These
+run the endpoints with asyncpg underneath, which is strict about the types of
+bound parameters, e.g. the corpora ARRAY binds in the raw slug and world map
+queries, and returns its own types, e.g. for TIMESTAMPTZ columns.
+"""
+
+import httpx
+import pytest
+import pytest_asyncio
+from fastapi import status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.clients.db.session import _create_async_engine, get_async_read_db
+from app.main import app
+from tests.non_search.routers.documents.setup_doc_fam_lookup import (
+    DOCUMENTS_ENDPOINT,
+)
+from tests.non_search.routers.geographies.setup_world_map_helpers import (
+    WORLD_MAP_STATS_ENDPOINT,
+    setup_all_docs_published_world_map,
+)
+from tests.non_search.routers.summaries.test_geography_summaries import (
+    GEOGRAPHY_PAGE_ENDPOINT,
+)
+from tests.non_search.setup_helpers import setup_with_two_docs
+
+TEST_HOST = "http://localhost:3000/"
+
+
+@pytest_asyncio.fixture
+async def asyncpg_db(data_db_engine):
+    """An `AsyncSession` on asyncpg, in a transaction that is rolled back."""
+    engine = _create_async_engine(
+        data_db_engine.url.render_as_string(hide_password=False)
+    )
+    async with engine.connect() as connection:
+        transaction = await connection.begin()
+        session = AsyncSession(bind=connection, autoflush=False)
+
+        yield session
+
+        await session.close()
+        await transaction.rollback()
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def asyncpg_client(asyncpg_db):
+    async def get_asyncpg_db():
+        yield asyncpg_db
+
+    app.dependency_overrides[get_async_read_db] = get_asyncpg_db
+    try:
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            yield client
+    finally:
+        del app.dependency_overrides[get_async_read_db]
+
+
+def _headers(token: str) -> dict[str, str]:
+    return {"app-token": token, "origin": TEST_HOST}
+
+
+@pytest.mark.asyncio
+async def test_family_detail_on_asyncpg(asyncpg_db, asyncpg_client, valid_token):
+    await asyncpg_db.run_sync(setup_with_two_docs)
+
+    response = await asyncpg_client.get(
+        f"{DOCUMENTS_ENDPOINT}/FamSlug1", headers=_headers(valid_token)
+    )
+
+    assert response.status_code == status.HTTP_200_OK, response.text
+    family = response.json()
+    assert family["import_id"] == "CCLW.family.1001.0"
+    assert family["published_date"] is not None
+    assert len(family["events"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_document_detail_on_asyncpg(asyncpg_db, asyncpg_client, valid_token):
+    await asyncpg_db.run_sync(setup_with_two_docs)
+
+    response = await asyncpg_client.get(
+        f"{DOCUMENTS_ENDPOINT}/DocSlug1", headers=_headers(valid_token)
+    )
+
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert response.json()["document"]["import_id"] == "CCLW.executive.1.2"
+
+
+@pytest.mark.asyncio
+async def test_world_map_stats_on_asyncpg(asyncpg_db, asyncpg_client, valid_token):
+    await asyncpg_db.run_sync(setup_all_docs_published_world_map)
+
+    response = await asyncpg_client.get(
+        WORLD_MAP_STATS_ENDPOINT, headers=_headers(valid_token)
+    )
+
+    assert response.status_code == status.HTTP_200_OK, response.text
+    india = next(geo for geo in response.json() if geo["display_name"] == "India")
+    assert sum(india["family_counts"].values()) > 0
+
+
+@pytest.mark.asyncio
+async def test_geography_summary_on_asyncpg(asyncpg_db, asyncpg_client, valid_token):
+    await asyncpg_db.run_sync(setup_with_two_docs)
+
+    response = await asyncpg_client.get(
+        f"{GEOGRAPHY_PAGE_ENDPOINT}/IND", headers=_headers(valid_token)
+    )
+
+    assert response.status_code == status.HTTP_200_OK, response.text
+    summary = response.json()
+    assert summary["family_counts"]["Executive"] == 1
+    assert (
+        summary["top_families"]["Executive"][0]["family_date"]
+        == "2019-12-25T00:00:00+00:00"
+    )
@@ -1,3 +1,5 @@
+from datetime import datetime, timezone
+
 START_INGEST_ENDPOINT = "/api/v1/admin/start-ingest"
 
 
@@ -20,3 +22,20 @@ def test_start_ingest(test_client, superuser_token_headers, mocker):
     assert response_json["detail"] is None  # Not yet implemented
 
     mock_start_import.assert_called_once()
+
+
+def test_start_ingest_incremental(test_client, superuser_token_headers, mocker):
+    mock_start_import = mocker.patch(
+        "app.api.api_v1.routers.pipeline_trigger._start_ingest"
+    )
+
+    response = test_client.post(
+        START_INGEST_ENDPOINT,
+        params={"changed_since": "2024-03-22T21:53:26+00:00"},
+        headers=superuser_token_headers,
+    )
+    assert response.status_code == 202
+
+    mock_start_import.assert_called_once()
+    changed_since = mock_start_import.call_args.args[-1]
+    assert changed_since == datetime(2024, 3, 22, 21, 53, 26, tzinfo=timezone.utc)
@@ -0,0 +1,176 @@
+import io
+import zipfile
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from db_client.models.dfce.family import Corpus
+
+from app.repository.download import get_whole_database_dump
+from app.service.download import (
+    convert_dump_to_csv,
+    dump_parquet_schema,
+    stream_dump_rows_into_csv,
+    stream_dump_rows_into_parquet,
+    stream_dump_rows_into_xlsx,
+    write_data_download_parquet,
+    write_data_download_zip_archive,
+)
+from tests.non_search.setup_helpers import setup_with_two_docs
+
+
+class UnseekableStream(io.RawIOBase):
+    """Stands in for an S3 multipart upload, which can only be written forwards."""
+
+    def __init__(self) -> None:
+        self.data = bytearray()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:  # type: ignore[override]
+        self.data.extend(b)
+        return len(b)
+
+
+def test_stream_dump_rows_into_csv_matches_dataframe_csv():
+    columns = ["Title", "Summary", "Published", "Added", "Count"]
+    rows = [
+        ("Plain", "No special characters", None, date(2024, 1, 2), 1),
+        (
+            'Quotes "here"',
+            "Commas, and\nnew lines",
+            datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+            date(2024, 1, 3),
+            2,
+        ),
+    ]
+    expected = convert_dump_to_csv(pd.DataFrame(rows, columns=columns)).getvalue()
+
+    streamed = b"".join(stream_dump_rows_into_csv(columns, rows, chunk_size=1))
+
+    assert streamed == expected
+
+
+def test_stream_dump_rows_into_xlsx_writes_to_unseekable_stream():
+    columns = ["Title", "Published", "Count"]
+    rows = iter(
+        [
+            ("First", datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc), 1),
+            ("Second", None, None),
+        ]
+    )
+
+    stream = UnseekableStream()
+    stream_dump_rows_into_xlsx(stream, columns, rows)
+
+    with zipfile.ZipFile(io.BytesIO(bytes(stream.data))) as workbook:
+        sheet = workbook.read("xl/worksheets/sheet1.xml").decode("utf-8")
+
+    assert '<dimension ref="A1:C3"/>' in sheet
+    for value in ["Title", "Published", "Count", "First", "Second"]:
+        assert f"<t>{value}</t>" in sheet
+
+
+def test_stream_dump_rows_into_xlsx_writes_dates_without_a_time():
+    columns = ["Published", "Added"]
+    rows = [(datetime(2024, 1, 2, 3, 4, 5), date(2024, 1, 3))]
+
+    stream = UnseekableStream()
+    stream_dump_rows_into_xlsx(stream, columns, rows)
+
+    with zipfile.ZipFile(io.BytesIO(bytes(stream.data))) as workbook:
+        styles = workbook.read("xl/styles.xml").decode("utf-8")
+        sheet = workbook.read("xl/worksheets/sheet1.xml").decode("utf-8")
+
+    assert 'formatCode="yyyy-mm-dd hh:mm:ss"' in styles
+    assert 'formatCode="yyyy-mm-dd"' in styles
+    # Both cells hold Excel serial dates, in different number formats
+    assert '<c r="A2" s="2"><v>45293.12783564815</v></c>' in sheet
+    assert '<c r="B2" s="3"><v>45294</v></c>' in sheet
+
+
+def test_write_data_download_zip_archive_streams_to_unseekable_stream(data_db):
+    setup_with_two_docs(data_db)
+    all_corpora = [corpus.import_id for corpus in data_db.query(Corpus).all()]
+    ingest_cycle_start = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d")
+    url_base = "https://test.example.com"
+
+    stream = UnseekableStream()
+    write_data_download_zip_archive(
+        stream, ingest_cycle_start, all_corpora, data_db, url_base=url_base
+    )
+
+    with zipfile.ZipFile(io.BytesIO(bytes(stream.data))) as zip_file:
+        assert zip_file.namelist() == [
+            "README.txt",
+            f"Document_Data_Download-{ingest_cycle_start}.csv",
+        ]
+        csv_data = zip_file.read(f"Document_Data_Download-{ingest_cycle_start}.csv")
+
+    df = get_whole_database_dump(
+        ingest_cycle_start, all_corpora, data_db, url_base=url_base
+    )
+    assert not df.empty
+    assert csv_data == convert_dump_to_csv(df).getvalue()
+
+
+def test_stream_dump_rows_into_parquet_writes_row_groups():
+    columns = ["Title", "Summary", "Added", "First event", "Count", "Value"]
+    schema = dump_parquet_schema(columns, [25, 25, 1082, 1184, 23, 1700])
+    first_event = datetime(2024, 1, 4, 3, 4, 5, tzinfo=timezone.utc)
+    rows = [
+        ("First", None, date(2024, 1, 2), None, 1, None),
+        ("Second", None, None, None, 2, None),
+        # Only set after the first row group
+        ("Third", "Summary", date(2024, 1, 4), first_event, None, Decimal("1.5")),
+    ]
+
+    stream = UnseekableStream()
+    stream_dump_rows_into_parquet(stream, schema, iter(rows), row_group_size=2)
+
+    parquet_file = pq.ParquetFile(io.BytesIO(bytes(stream.data)))
+    assert parquet_file.metadata.num_row_groups == 2
+    assert parquet_file.metadata.row_group(0).column(0).compression == "ZSTD"
+    assert parquet_file.schema_arrow == schema
+    assert parquet_file.read().to_pylist() == [
+        dict(zip(columns, row[:-1] + (row[-1] and str(row[-1]),))) for row in rows
+    ]
+
+
+def test_stream_dump_rows_into_parquet_writes_empty_file():
+    schema = dump_parquet_schema(["Title", "Added"], [25, 1082])
+
+    stream = UnseekableStream()
+    stream_dump_rows_into_parquet(stream, schema, iter([]))
+
+    table = pq.read_table(io.BytesIO(bytes(stream.data)))
+    assert table.schema == schema
+    assert table.num_rows == 0
+
+
+def test_write_data_download_parquet_matches_dump(data_db):
+    setup_with_two_docs(data_db)
+    all_corpora = [corpus.import_id for corpus in data_db.query(Corpus).all()]
+    ingest_cycle_start = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d")
+    url_base = "https://test.example.com"
+
+    stream = UnseekableStream()
+    write_data_download_parquet(
+        stream, ingest_cycle_start, all_corpora, data_db, url_base=url_base
+    )
+
+    table = pq.read_table(io.BytesIO(bytes(stream.data)))
+    df = get_whole_database_dump(
+        ingest_cycle_start, all_corpora, data_db, url_base=url_base
+    )
+    assert not df.empty
+    assert table.column_names == list(df.columns)
+    assert table.num_rows == len(df)
+    assert table.schema.field("Document Title").type == pa.string()
+    assert table.schema.field("First event in timeline").type == pa.timestamp(
+        "us", tz="UTC"
+    )
+    assert table.schema.field("Date Added to System").type == pa.date32()
@@ -1,8 +1,31 @@
-from db_client.models.dfce import Geography
+from datetime import datetime, timezone
+
+from db_client.models.dfce import FamilyCategory, Geography
 
 from app.models.search import BrowseArgs
-from app.repository.search import browse_rds_families
-from tests.non_search.setup_helpers import setup_with_two_docs
+from sqlalchemy import text
+
+from app.repository.family_browse_dates import (
+    create_family_browse_dates,
+    is_family_browse_dates_maintained,
+)
+from app.repository.search import (
+    browse_rds_families,
+    browse_rds_families_by_category,
+)
+from tests.non_search.setup_helpers import (
+    add_event,
+    add_families,
+    generate_documents,
+    generate_families,
+    setup_with_six_families_same_geography,
+    setup_with_two_docs,
+)
+from tests.utils import count_statements
+
+# The ranked families with their corpora and organisations; their slugs; their
+# geographies; their events, for the published dates.
+MAX_BROWSE_BY_CATEGORY_STATEMENTS = 4
 
 
 def test_browse_rds_families(data_db):
@@ -32,3 +55,167 @@ def test_browse_rds_families(data_db):
     assert family.family_metadata == {}
     assert family.total_passage_hits == 0
     assert family.family_documents == []
+
+
+def test_browse_rds_families_by_category_matches_browse_per_category(data_db):
+    setup_with_six_families_same_geography(data_db)
+
+    summaries = browse_rds_families_by_category(data_db, ["south-asia"])
+
+    assert set(summaries.keys()) == set(FamilyCategory)
+    for category in FamilyCategory:
+        (expected_count, expected) = browse_rds_families(
+            data_db,
+            BrowseArgs(
+                geography_slugs=["south-asia"],
+                categories=[category],
+                offset=0,
+                limit=None,
+            ),
+        )
+        (families_count, families) = summaries[category]
+        assert families_count == expected_count
+        assert families == list(expected.families)
+
+    (executive_count, executive_families) = summaries[FamilyCategory.EXECUTIVE]
+    assert executive_count == 6
+    assert [family.family_name for family in executive_families] == [
+        "Family6",
+        "Family5",
+        "Family4",
+        "Family3",
+        "Family2",
+    ]
+
+
+def test_browse_rds_families_by_category_uses_a_fixed_number_of_statements(data_db):
+    setup_with_six_families_same_geography(data_db)
+    # Make sure nothing is served from objects already loaded by the setup
+    data_db.expire_all()
+
+    with count_statements(data_db) as statements:
+        summaries = browse_rds_families_by_category(data_db, ["south-asia"])
+
+    (_, executive_families) = summaries[FamilyCategory.EXECUTIVE]
+    assert all(family.family_date for family in executive_families)
+    assert len(statements) <= MAX_BROWSE_BY_CATEGORY_STATEMENTS
+
+
+def test_browse_rds_families_by_category_with_browse_dates(data_db):
+    setup_with_six_families_same_geography(data_db)
+    create_family_browse_dates(data_db)
+
+    with_browse_dates = browse_rds_families_by_category(
+        data_db, ["south-asia"], use_browse_dates=True
+    )
+
+    assert with_browse_dates == browse_rds_families_by_category(data_db, ["south-asia"])
+    (_, result) = browse_rds_families(
+        data_db,
+        BrowseArgs(geography_slugs=["south-asia"], categories=["Executive"]),
+        use_browse_dates=True,
+    )
+    assert result.hits == 6
+    assert result.families[0].family_name == "Family6"
+
+
+def test_family_browse_dates_maintained_once_created(data_db):
+    assert is_family_browse_dates_maintained(data_db) is False
+
+    create_family_browse_dates(data_db)
+    assert is_family_browse_dates_maintained(data_db) is True
+
+    data_db.execute(
+        text(
+            "ALTER TABLE family_event DISABLE TRIGGER family_browse_dates_family_event"
+        )
+    )
+    assert is_family_browse_dates_maintained(data_db) is False
+
+
+def _add_published_family(data_db, index: int, date: datetime) -> str:
+    (family,) = generate_families(1, start_index=index)
+    family["documents"] = generate_documents(1, start_index=index)
+    add_families(data_db, families=[family])
+    add_event(
+        data_db,
+        family["import_id"],
+        None,
+        {
+            "import_id": family["import_id"],
+            "title": "Published",
+            "date": date,
+            "type": "Passed/Approved",
+            "status": "OK",
+            "valid_metadata": {
+                "event_type": ["Passed/Approved"],
+                "datetime_event_name": ["Passed/Approved"],
+            },
+        },
+    )
+    data_db.commit()
+    return family["import_id"]
+
+
+def test_browse_dates_updated_on_family_and_event_writes(data_db):
+    setup_with_six_families_same_geography(data_db)
+    create_family_browse_dates(data_db)
+
+    # Added with the newest date after the table was created
+    family_import_id = _add_published_family(data_db, 6, datetime(2030, 1, 1))
+
+    browse_date = text(
+        "SELECT published_date FROM family_browse_dates "
+        "WHERE family_import_id = :family_import_id"
+    )
+    assert data_db.execute(
+        browse_date, {"family_import_id": family_import_id}
+    ).scalar() == datetime(2030, 1, 1, tzinfo=timezone.utc)
+
+    (_, result) = browse_rds_families(
+        data_db,
+        BrowseArgs(geography_slugs=["south-asia"], categories=["Executive"]),
+        use_browse_dates=True,
+    )
+    assert result.hits == 7
+    assert result.families[0].family_name == "Family7"
+
+    data_db.execute(
+        text("DELETE FROM family_event WHERE family_import_id = :family_import_id"),
+        {"family_import_id": family_import_id},
+    )
+    assert (
+        data_db.execute(browse_date, {"family_import_id": family_import_id}).scalar()
+        is None
+    )
+
+
+def test_browse_computes_dates_of_families_missing_from_browse_dates(data_db):
+    setup_with_six_families_same_geography(data_db)
+    create_family_browse_dates(data_db)
+    data_db.execute(
+        text(
+            "ALTER TABLE family_event DISABLE TRIGGER family_browse_dates_family_event"
+        )
+    )
+    data_db.execute(
+        text("ALTER TABLE family DISABLE TRIGGER family_browse_dates_family")
+    )
+
+    # Added with the newest date, but not written to the browse dates
+    _add_published_family(data_db, 6, datetime(2030, 1, 1))
+
+    (_, result) = browse_rds_families(
+        data_db,
+        BrowseArgs(geography_slugs=["south-asia"], categories=["Executive"]),
+        use_browse_dates=True,
+    )
+
+    assert result.hits == 7
+    assert [family.family_name for family in result.families] == [
+        "Family7",
+        "Family6",
+        "Family5",
+        "Family4",
+        "Family3",
+    ]
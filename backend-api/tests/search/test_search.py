@@ -27,13 +27,17 @@ from db_client.models.document import PhysicalDocument
 from slugify import slugify
 from sqlalchemy.orm import Session
 
+from app.clients.api.geographies import fetch_all_countries
+from app.service.geography_index import GeographyIndex, load_geography_snapshot
 from app.service.search import (
     SearchRequestBody,
     _convert_filters,
     create_vespa_search_params,
     make_search_request,
+    make_search_request_async,
     process_vespa_search_response,
 )
+from tests.utils import count_statements
 
 
 @pytest.mark.search
@@ -632,8 +636,17 @@ def test_create_browse_request_params(
         ({"sources": ["CCLW"]}, {"family_source": ["CCLW"]}),
     ],
 )
-def test__convert_filters(data_db, filters, expected):
-    converted_filters = _convert_filters(data_db, filters)
+@pytest.mark.parametrize("use_geography_index", [False, True])
+def test__convert_filters(data_db, mocker, filters, expected, use_geography_index):
+    geography_index = None
+    if use_geography_index:
+        # The in-memory index must resolve geographies the same as the DB lookups
+        geography_index = mocker.Mock(spec=GeographyIndex)
+        geography_index.snapshot.return_value = load_geography_snapshot(
+            data_db, fetch_all_countries()
+        )
+
+    converted_filters = _convert_filters(data_db, filters, geography_index)
 
     if converted_filters and expected:
         # Handle family_geographies field specially - ignore order, check content
@@ -1062,6 +1075,38 @@ def test_process_vespa_search_response(
                 )
 
 
+@pytest.mark.search
+@pytest.mark.parametrize(
+    "fam_specs",
+    [
+        [_FAM_SPEC_0],
+        [_FAM_SPEC_0, _FAM_SPEC_1],
+        [_FAM_SPEC_3, _FAM_SPEC_1, _FAM_SPEC_2, _FAM_SPEC_0],
+    ],
+)
+def test_process_vespa_search_response_statement_count(
+    data_db: Session, fam_specs: Sequence[FamSpec]
+):
+    """Enriching a page of results takes the same number of queries at any size."""
+    populate_data_db(data_db, fam_specs=fam_specs)
+    vespa_response = _generate_search_response(fam_specs)
+    # Make sure nothing is served from objects already loaded by the setup
+    data_db.expire_all()
+
+    with count_statements(data_db) as statements:
+        search_response = process_vespa_search_response(
+            db=data_db,
+            vespa_search_response=vespa_response,
+            limit=len(fam_specs),
+            offset=0,
+            sort_within_page=False,
+        )
+
+    assert len(search_response.families) == len(fam_specs)
+    # families with metadata, family documents with physical documents, events
+    assert len(statements) == 3
+
+
 @pytest.mark.search
 @pytest.mark.parametrize(
     "fam_specs,offset,page_size",
@@ -1409,3 +1454,155 @@ def test_process_vespa_search_response_page_ordering_regression(
     assert (
         actual_content == expected_content
     ), f"Expected content {expected_content}, got {actual_content}"
+
+
+@pytest.mark.search
+@pytest.mark.asyncio
+async def test_make_search_request_async_uses_non_blocking_vespa_client(
+    data_db: Session, mocker, test_vespa
+):
+    """The async search path awaits the async Vespa client, never the sync one."""
+    test_spec = FamSpec(
+        random_seed=42,
+        family_import_id="TEST.family.0.0",
+        family_source="TEST",
+        family_name="Test Family",
+        family_description="Test description",
+        family_category="Executive",
+        family_ts="2023-12-12",
+        family_geo="FRA",
+        family_geos=["FRA"],
+        family_metadata={"keyword": ["Test"]},
+        corpus_import_id="TEST.corpus.i00000001.n0000",
+        corpus_type_name="Test Type",
+        description_hit=True,
+        family_document_count=1,
+        document_hit_count=1,
+    )
+    populate_data_db(data_db, fam_specs=[test_spec])
+
+    passage = CprSdkPassage(
+        family_import_id=test_spec.family_import_id,
+        family_name=test_spec.family_name,
+        family_description=test_spec.family_description,
+        family_source=test_spec.family_source,
+        family_slug=slugify(test_spec.family_name),
+        family_category=test_spec.family_category,
+        family_publication_ts=datetime.fromisoformat(test_spec.family_ts),
+        family_geographies=test_spec.family_geos,
+        corpus_import_id=test_spec.corpus_import_id,
+        corpus_type_name=test_spec.corpus_type_name,
+        document_cdn_object=f"{test_spec.family_import_id}/doc_1",
+        document_content_type="application/pdf",
+        document_import_id=f"{test_spec.family_import_id}.1",
+        document_languages=["english"],
+        document_slug="test-doc-1",
+        document_source_url="https://example.com/doc1",
+        text_block="Page 1 content",
+        text_block_id="p0_b1",
+        text_block_page=0,
+        text_block_coords=[(0, 0), (100, 0), (100, 100), (0, 100)],
+        text_block_type="Paragraph",
+    )
+
+    sync_search = mocker.patch.object(test_vespa, "search")
+    async_search = mocker.patch.object(test_vespa, "async_search")
+    async_search.return_value = CprSdkSearchResponse(
+        total_hits=1,
+        total_result_hits=1,
+        query_time_ms=100,
+        total_time_ms=110,
+        results=[
+            CprSdkFamily(
+                id=test_spec.family_import_id, hits=[passage], total_passage_hits=1
+            )
+        ],
+    )
+
+    response = await make_search_request_async(
+        db=data_db,
+        vespa_search_adapter=test_vespa,
+        search_body=SearchRequestBody(query_string="carbon", exact_match=False),
+    )
+
+    async_search.assert_awaited_once()
+    sync_search.assert_not_called()
+    assert len(response.families) == 1
+    passages = response.families[0].family_documents[0].document_passage_matches
+    assert [p.text_block_page for p in passages] == [1]
+
+
+@pytest.mark.search
+@pytest.mark.parametrize(
+    "limit,offset,page_size,expected_vespa_limit",
+    [
+        (100, 0, 10, 10),
+        (100, 20, 10, 30),
+        (100, 95, 10, 100),
+        (10, 0, 0, 1),
+    ],
+)
+def test_make_search_request_only_fetches_families_up_to_end_of_page(
+    data_db: Session,
+    mocker,
+    test_vespa,
+    limit: int,
+    offset: int,
+    page_size: int,
+    expected_vespa_limit: int,
+):
+    vespa_search = mocker.patch.object(test_vespa, "search")
+    vespa_search.return_value = CprSdkSearchResponse(
+        total_hits=250,
+        total_result_hits=250,
+        query_time_ms=100,
+        total_time_ms=110,
+        results=[],
+    )
+
+    response = make_search_request(
+        db=data_db,
+        vespa_search_adapter=test_vespa,
+        search_body=SearchRequestBody(
+            query_string="carbon",
+            limit=limit,
+            offset=offset,
+            page_size=page_size,
+        ),
+    )
+
+    vespa_search.assert_called_once()
+    assert vespa_search.call_args.kwargs["parameters"].limit == expected_vespa_limit
+    # Hits still reflects the families available up to the requested limit
+    assert response.hits == limit
+    assert response.total_family_hits == 250
+
+
+@pytest.mark.search
+def test_make_search_request_with_continuation_fetches_up_to_limit(
+    data_db: Session, mocker, test_vespa
+):
+    vespa_search = mocker.patch.object(test_vespa, "search")
+    vespa_search.return_value = CprSdkSearchResponse(
+        total_hits=250,
+        total_result_hits=250,
+        query_time_ms=100,
+        total_time_ms=110,
+        results=[],
+    )
+
+    response = make_search_request(
+        db=data_db,
+        vespa_search_adapter=test_vespa,
+        search_body=SearchRequestBody(
+            query_string="carbon",
+            limit=100,
+            page_size=10,
+            continuation_tokens=["ABC"],
+        ),
+    )
+
+    assert vespa_search.call_args.kwargs["parameters"].limit == 100
+    # Hits counts the families after the continuation, not the whole result set
+    assert response.hits == 0
+    assert response.total_family_hits == 250
@@ -31,7 +31,7 @@ def test_empty_search_term_performs_browse(
     """Make sure that empty search term returns results in browse mode."""
     _populate_db_families(data_db)
 
-    query_spy = mocker.spy(test_vespa, "search")
+    query_spy = mocker.spy(test_vespa, "async_search")
     body = _make_search_request(data_client, valid_token, {"query_string": ""})
 
     assert body["hits"] > 0
@@ -0,0 +1,80 @@
+from unittest.mock import Mock, patch
+
+import jwt
+import pytest
+from fastapi import HTTPException
+
+from app.service.custom_app import AppTokenCache, AppTokenFactory
+
+_TOKEN_INPUT = "mango,apple;subject;https://audience.com"
+
+
+def _make_cache(corpus_ids=frozenset({"apple"}), clock=None) -> AppTokenCache:
+    kwargs = {"clock": clock} if clock else {}
+    return AppTokenCache(
+        max_entries=10,
+        ttl_seconds=3600,
+        corpus_ids_loader=Mock(return_value=corpus_ids),
+        corpus_ids_refresh_seconds=300,
+        **kwargs,
+    )
+
+
+def test_decoded_tokens_are_cached():
+    cache = _make_cache()
+    token = AppTokenFactory().create_configuration_token(_TOKEN_INPUT)
+
+    AppTokenFactory().decode(token, None, cache)
+    with patch("jwt.decode") as mock_decode:
+        af = AppTokenFactory()
+        af.decode(token, None, cache)
+
+    mock_decode.assert_not_called()
+    assert af.allowed_corpora_ids == ["apple", "mango"]
+    assert af.sub == "subject"
+
+
+def test_cached_tokens_are_not_used_after_expiry():
+    token = AppTokenFactory().create_configuration_token(_TOKEN_INPUT)
+    expiry = jwt.decode(token, options={"verify_signature": False})["exp"]
+    cache = _make_cache(clock=Mock(return_value=expiry))
+    AppTokenFactory().decode(token, None, cache)
+
+    with (
+        patch("jwt.decode", side_effect=jwt.ExpiredSignatureError),
+        pytest.raises(HTTPException),
+    ):
+        AppTokenFactory().decode(token, None, cache)
+
+
+def test_cached_tokens_cannot_be_modified_by_callers():
+    cache = _make_cache()
+    token = AppTokenFactory().create_configuration_token(_TOKEN_INPUT)
+    af = AppTokenFactory()
+    af.decode(token, None, cache)
+    af.allowed_corpora_ids.append("banana")
+
+    af = AppTokenFactory()
+    af.decode(token, None, cache)
+    assert af.allowed_corpora_ids == ["apple", "mango"]
+
+
+def test_verify_corpora_uses_cached_corpus_ids():
+    cache = _make_cache(corpus_ids=frozenset({"apple"}))
+    af = AppTokenFactory()
+    af.allowed_corpora_ids = ["apple", "mango"]
+    db = Mock()
+
+    assert af.verify_corpora_in_db(db, any_exist=True, cache=cache)
+    db.scalars.assert_not_called()
+
+
+def test_verify_corpora_falls_back_to_db_when_cached_ids_do_not_match():
+    cache = _make_cache(corpus_ids=frozenset({"apple"}))
+    af = AppTokenFactory()
+    af.allowed_corpora_ids = ["mango"]
+    db = Mock()
+    db.scalars.return_value.all.return_value = ["apple", "mango"]
+
+    assert af.verify_corpora_in_db(db, any_exist=True, cache=cache)
+    db.scalars.assert_called_once()
@@ -3,3 +3,38 @@ def test_s3client_get_latest_ingest_start(test_s3_client):
         pipeline_bucket="test_pipeline_bucket", ingest_trigger_root="input"
     )
     assert start_date == "2024-03-22"
+
+
+def test_s3client_multipart_upload_writes_object_in_parts(test_s3_client):
+    part_size = 5 * 1024 * 1024
+    data = b"a" * part_size + b"b" * 10
+
+    with test_s3_client.open_multipart_upload(
+        bucket="test_cdn_bucket", key="dumps/test.zip", content_type="application/zip"
+    ) as upload:
+        upload.write(data[:100])
+        upload.write(data[100:])
+
+    response = test_s3_client.client.get_object(
+        Bucket="test_cdn_bucket", Key="dumps/test.zip"
+    )
+    assert response["Body"].read() == data
+    assert response["ContentType"] == "application/zip"
+
+
+def test_s3client_multipart_upload_is_aborted_on_error(test_s3_client):
+    try:
+        with test_s3_client.open_multipart_upload(
+            bucket="test_cdn_bucket", key="dumps/failed.zip"
+        ) as upload:
+            upload.write(b"partial")
+            raise RuntimeError("Failed to generate archive")
+    except RuntimeError:
+        pass
+
+    listing = test_s3_client.client.list_objects_v2(
+        Bucket="test_cdn_bucket", Prefix="dumps/failed.zip"
+    )
+    assert listing.get("KeyCount") == 0
+    uploads = test_s3_client.client.list_multipart_uploads(Bucket="test_cdn_bucket")
+    assert not uploads.get("Uploads")
@@ -1,11 +1,19 @@
 import json
+from datetime import datetime, timedelta, timezone
 from typing import Dict
 from unittest.mock import patch
 
 from click.testing import CliRunner
+from db_client.models.dfce import DocumentStatus
+from db_client.models.dfce.family import FamilyDocument
+from sqlalchemy import text, update
 
 from app.repository.pipeline import generate_pipeline_ingest_input
-from app.service.pipeline import format_pipeline_ingest_input, get_db_state_content
+from app.service.pipeline import (
+    format_pipeline_ingest_input,
+    get_db_state_content,
+    stream_db_state_to_s3,
+)
 from scripts.db_state_validator_click import main as db_state_validator_main
 from tests.non_search.setup_helpers import (
     setup_docs_with_two_orgs,
@@ -75,6 +83,95 @@ def test_generate_pipeline_ingest_input__deleted(data_db):
     assert documents[0].import_id == "CCLW.executive.1.2"
 
 
+def test_stream_db_state_to_s3_matches_db_state_content(
+    documents_large: list[Dict], data_db, test_s3_client
+):
+    setup_with_documents_large_with_families(documents_large, data_db)
+
+    s3_document = stream_db_state_to_s3(data_db, test_s3_client, "input/test-prefix")
+
+    assert s3_document.key == "input/test-prefix/db_state.json"
+    response = test_s3_client.client.get_object(
+        Bucket=s3_document.bucket_name, Key=s3_document.key
+    )
+    assert response["ContentType"] == "application/json"
+    assert json.loads(response["Body"].read()) == get_db_state_content(data_db)
+
+
+def test_stream_db_state_to_s3_incremental(data_db, test_s3_client):
+    setup_with_two_unpublished_docs(data_db)
+    now = datetime.now(timezone.utc)
+
+    def export(s3_prefix: str, changed_since: datetime) -> tuple[str, dict]:
+        s3_document = stream_db_state_to_s3(
+            data_db, test_s3_client, s3_prefix, changed_since=changed_since
+        )
+        response = test_s3_client.client.get_object(
+            Bucket=s3_document.bucket_name, Key=s3_document.key
+        )
+        return s3_document.key, json.loads(response["Body"].read())
+
+    # There is no previous export to compare with, so this one is in full
+    key, _ = export("input/first", now - timedelta(hours=1))
+    assert key == "input/first/db_state.json"
+
+    key, delta = export("input/second", now - timedelta(hours=1))
+    assert key == "input/second/db_state_delta.json"
+    assert list(delta["documents"]) == ["CCLW.executive.1.2"]
+    assert delta["deleted_document_ids"] == []
+
+    _, delta = export("input/third", now + timedelta(hours=1))
+    assert delta["changed_since"] == (now + timedelta(hours=1)).isoformat()
+    assert delta["documents"] == {}
+    assert delta["deleted_document_ids"] == []
+
+    # Family metadata has no edit times, so a change to it needs a full export
+    data_db.execute(
+        text(
+            "UPDATE family_metadata SET value = value || "
+            'CAST(\'{"size": ["small"]}\' AS JSONB)'
+        )
+    )
+    key, _ = export("input/fourth", now + timedelta(hours=1))
+    assert key == "input/fourth/db_state.json"
+
+    # As does removing a family's geographies, which stops its documents
+    # being exported
+    data_db.execute(
+        text(
+            "DELETE FROM family_geography "
+            "WHERE family_import_id = 'CCLW.family.1001.0'"
+        )
+    )
+    key, _ = export("input/fifth", now + timedelta(hours=1))
+    assert key == "input/fifth/db_state.json"
+
+
+def test_stream_db_state_to_s3_incremental_lists_documents_no_longer_exported(
+    data_db, test_s3_client
+):
+    setup_with_two_docs_one_family(data_db)
+    now = datetime.now(timezone.utc)
+    stream_db_state_to_s3(data_db, test_s3_client, "input/first")
+
+    # Soft deleted, which changes no data without edit times
+    data_db.execute(
+        update(FamilyDocument)
+        .where(FamilyDocument.import_id == "CCLW.executive.2.2")
+        .values(document_status=DocumentStatus.DELETED)
+    )
+
+    s3_document = stream_db_state_to_s3(
+        data_db, test_s3_client, "input/second", changed_since=now
+    )
+    assert s3_document.key == "input/second/db_state_delta.json"
+    response = test_s3_client.client.get_object(
+        Bucket=s3_document.bucket_name, Key=s3_document.key
+    )
+    delta = json.loads(response["Body"].read())
+    assert delta["deleted_document_ids"] == ["CCLW.executive.2.2"]
+
+
 def test_get_db_state_content_success(data_db, caplog):
     """
     GIVEN an expected db state file
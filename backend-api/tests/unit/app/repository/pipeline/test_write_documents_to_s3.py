@@ -1,15 +1,19 @@
 import datetime
 import json
+from io import BytesIO
 from unittest import mock
 
 from app.config import PIPELINE_BUCKET
 from app.models.document import DocumentParserInput
-from app.service.pipeline import write_documents_to_s3
+from app.service.pipeline import (
+    format_pipeline_ingest_input,
+    write_db_state,
+    write_documents_to_s3,
+)
 
 
-def test_write_documents_to_s3(test_s3_client, mocker):
-    """Really simple check that values are passed to the s3 client correctly"""
-    d = DocumentParserInput(
+def _make_document(import_id: str = "1234-5678") -> DocumentParserInput:
+    return DocumentParserInput(
         publication_ts=datetime.datetime(year=2008, month=12, day=25),
         name="name",
         description="description",
@@ -17,7 +21,7 @@ def test_write_documents_to_s3(test_s3_client, mocker):
         download_url=None,
         type="executive",
         source="CCLW",
-        import_id="1234-5678",
+        import_id=import_id,
         slug="geo_2008_name_1234_5678",
         family_import_id="family_1234-5678",
         family_slug="geo_2008_family_1234_5679",
@@ -28,6 +32,11 @@ def test_write_documents_to_s3(test_s3_client, mocker):
         metadata={},
     )
 
+
+def test_write_documents_to_s3(test_s3_client, mocker):
+    """Really simple check that values are passed to the s3 client correctly"""
+    d = _make_document()
+
     upload_file_mock = mocker.patch.object(test_s3_client, "upload_fileobj")
     datetime_mock = mocker.patch("app.service.pipeline.datetime")
     every_now = datetime.datetime(year=2001, month=12, day=25)
@@ -50,3 +59,30 @@ def test_write_documents_to_s3(test_s3_client, mocker):
         upload_file_mock.mock_calls[0].kwargs["fileobj"].read().decode("utf8")
     )
     assert uploaded_json_documents == {"documents": {d.import_id: d.to_json()}}
+
+
+def test_write_db_state_matches_formatted_ingest_input():
+    documents = [_make_document("1234-5678"), _make_document("8765-4321")]
+    stream = BytesIO()
+
+    assert write_db_state(iter(documents), stream) == 2
+    assert json.loads(stream.getvalue()) == format_pipeline_ingest_input(documents)
+
+
+def test_write_db_state_with_no_documents():
+    stream = BytesIO()
+
+    assert write_db_state([], stream) == 0
+    assert json.loads(stream.getvalue()) == {"documents": {}}
+
+
+def test_write_db_state_with_header():
+    documents = [_make_document("1234-5678")]
+    stream = BytesIO()
+
+    write_db_state(documents, stream, header={"deleted_document_ids": ["a", "b"]})
+
+    assert json.loads(stream.getvalue()) == {
+        "deleted_document_ids": ["a", "b"],
+        **format_pipeline_ingest_input(documents),
+    }
@@ -0,0 +1,84 @@
+from unittest.mock import Mock
+
+import pytest
+
+from app.service.cache import RefreshingValue
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _make_value(loader, clock, background=None) -> RefreshingValue:
+    return RefreshingValue(
+        loader=loader,
+        refresh_seconds=60,
+        clock=clock,
+        run_in_background=background or (lambda refresh: refresh()),
+    )
+
+
+def test_refreshing_value_loads_on_first_get_only():
+    loader = Mock(return_value="first")
+    value = _make_value(loader, FakeClock())
+
+    assert value.get() == "first"
+    assert value.get() == "first"
+    assert loader.call_count == 1
+
+
+def test_refreshing_value_serves_stale_value_while_refreshing():
+    clock = FakeClock()
+    loader = Mock(side_effect=["first", "second"])
+    pending = []
+    value = _make_value(loader, clock, background=pending.append)
+    value.get()
+
+    clock.now = 61
+    assert value.get() == "first"
+    assert value.get() == "first"
+    assert len(pending) == 1  # only a single refresh is started
+
+    pending[0]()
+    assert value.get() == "second"
+
+
+def test_refreshing_value_refreshes_after_being_marked_stale():
+    loader = Mock(side_effect=["first", "second"])
+    pending = []
+    value = _make_value(loader, FakeClock(), background=pending.append)
+    value.get()
+
+    value.mark_stale()
+    assert value.get() == "first"
+    assert len(pending) == 1
+
+    pending[0]()
+    assert value.get() == "second"
+
+
+def test_refreshing_value_keeps_last_good_value_when_refresh_fails():
+    clock = FakeClock()
+    loader = Mock(side_effect=["first", Exception("API down"), "second"])
+    value = _make_value(loader, clock)
+    value.get()
+
+    clock.now = 61
+    assert value.get() == "first"  # refresh failed in the background
+    assert value.get() == "first"
+
+    clock.now = 122
+    value.get()  # triggers a retry
+    assert value.get() == "second"
+
+
+def test_refreshing_value_raises_if_first_load_fails():
+    value = _make_value(Mock(side_effect=Exception("API down")), FakeClock())
+
+    with pytest.raises(Exception, match="API down"):
+        value.get()
+    assert value.peek() is None
@@ -0,0 +1,141 @@
+from datetime import datetime, timezone
+from unittest.mock import Mock, patch
+
+import pytest
+from fastapi import Response, status
+
+from app.service.conditional_get import (
+    check_data_not_modified,
+    check_not_modified,
+    etag_matches,
+)
+from app.service.data_version import DataVersion
+
+LAST_MODIFIED = datetime(2024, 3, 22, 10, 30, 15, 123456, tzinfo=timezone.utc)
+PRIMARY_DB = Mock(bind=None)
+
+
+def _make_request(headers: dict[str, str], path: str = "/api/v1/documents/slug"):
+    request = Mock()
+    request.headers = {key.lower(): value for key, value in headers.items()}
+    request.url.path = path
+    request.query_params = ""
+    return request
+
+
+@pytest.mark.parametrize(
+    "if_none_match, expected",
+    [
+        (None, False),
+        ('"abc"', True),
+        ('W/"abc"', True),
+        ('"xyz", "abc"', True),
+        ('"xyz"', False),
+        ("*", True),
+    ],
+)
+def test_etag_matches(if_none_match, expected):
+    assert etag_matches(if_none_match, '"abc"') is expected
+
+
+def test_check_not_modified_adds_validators_to_response():
+    response = Response()
+
+    assert check_not_modified(_make_request({}), response, '"abc"') is None
+    assert response.headers["ETag"] == '"abc"'
+    assert response.headers["Cache-Control"] == "no-cache"
+    assert "Last-Modified" not in response.headers
+
+
+def test_check_not_modified_answers_matching_if_none_match():
+    not_modified = check_not_modified(
+        _make_request({"If-None-Match": '"abc"'}), Response(), '"abc"'
+    )
+
+    assert not_modified is not None
+    assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+    assert not_modified.headers["ETag"] == '"abc"'
+
+
+def test_check_not_modified_ignores_if_modified_since():
+    request = _make_request({"If-Modified-Since": "Fri, 01 Jan 2100 00:00:00 GMT"})
+
+    assert check_not_modified(request, Response(), '"abc"') is None
+
+
+def test_check_data_not_modified_varies_with_version_and_corpora():
+    tracker = Mock()
+    tracker.current.return_value = DataVersion("v1", LAST_MODIFIED)
+    response = Response()
+    check_data_not_modified(
+        _make_request({}), response, tracker, ["a", "b"], PRIMARY_DB
+    )
+    etag = response.headers["ETag"]
+
+    not_modified = check_data_not_modified(
+        _make_request({"If-None-Match": etag}),
+        Response(),
+        tracker,
+        ["b", "a"],
+        PRIMARY_DB,
+    )
+    assert not_modified is not None
+    assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+
+    assert (
+        check_data_not_modified(
+            _make_request({"If-None-Match": etag}),
+            Response(),
+            tracker,
+            ["a"],
+            PRIMARY_DB,
+        )
+        is None
+    )
+
+    assert (
+        check_data_not_modified(
+            _make_request({"If-None-Match": etag}),
+            Response(),
+            tracker,
+            ["a", "b"],
+            PRIMARY_DB,
+            variant="browse-dates",
+        )
+        is None
+    )
+
+    tracker.current.return_value = DataVersion("v2", LAST_MODIFIED)
+    assert (
+        check_data_not_modified(
+            _make_request({"If-None-Match": etag}),
+            Response(),
+            tracker,
+            ["a", "b"],
+            PRIMARY_DB,
+        )
+        is None
+    )
+
+
+def test_check_data_not_modified_without_data_version():
+    response = Response()
+    assert (
+        check_data_not_modified(_make_request({}), response, None, ["a"], PRIMARY_DB)
+        is None
+    )
+    assert "ETag" not in response.headers
+
+
+def test_check_data_not_modified_uses_the_version_of_the_session_database():
+    tracker = Mock()
+    tracker.current.return_value = DataVersion("v1", LAST_MODIFIED)
+
+    check_data_not_modified(_make_request({}), Response(), tracker, ["a"], PRIMARY_DB)
+    tracker.current.assert_called_with(on_replica=False)
+
+    with patch(
+        "app.service.conditional_get.is_read_replica_session", return_value=True
+    ):
+        check_data_not_modified(_make_request({}), Response(), tracker, ["a"], Mock())
+    tracker.current.assert_called_with(on_replica=True)
@@ -0,0 +1,66 @@
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+from app.models.config import ApplicationConfig
+from app.service.config_cache import ConfigCache, make_config_snapshot
+
+
+def _config(language_name: str) -> ApplicationConfig:
+    return ApplicationConfig(
+        geographies=[],
+        languages={"fra": language_name},
+        document_variants=["Original Language"],
+        corpus_types={},
+    )
+
+
+@pytest.fixture
+def load_config():
+    with patch("app.service.config_cache.get_config") as load_config:
+        yield load_config
+
+
+def test_config_snapshot_etag_changes_with_content():
+    assert make_config_snapshot(_config("French")).etag == (
+        make_config_snapshot(_config("French")).etag
+    )
+    assert make_config_snapshot(_config("French")).etag != (
+        make_config_snapshot(_config("Français")).etag
+    )
+
+
+def test_config_snapshot_holds_serialised_config():
+    config = _config("Français")
+
+    snapshot = make_config_snapshot(config)
+
+    assert json.loads(snapshot.content) == config.model_dump(mode="json")
+
+
+def test_config_cache_builds_each_corpora_set_once(load_config):
+    load_config.return_value = _config("French")
+    cache = ConfigCache(session_factory=Mock, version_provider=lambda: "v1")
+
+    first = cache.get(["a", "b"])
+    assert cache.get(["b", "a"]) is first
+    cache.get(["a"])
+    assert [call.args[1] for call in load_config.call_args_list] == [
+        ["a", "b"],
+        ["a"],
+    ]
+
+
+def test_config_cache_rebuilds_on_new_ingest_cycle(load_config):
+    load_config.side_effect = [_config("French"), _config("Français")]
+    cache = ConfigCache(
+        session_factory=Mock,
+        version_provider=Mock(side_effect=["v1", "v2"]),
+        run_in_background=lambda refresh: refresh(),
+    )
+
+    first = cache.get(["a"])
+    second = cache.get(["a"])
+    assert second.config == _config("Français")
+    assert second.etag != first.etag
@@ -0,0 +1,131 @@
+import threading
+from dataclasses import replace
+from unittest.mock import Mock
+
+from app.service.data_dump import DataDumpBuilder, DataDumpFormat, DataDumpSpec
+
+
+def _make_spec(
+    app_name: str = "CCLW",
+    ingest_cycle_start: str = "2024-03-22",
+    file_format: DataDumpFormat = "zip",
+):
+    return DataDumpSpec(
+        app_name=app_name,
+        ingest_cycle_start=ingest_cycle_start,
+        allowed_corpora_ids=("CCLW.corpus.i00000001.n0000",),
+        url_base="https://app.climatepolicyradar.org",
+        bucket_name="test_cdn_bucket",
+        file_format=file_format,
+    )
+
+
+def _wait_for_builds(builder: DataDumpBuilder) -> None:
+    builder._executor.shutdown(wait=True)
+    builder._prebuild_executor.shutdown(wait=True)
+
+
+def test_data_dump_spec_s3_key():
+    spec = _make_spec()
+    assert spec.s3_key == "navigator/dumps/CCLW-whole_data_dump-2024-03-22.zip"
+    assert spec.theme == "cclw"
+
+    parquet_spec = replace(spec, file_format="parquet")
+    assert parquet_spec.s3_key == (
+        "navigator/dumps/CCLW-whole_data_dump-2024-03-22.parquet"
+    )
+
+
+def test_concurrent_requests_share_a_single_build():
+    release = threading.Event()
+    builds = []
+
+    def build(spec, db):
+        builds.append(spec)
+        release.wait(timeout=5)
+
+    builder = DataDumpBuilder(session_factory=Mock, build=build)
+    spec = _make_spec()
+
+    assert builder.request(spec, timeout=0.01) is False
+    assert builder.request(spec, timeout=0.01) is False
+
+    release.set()
+    _wait_for_builds(builder)
+    assert sorted(builds, key=lambda built: built.file_format) == [
+        replace(spec, file_format="parquet"),
+        spec,
+    ]
+
+
+def test_request_without_timeout_waits_for_the_build():
+    release = threading.Event()
+
+    def build(spec, db):
+        release.wait(timeout=5)
+
+    builder = DataDumpBuilder(session_factory=Mock, build=build)
+    threading.Timer(0.05, release.set).start()
+
+    assert builder.request(_make_spec(), timeout=None) is True
+    assert release.is_set()
+
+
+def test_failed_build_counts_as_finished_and_can_be_retried():
+    build = Mock(side_effect=[RuntimeError("upload failed"), None, None, None])
+    builder = DataDumpBuilder(session_factory=Mock, build=build)
+    spec = _make_spec()
+
+    assert builder.request(spec, timeout=5) is True
+    assert builder.request(spec, timeout=5) is True
+    _wait_for_builds(builder)
+
+    built = [call.args[0] for call in build.call_args_list]
+    assert built.count(spec) == 2
+
+
+def test_new_ingest_cycle_starts_builds_for_other_apps():
+    build = Mock()
+    builder = DataDumpBuilder(session_factory=Mock, build=build)
+
+    builder.request(_make_spec("CCLW", "2024-03-22"), timeout=5)
+    builder.request(_make_spec("MCF", "2024-03-22"), timeout=5)
+    builder.request(_make_spec("CCLW", "2024-04-05"), timeout=5)
+    _wait_for_builds(builder)
+
+    built = [call.args[0].key for call in build.call_args_list]
+    assert sorted(built) == sorted(
+        (app_name, ingest_cycle_start, file_format)
+        for app_name, ingest_cycle_start in [
+            ("CCLW", "2024-03-22"),
+            ("MCF", "2024-03-22"),
+            ("CCLW", "2024-04-05"),
+            ("MCF", "2024-04-05"),
+        ]
+        for file_format in ["zip", "parquet"]
+    )
+
+
+def test_prebuilds_do_not_delay_requested_builds():
+    release = threading.Event()
+    builds = []
+
+    def build(spec, db):
+        builds.append(spec)
+        if spec == _make_spec("CCLW", file_format="parquet"):
+            release.wait(timeout=5)
+
+    builder = DataDumpBuilder(session_factory=Mock, build=build)
+
+    # The CCLW Parquet prebuild blocks the prebuild queue
+    assert builder.request(_make_spec("CCLW"), timeout=1) is True
+    assert builder.request(_make_spec("MCF"), timeout=1) is True
+
+    # The MCF Parquet prebuild is queued behind it, so is requeued as a
+    # requested build when it is requested
+    mcf_parquet = _make_spec("MCF", file_format="parquet")
+    assert builder.request(mcf_parquet, timeout=1) is True
+
+    release.set()
+    _wait_for_builds(builder)
+    assert builds.count(mcf_parquet) == 1
@@ -0,0 +1,94 @@
+from datetime import datetime, timezone
+from unittest.mock import Mock, patch
+
+from app.service.data_version import DataVersionTracker
+from app.service.util import get_cache_version_provider
+
+LAST_MODIFIED = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def test_data_version_tracker_current_version():
+    with patch(
+        "app.service.data_version.get_data_version",
+        return_value=(LAST_MODIFIED, "2025-01-01T00:00:00+00:00:1:2:3:4"),
+    ):
+        tracker = DataVersionTracker(session_factory=Mock)
+
+        assert tracker.current_version() == "2025-01-01T00:00:00+00:00:1:2:3:4"
+
+
+def test_data_version_tracker_current_version_when_loading_fails():
+    with patch(
+        "app.service.data_version.get_data_version", side_effect=Exception("down")
+    ):
+        tracker = DataVersionTracker(session_factory=Mock)
+
+        assert tracker.current_version() is None
+
+
+def test_data_version_tracker_reads_the_replica_version_from_the_replica():
+    primary, replica = Mock(name="primary"), Mock(name="replica")
+    versions = {
+        primary: (LAST_MODIFIED, "primary-version"),
+        replica: (LAST_MODIFIED, "replica-version"),
+    }
+    with patch("app.service.data_version.get_data_version", side_effect=versions.get):
+        tracker = DataVersionTracker(
+            session_factory=Mock(return_value=primary),
+            replica_session_factory=Mock(return_value=replica),
+        )
+
+        assert tracker.current_version() == "primary-version"
+        assert tracker.current(on_replica=True).version == "replica-version"
+
+
+def test_data_version_tracker_without_a_replica():
+    with patch(
+        "app.service.data_version.get_data_version",
+        return_value=(LAST_MODIFIED, "primary-version"),
+    ):
+        tracker = DataVersionTracker(session_factory=Mock)
+
+        assert tracker.current(on_replica=True) is None
+
+
+def test_data_version_tracker_current_version_without_loading():
+    background_loads = []
+    with patch(
+        "app.service.data_version.get_data_version",
+        return_value=(LAST_MODIFIED, "primary-version"),
+    ) as get_data_version:
+        tracker = DataVersionTracker(
+            session_factory=Mock, run_in_background=background_loads.append
+        )
+
+        assert tracker.current_version(load=False) is None
+        assert tracker.current_version(load=False) is None
+        get_data_version.assert_not_called()
+
+        # A single load is started in the background
+        assert len(background_loads) == 1
+        background_loads[0]()
+        assert tracker.current_version(load=False) == "primary-version"
+        get_data_version.assert_called_once()
+
+
+def test_cache_version_provider_reads_the_tracker_on_every_call():
+    tracker = Mock()
+    tracker.current_version.side_effect = ["v1", "v2"]
+    version_provider = get_cache_version_provider(tracker, ingest_check_seconds=300)
+
+    assert version_provider() == "v1"
+    assert version_provider() == "v2"
+    tracker.current_version.assert_called_with(load=False)
+
+
+def test_cache_version_provider_throttles_the_ingest_date_fallback():
+    with patch(
+        "app.service.util.get_latest_ingest_start", return_value="2024-03-22"
+    ) as get_latest_ingest_start:
+        version_provider = get_cache_version_provider(None, ingest_check_seconds=300)
+
+        assert version_provider() == "2024-03-22"
+        assert version_provider() == "2024-03-22"
+        get_latest_ingest_start.assert_called_once()
@@ -0,0 +1,47 @@
+from unittest.mock import Mock, patch
+
+from app.service.family_browse_dates import FamilyBrowseDates
+
+
+def test_family_browse_dates_unavailable_until_checked():
+    browse_dates = FamilyBrowseDates(session_factory=Mock)
+
+    with patch(
+        "app.service.family_browse_dates.is_family_browse_dates_maintained",
+        return_value=True,
+    ) as is_maintained:
+        assert browse_dates.is_available() is False
+        is_maintained.assert_not_called()
+
+        browse_dates._maintained.refresh()
+
+        assert browse_dates.is_available() is True
+        is_maintained.assert_called_once()
+
+
+def test_family_browse_dates_unavailable_when_check_fails():
+    browse_dates = FamilyBrowseDates(session_factory=Mock)
+
+    with patch(
+        "app.service.family_browse_dates.is_family_browse_dates_maintained",
+        side_effect=Exception("connection refused"),
+    ):
+        browse_dates._maintained.refresh()
+
+    assert browse_dates.is_available() is False
+
+
+def test_family_browse_dates_checked_again_until_maintained():
+    browse_dates = FamilyBrowseDates(session_factory=Mock, check_seconds=0)
+    browse_dates._maintained._run_in_background = lambda refresh: refresh()
+
+    with patch(
+        "app.service.family_browse_dates.is_family_browse_dates_maintained",
+        side_effect=[Exception("connection refused"), False, True],
+    ):
+        browse_dates._maintained.refresh()
+
+        # The background check runs synchronously here, so each call returns
+        # the result of a new check
+        assert browse_dates.is_available() is False
+        assert browse_dates.is_available() is True
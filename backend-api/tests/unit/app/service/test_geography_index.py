@@ -0,0 +1,42 @@
+from app.service.geography_index import GeographySnapshot
+
+_SNAPSHOT = GeographySnapshot(
+    region_countries={"north-america": ["CAN", "USA"]},
+    slug_to_iso={
+        "canada": "CAN",
+        "united-states-of-america": "USA",
+        "california": "US-CA",
+    },
+    iso_to_slug={
+        "CAN": "canada",
+        "USA": "united-states-of-america",
+        "US-CA": "california",
+    },
+    api_iso_codes={"CAN": "CAN", "USA": "USA"},
+)
+
+
+def test_countries_for_region():
+    assert _SNAPSHOT.countries_for_region("north-america") == ["CAN", "USA"]
+    assert _SNAPSHOT.countries_for_region("canada") == []
+
+
+def test_geographies_as_iso_codes_prefers_iso_codes():
+    assert _SNAPSHOT.geographies_as_iso_codes_with_fallback(["usa", "canada"]) == [
+        "USA"
+    ]
+
+
+def test_geographies_as_iso_codes_falls_back_to_slugs():
+    assert _SNAPSHOT.geographies_as_iso_codes_with_fallback(
+        ["canada", "not-a-country"]
+    ) == ["CAN"]
+
+
+def test_subdivision_iso_codes_drops_unknown_codes():
+    assert _SNAPSHOT.subdivision_iso_codes(["US-CA", "XX-ZZ-YY"]) == ["US-CA"]
+
+
+def test_slug_for_iso_code():
+    assert _SNAPSHOT.slug_for_iso_code("US-CA") == "california"
+    assert _SNAPSHOT.slug_for_iso_code("XXX") is None
@@ -0,0 +1,55 @@
+from typing import Optional
+
+from fastapi import FastAPI, Response
+from fastapi.testclient import TestClient
+from pydantic import BaseModel, Field
+
+from app.service.json_response import model_to_json, serialised_json_response
+
+
+class _Passage(BaseModel):
+    text: str
+    page: Optional[int] = None
+
+
+class _Family(BaseModel):
+    family_name: str = Field(serialization_alias="familyName")
+    passages: list[_Passage]
+
+
+_FAMILY = _Family(
+    family_name="Loi climat et résilience",
+    passages=[_Passage(text="Énergie", page=1), _Passage(text="Forêts")],
+)
+
+
+def _make_client() -> TestClient:
+    app = FastAPI()
+
+    @app.get("/default", response_model=_Family)
+    def default():
+        return _FAMILY
+
+    @app.get("/serialised", response_model=_Family)
+    def serialised(response: Response):
+        response.headers["ETag"] = '"v1"'
+        return serialised_json_response(model_to_json(_FAMILY), response)
+
+    return TestClient(app)
+
+
+def test_serialised_json_response_matches_default_serialisation():
+    client = _make_client()
+
+    default = client.get("/default")
+    serialised = client.get("/serialised")
+    assert serialised.status_code == 200
+    assert serialised.headers["content-type"] == "application/json"
+    assert serialised.json() == default.json()
+
+
+def test_serialised_json_response_keeps_endpoint_response_headers():
+    response = _make_client().get("/serialised")
+
+    assert response.headers["etag"] == '"v1"'
+    assert response.headers["content-length"] == str(len(response.content))
@@ -0,0 +1,58 @@
+import math
+from unittest.mock import Mock, patch
+
+import pytest
+
+from app.service.read_replica import ReadReplica
+
+
+@pytest.fixture
+def replica_lag():
+    with patch("app.service.read_replica.get_replica_lag_seconds") as replica_lag:
+        yield replica_lag
+
+
+REPLICA = Mock(name="replica")
+PRIMARY = Mock(name="primary")
+
+
+def _make_read_replica(lag_check_seconds: float = 10) -> ReadReplica:
+    return ReadReplica(
+        replica_session_factory=Mock(return_value=REPLICA),
+        primary_session_factory=Mock(return_value=PRIMARY),
+        max_lag_seconds=30,
+        lag_check_seconds=lag_check_seconds,
+        run_in_background=lambda check: check(),
+    )
+
+
+def test_read_replica_uses_primary_until_lag_is_checked(replica_lag):
+    replica_lag.return_value = 0
+    read_replica = _make_read_replica()
+
+    assert read_replica.session() is PRIMARY
+    replica_lag.assert_not_called()
+
+    read_replica.start()
+    assert read_replica.session() is REPLICA
+
+
+@pytest.mark.parametrize(
+    "lag, expected_session",
+    [(0, REPLICA), (30, REPLICA), (30.1, PRIMARY), (math.inf, PRIMARY)],
+)
+def test_read_replica_uses_primary_when_lagging(replica_lag, lag, expected_session):
+    replica_lag.return_value = lag
+    read_replica = _make_read_replica()
+    read_replica.start()
+
+    assert read_replica.session() is expected_session
+
+
+def test_read_replica_uses_primary_when_replica_is_unreachable(replica_lag):
+    replica_lag.side_effect = [0, OSError("connection refused"), 0]
+    read_replica = _make_read_replica(lag_check_seconds=0)
+    read_replica.start()
+
+    assert read_replica.is_usable() is False
+    assert read_replica.is_usable() is True
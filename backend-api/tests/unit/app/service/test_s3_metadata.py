@@ -0,0 +1,50 @@
+from unittest.mock import Mock
+
+from app.clients.aws.s3_document import S3Document
+from app.service.s3_metadata import S3MetadataCache
+
+
+def _make_cache(s3_client: Mock, refresh_seconds: float = 300) -> S3MetadataCache:
+    return S3MetadataCache(
+        s3_client=s3_client,
+        pipeline_bucket="test_pipeline_bucket",
+        ingest_trigger_root="input",
+        refresh_seconds=refresh_seconds,
+        run_in_background=lambda refresh: refresh(),
+    )
+
+
+def test_s3_metadata_cache_lists_ingest_cycles_once():
+    s3_client = Mock()
+    s3_client.get_latest_ingest_start.return_value = "2024-03-22"
+    cache = _make_cache(s3_client)
+
+    assert cache.latest_ingest_start() == "2024-03-22"
+    assert cache.latest_ingest_start() == "2024-03-22"
+    s3_client.get_latest_ingest_start.assert_called_once_with(
+        "test_pipeline_bucket", "input"
+    )
+
+
+def test_s3_metadata_cache_refreshes_when_stale():
+    s3_client = Mock()
+    s3_client.get_latest_ingest_start.side_effect = ["2024-03-22", "2024-04-05"]
+    s3_client.is_connected.side_effect = [True, False]
+    cache = _make_cache(s3_client, refresh_seconds=0)
+
+    assert cache.latest_ingest_start() == "2024-03-22"
+    assert cache.latest_ingest_start() == "2024-04-05"
+    assert cache.is_connected() is True
+    assert cache.is_connected() is False
+
+
+def test_s3_metadata_cache_only_remembers_documents_that_exist():
+    s3_client = Mock()
+    s3_client.document_exists.side_effect = [False, True]
+    cache = _make_cache(s3_client)
+    s3_document = S3Document("test_cdn_bucket", "eu-west-1", "dumps/test.zip")
+
+    assert cache.document_exists(s3_document) is False
+    assert cache.document_exists(s3_document) is True
+    assert cache.document_exists(s3_document) is True
+    assert s3_client.document_exists.call_count == 2
@@ -0,0 +1,135 @@
+from unittest.mock import Mock
+
+import pytest
+
+from app.models.search import SearchRequestBody, SearchResponse
+from app.service.cache import InMemoryCacheBackend
+from app.service.search_cache import SearchResponseCache, canonicalise_search_body
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _make_response(hits: int = 1) -> SearchResponse:
+    return SearchResponse(
+        hits=hits,
+        total_family_hits=hits,
+        query_time_ms=1,
+        total_time_ms=1,
+        families=[],
+    )
+
+
+def test_in_memory_backend_expires_entries_after_ttl():
+    clock = FakeClock()
+    backend = InMemoryCacheBackend(max_entries=10, ttl_seconds=5, clock=clock)
+
+    backend.set("key", "value")
+    clock.now = 4.9
+    assert backend.get("key") == "value"
+
+    clock.now = 5
+    assert backend.get("key") is None
+    assert len(backend) == 0
+
+
+def test_in_memory_backend_evicts_least_recently_used():
+    backend = InMemoryCacheBackend(max_entries=2, ttl_seconds=60)
+
+    backend.set("a", 1)
+    backend.set("b", 2)
+    assert backend.get("a") == 1  # "b" is now least recently used
+    backend.set("c", 3)
+
+    assert backend.get("a") == 1
+    assert backend.get("b") is None
+    assert backend.get("c") == 3
+
+
+def test_in_memory_backend_rejects_non_positive_size():
+    with pytest.raises(ValueError):
+        InMemoryCacheBackend(max_entries=0, ttl_seconds=60)
+
+
+def test_canonicalise_search_body_ignores_irrelevant_differences():
+    first = SearchRequestBody(
+        query_string="  carbon   tax ",
+        keyword_filters={"countries": ["GBR", "FRA"], "regions": []},
+        corpus_import_ids=["b", "a"],
+    )
+    second = SearchRequestBody(
+        query_string="carbon tax",
+        keyword_filters={"countries": ["FRA", "GBR"]},
+        corpus_import_ids=["a", "b"],
+    )
+
+    assert canonicalise_search_body(first) == canonicalise_search_body(second)
+
+
+def test_canonicalise_search_body_keeps_meaningful_differences():
+    first = SearchRequestBody(query_string="carbon tax", offset=0)
+    second = SearchRequestBody(query_string="carbon tax", offset=10)
+
+    assert canonicalise_search_body(first) != canonicalise_search_body(second)
+
+
+def test_search_response_cache_is_keyed_on_allowed_corpora():
+    cache = SearchResponseCache(
+        backend=InMemoryCacheBackend(max_entries=10, ttl_seconds=60),
+        version_provider=lambda: "2024-01-01",
+    )
+    body = SearchRequestBody(query_string="carbon tax")
+
+    key = cache.make_key(body, ["CCLW.corpus.1.0", "UNFCCC.corpus.1.0"])
+    cache.set(key, _make_response())
+
+    assert cache.get(cache.make_key(body, ["UNFCCC.corpus.1.0", "CCLW.corpus.1.0"]))
+    assert cache.get(cache.make_key(body, ["CCLW.corpus.1.0"])) is None
+
+
+def test_search_response_cache_returns_copies():
+    cache = SearchResponseCache(
+        backend=InMemoryCacheBackend(max_entries=10, ttl_seconds=60),
+        version_provider=lambda: "2024-01-01",
+    )
+    key = cache.make_key(SearchRequestBody(query_string="carbon"), [])
+    cache.set(key, _make_response(hits=1))
+
+    cached = cache.get(key)
+    assert cached is not None
+    cached.hits = 100
+
+    assert cache.get(key).hits == 1  # type: ignore
+
+
+def test_search_response_cache_is_cleared_when_ingest_cycle_changes():
+    version_provider = Mock(return_value="2024-01-01")
+    cache = SearchResponseCache(
+        backend=InMemoryCacheBackend(max_entries=10, ttl_seconds=3600),
+        version_provider=version_provider,
+    )
+    body = SearchRequestBody(query_string="carbon")
+    cache.set(cache.make_key(body, []), _make_response())
+    assert cache.get(cache.make_key(body, [])) is not None
+
+    # The version is read on every request, so a change is seen immediately
+    version_provider.return_value = "2024-02-01"
+    assert cache.get(cache.make_key(body, [])) is None
+    assert len(cache.backend) == 0  # type: ignore
+
+
+def test_search_response_cache_skips_caching_when_version_unknown():
+    cache = SearchResponseCache(
+        backend=InMemoryCacheBackend(max_entries=10, ttl_seconds=60),
+        version_provider=Mock(side_effect=Exception("S3 unavailable")),
+    )
+    key = cache.make_key(SearchRequestBody(query_string="carbon"), [])
+
+    assert key is None
+    cache.set(key, _make_response())
+    assert cache.get(key) is None
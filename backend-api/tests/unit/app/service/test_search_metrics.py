@@ -0,0 +1,88 @@
+from unittest.mock import Mock
+
+import pytest
+
+from app.service.search_metrics import (
+    SearchMetrics,
+    SearchStage,
+    SearchStageTimings,
+    get_result_size_bucket,
+    get_search_type_label,
+    search_stage,
+)
+
+
+def _make_search_response(passages_per_family: list[int]) -> Mock:
+    return Mock(
+        families=[
+            Mock(family_documents=[Mock(document_passage_matches=[Mock()] * passages)])
+            for passages in passages_per_family
+        ]
+    )
+
+
+@pytest.mark.parametrize(
+    "query_string,exact_match,expected",
+    [("", False, "browse"), ("forests", True, "exact"), ("forests", False, "semantic")],
+)
+def test_get_search_type_label(query_string, exact_match, expected):
+    search_body = Mock(query_string=query_string, exact_match=exact_match)
+
+    assert get_search_type_label(search_body) == expected
+
+
+@pytest.mark.parametrize(
+    "result_size,expected",
+    [(0, "0"), (1, "1-10"), (10, "1-10"), (11, "11-100"), (1000, "101-1000")],
+)
+def test_get_result_size_bucket(result_size, expected):
+    assert get_result_size_bucket(result_size) == expected
+
+
+def test_get_result_size_bucket_above_largest_bucket():
+    assert get_result_size_bucket(1001) == "1001+"
+
+
+def test_search_stage_is_not_timed_without_active_timings():
+    timings = SearchStageTimings()
+
+    with search_stage(SearchStage.vespa_round_trip):
+        pass
+
+    assert timings.durations == {}
+
+
+def test_search_stage_adds_to_active_timings():
+    timings = SearchStageTimings()
+
+    with timings.activate():
+        with search_stage(SearchStage.rds_enrichment):
+            pass
+        with search_stage(SearchStage.rds_enrichment):
+            pass
+        with search_stage(SearchStage.serialisation):
+            pass
+
+    assert set(timings.durations) == {
+        SearchStage.rds_enrichment,
+        SearchStage.serialisation,
+    }
+    assert all(seconds >= 0 for seconds in timings.durations.values())
+
+
+def test_search_metrics_records_each_stage_with_labels():
+    histogram = Mock()
+    timings = SearchStageTimings()
+    timings.add(SearchStage.vespa_round_trip, 0.25)
+    timings.add(SearchStage.passage_sorting, 0.01)
+
+    SearchMetrics(histogram).record(
+        timings,
+        Mock(query_string="forests", exact_match=True),
+        _make_search_response([3, 4]),
+    )
+
+    labels = {"search_type": "exact", "result_size_bucket": "1-10"}
+    histogram.record.assert_any_call(0.25, {**labels, "stage": "vespa_round_trip"})
+    histogram.record.assert_any_call(0.01, {**labels, "stage": "passage_sorting"})
+    assert histogram.record.call_count == 2
@@ -0,0 +1,147 @@
+from types import SimpleNamespace
+from typing import Optional
+from unittest.mock import Mock, patch
+
+import pytest
+
+from app.service.slug_index import (
+    SlugIndex,
+    SlugTarget,
+    resolve_collection_slug,
+    resolve_family_or_document_slug,
+)
+
+
+class FakeDataVersionTracker:
+    def __init__(self) -> None:
+        self.version: Optional[str] = "1"
+
+    def current_version(self, load: bool = True) -> Optional[str]:
+        return self.version
+
+
+def _row(name, corpora, doc=None, family=None, collection=None):
+    return SimpleNamespace(
+        name=name,
+        family_document_import_id=doc,
+        family_import_id=family,
+        collection_import_id=collection,
+        corpus_import_ids=corpora,
+    )
+
+
+FAMILY_SLUG = _row("fam-slug", ["CCLW"], family="CCLW.family.1.0")
+DOCUMENT_SLUG = _row("doc-slug", ["CCLW"], doc="CCLW.document.1.0")
+COLLECTION_SLUG = _row("col-slug", ["CCLW", "UNFCCC"], collection="CPR.col.1.0")
+MOVED_FAMILY_SLUG = _row("fam-slug", ["UNFCCC"], family="CCLW.family.1.0")
+
+
+@pytest.fixture
+def load_slugs():
+    with patch("app.service.slug_index.get_slugs_with_corpora") as load_slugs:
+        yield load_slugs
+
+
+def _make_loaded_index(data_version_tracker=None) -> SlugIndex:
+    index = SlugIndex(
+        session_factory=Mock,
+        data_version_tracker=data_version_tracker or FakeDataVersionTracker(),
+    )
+    index._snapshot._run_in_background = lambda refresh: refresh()
+    index._snapshot.refresh()
+    return index
+
+
+def test_slug_index_serves_known_slugs_without_the_db(load_slugs):
+    load_slugs.return_value = [FAMILY_SLUG, DOCUMENT_SLUG, COLLECTION_SLUG]
+    index = _make_loaded_index()
+    db = Mock()
+
+    with patch("app.service.slug_index.get_slugged_objects") as get_slugged_objects:
+        assert resolve_family_or_document_slug(db, "fam-slug", ["CCLW"], index) == (
+            None,
+            "CCLW.family.1.0",
+        )
+        assert resolve_family_or_document_slug(db, "doc-slug", None, index) == (
+            "CCLW.document.1.0",
+            None,
+        )
+        get_slugged_objects.assert_not_called()
+
+    with patch("app.service.slug_index.get_id_from_slug") as get_id_from_slug:
+        assert (
+            resolve_collection_slug(db, "col-slug", ["UNFCCC"], index) == "CPR.col.1.0"
+        )
+        get_id_from_slug.assert_not_called()
+
+
+def test_slug_index_falls_back_to_the_db(load_slugs):
+    load_slugs.return_value = [FAMILY_SLUG]
+    index = _make_loaded_index()
+    db = Mock()
+
+    with patch("app.service.slug_index.get_slugged_objects") as get_slugged_objects:
+        get_slugged_objects.return_value = (None, None)
+
+        # Unknown slug
+        resolve_family_or_document_slug(db, "new-slug", ["UNFCCC"], index)
+        # Known slug, but not in the allowed corpora
+        resolve_family_or_document_slug(db, "fam-slug", ["UNFCCC"], index)
+
+        assert get_slugged_objects.call_count == 2
+
+
+def test_slug_index_falls_back_to_the_db_until_loaded(load_slugs):
+    index = SlugIndex(
+        session_factory=Mock, data_version_tracker=FakeDataVersionTracker()
+    )
+    index._start_initial_load = Mock()
+
+    with patch("app.service.slug_index.get_slugged_objects") as get_slugged_objects:
+        get_slugged_objects.return_value = (None, "CCLW.family.1.0")
+        assert resolve_family_or_document_slug(Mock(), "fam-slug", ["CCLW"], index) == (
+            None,
+            "CCLW.family.1.0",
+        )
+
+    index._start_initial_load.assert_called_once()
+    load_slugs.assert_not_called()
+
+
+def test_slug_index_only_reloads_when_the_data_version_changes(load_slugs):
+    load_slugs.return_value = [FAMILY_SLUG]
+    index = _make_loaded_index()
+
+    index._snapshot.refresh()
+
+    assert load_slugs.call_count == 1
+
+
+def test_slug_index_is_not_trusted_once_the_data_version_changes(load_slugs):
+    data_version_tracker = FakeDataVersionTracker()
+    load_slugs.return_value = [FAMILY_SLUG]
+    index = _make_loaded_index(data_version_tracker)
+
+    # The family moved out of the corpus. Until the index is reloaded, lookups
+    # go to the DB rather than using the old corpora.
+    data_version_tracker.version = "2"
+    load_slugs.return_value = [MOVED_FAMILY_SLUG]
+    assert index.lookup("fam-slug") is None
+
+    index._snapshot.mark_stale()
+    assert index.lookup("fam-slug") == SlugTarget(
+        family_document_import_id=None,
+        family_import_id="CCLW.family.1.0",
+        collection_import_id=None,
+        corpus_import_ids=frozenset(["UNFCCC"]),
+    )
+
+
+def test_slug_index_is_not_trusted_without_a_data_version(load_slugs):
+    data_version_tracker = FakeDataVersionTracker()
+    load_slugs.return_value = [FAMILY_SLUG]
+    index = _make_loaded_index(data_version_tracker)
+
+    data_version_tracker.version = None
+
+    assert index.lookup("fam-slug") is None
@@ -0,0 +1,60 @@
+from unittest.mock import Mock, patch
+
+import pytest
+
+from app.models.geography import GeographyStatsDTO
+from app.service.world_map import WorldMapStatsCache
+
+
+def _stats(count: int) -> list[GeographyStatsDTO]:
+    return [
+        GeographyStatsDTO(
+            display_name="India",
+            iso_code="IND",
+            slug="india",
+            family_counts={"EXECUTIVE": count},
+        )
+    ]
+
+
+@pytest.fixture
+def load_stats():
+    with patch(
+        "app.service.world_map.count_families_per_category_in_each_geo"
+    ) as load_stats:
+        yield load_stats
+
+
+def test_world_map_stats_cache_loads_each_corpora_set_once(load_stats):
+    load_stats.side_effect = lambda db, corpora: _stats(len(corpora))
+    cache = WorldMapStatsCache(session_factory=Mock, version_provider=lambda: "v1")
+
+    assert cache.get(["a", "b"]) == _stats(2)
+    assert cache.get(["b", "a"]) == _stats(2)
+    assert cache.get(["a"]) == _stats(1)
+    assert load_stats.call_count == 2
+
+
+def test_world_map_stats_cache_refreshes_on_new_ingest_cycle(load_stats):
+    load_stats.side_effect = [_stats(1), _stats(2)]
+    cache = WorldMapStatsCache(
+        session_factory=Mock,
+        version_provider=Mock(side_effect=["v1", "v2"]),
+        run_in_background=lambda refresh: refresh(),
+    )
+
+    assert cache.get(["a"]) == _stats(1)
+    assert cache.get(["a"]) == _stats(2)
+    assert load_stats.call_count == 2
+
+
+def test_world_map_stats_cache_serves_stats_when_version_unknown(load_stats):
+    load_stats.return_value = _stats(1)
+    cache = WorldMapStatsCache(
+        session_factory=Mock,
+        version_provider=Mock(side_effect=Exception("S3 down")),
+    )
+
+    assert cache.get(["a"]) == _stats(1)
+    assert cache.get(["a"]) == _stats(1)
+    assert load_stats.call_count == 1
@@ -1,5 +1,9 @@
+from contextlib import contextmanager
+from typing import Generator
+
 from db_client.models import Base
-from sqlalchemy.orm import class_mapper
+from sqlalchemy import event
+from sqlalchemy.orm import Session, class_mapper
 
 _AnyModel = Base
 
@@ -10,3 +14,23 @@ def json_serialize(model: _AnyModel):
     columns = [c.key for c in class_mapper(model.__class__).columns]
     # then we return their values in a dict
     return dict((c, getattr(model, c)) for c in columns)
+
+
+@contextmanager
+def count_statements(db: Session) -> Generator[list[str], None, None]:
+    """Records the SQL statements executed on the session's connection.
+
+    Use `len()` on the yielded list to assert how many round trips a piece
+    of code makes to the database.
+    """
+    statements: list[str] = []
+    bind = db.get_bind()
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(bind, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(bind, "before_cursor_execute", _record)